@@ -50,8 +50,10 @@ from abjad.mathtools import Ratio
 
 # timespan classes and expression factory
 from abjad.timespans import AnnotatedTimespan
+from abjad.timespans import IndexedTimespanList
 from abjad.timespans import Timespan
 from abjad.timespans import timespan
+from abjad.timespans import TimespanArray
 from abjad.timespans import TimespanList
 
 # import version information
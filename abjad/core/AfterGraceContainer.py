@@ -156,12 +156,16 @@ class AfterGraceContainer(Container):
             raise TypeError(f"must attach to leaf (not {leaf!r}).")
         leaf._after_grace_container = self
         self._main_leaf = leaf
+        self._invalidate_parentages()
+        leaf._update_later(offsets=True)
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._after_grace_container = None
             self._main_leaf = None
+            self._invalidate_parentages()
+            main_leaf._update_later(offsets=True)
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -208,12 +208,22 @@ class BeforeGraceContainer(Container):
             raise TypeError(f"must attach to leaf {leaf!r}.")
         leaf._before_grace_container = self
         self._main_leaf = leaf
+        self._invalidate_parentages()
+        leaf._update_later(offsets=True)
+        previous = leaf._sibling(-1)
+        if previous is not None:
+            previous._update_after_grace_later()
 
     def _detach(self):
         if self._main_leaf is not None:
             main_leaf = self._main_leaf
             main_leaf._before_grace_container = None
             self._main_leaf = None
+            self._invalidate_parentages()
+            main_leaf._update_later(offsets=True)
+            previous = main_leaf._sibling(-1)
+            if previous is not None:
+                previous._update_after_grace_later()
         return self
 
     def _format_open_brackets_slot(self, bundle):
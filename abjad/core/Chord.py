@@ -121,7 +121,7 @@ class Chord(Leaf):
                 is_forced = None
             if not is_parenthesized:
                 is_parenthesized = None
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or written_pitch not in drums:
                 note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -301,6 +301,7 @@ class Chord(Leaf):
         if isinstance(note_heads, str):
             note_heads = note_heads.split()
         self.note_heads.extend(note_heads)
+        self._mark_modified()
 
     @property
     def written_duration(self) -> Duration:
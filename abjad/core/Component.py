@@ -6,7 +6,29 @@ import typing
 import uqbar.graphs
 
 from abjad import enums, exceptions, mathtools
+from abjad.indicators.BarLine import BarLine
+from abjad.indicators.BeamCount import BeamCount
+from abjad.indicators.BowContactPoint import BowContactPoint
+from abjad.indicators.BowMotionTechnique import BowMotionTechnique
+from abjad.indicators.BowPressure import BowPressure
+from abjad.indicators.Clef import Clef
+from abjad.indicators.KeyCluster import KeyCluster
+from abjad.indicators.LilyPondComment import LilyPondComment
+from abjad.indicators.Mode import Mode
+from abjad.indicators.Ottava import Ottava
+from abjad.indicators.Repeat import Repeat
 from abjad.indicators.StaffChange import StaffChange
+from abjad.indicators.StemTremolo import StemTremolo
+from abjad.indicators.StopBeam import StopBeam
+from abjad.indicators.StopGroup import StopGroup
+from abjad.indicators.StopHairpin import StopHairpin
+from abjad.indicators.StopPhrasingSlur import StopPhrasingSlur
+from abjad.indicators.StopSlur import StopSlur
+from abjad.indicators.StopTextSpan import StopTextSpan
+from abjad.indicators.StopTrillSpan import StopTrillSpan
+from abjad.indicators.StringContactPoint import StringContactPoint
+from abjad.indicators.TimeSignature import TimeSignature
+from abjad.indicators.WoodwindFingering import WoodwindFingering
 from abjad.markups import Markup
 from abjad.system.FormatSpecification import FormatSpecification
 from abjad.system.LilyPondFormatManager import LilyPondFormatManager
@@ -32,36 +54,75 @@ class Component(object):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_format_bundle",
         "_indicators_are_current",
         "_is_forbidden_to_update",
         "_overrides",
         "_lilypond_setting_name_manager",
         "_measure_number",
+        "_measure_start_offsets",
+        "_modification_count",
         "_offsets_are_current",
         "_offsets_in_seconds_are_current",
         "_parent",
+        "_parentage_cache",
         "_start_offset",
         "_start_offset_in_seconds",
         "_stop_offset",
         "_stop_offset_in_seconds",
         "_tag",
         "_timespan",
+        "_wellformedness_cache",
+        "_wellformedness_is_current",
         "_wrappers",
     )
 
+    _immutable_indicator_classes = (
+        BarLine,
+        BeamCount,
+        BowContactPoint,
+        BowMotionTechnique,
+        BowPressure,
+        Clef,
+        KeyCluster,
+        LilyPondComment,
+        Mode,
+        Ottava,
+        Repeat,
+        StemTremolo,
+        StopBeam,
+        StopGroup,
+        StopHairpin,
+        StopPhrasingSlur,
+        StopSlur,
+        StopTextSpan,
+        StopTrillSpan,
+        StringContactPoint,
+        TimeSignature,
+        WoodwindFingering,
+    )
+
     _is_abstract = True
 
+    _modification_counter = 0
+
+    _parentage_generation = 0
+
     ### INITIALIZER ###
 
     @abc.abstractmethod
     def __init__(self, name: str = None, tag: Tag = None) -> None:
+        self._format_bundle = None
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
         self._measure_number = None
+        self._measure_start_offsets = None
+        self._modification_count = 0
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._overrides = None
         self._parent = None
+        self._parentage_cache = None
         self._lilypond_setting_name_manager = None
         self._start_offset = None
         self._start_offset_in_seconds = None
@@ -71,6 +132,8 @@ class Component(object):
             assert isinstance(tag, Tag), repr(tag)
         self._tag = tag
         self._timespan = Timespan()
+        self._wellformedness_cache = None
+        self._wellformedness_is_current = False
         self._wrappers: typing.List[Wrapper] = []
 
     ### SPECIAL METHODS ###
@@ -79,7 +142,7 @@ class Component(object):
         """
         Shallow copies component.
 
-        Copies indicators.
+        Copies indicators; shares immutable indicators.
 
         Does not copy spanners.
 
@@ -94,12 +157,7 @@ class Component(object):
         if getattr(self, "_lilypond_setting_name_manager", None) is not None:
             manager = copy.copy(setting(self))
             new_component._lilypond_setting_name_manager = manager
-        for wrapper in inspect(self).annotation_wrappers():
-            new_wrapper = copy.copy(wrapper)
-            attach(new_wrapper, new_component)
-        for wrapper in inspect(self).wrappers():
-            new_wrapper = copy.copy(wrapper)
-            attach(new_wrapper, new_component)
+        self._copy_wrappers(new_component)
         return new_component
 
     def __format__(self, format_specification="") -> str:
@@ -201,6 +259,41 @@ class Component(object):
                 return True
         return False
 
+    def _copy_wrappers(self, component):
+        """
+        Binds copies of wrappers of component to ``component``.
+
+        Binds wrappers directly, without the duplicate-indicator checks of
+        ``attach()``: wrappers copied from one component can not duplicate
+        each other. Shares instances of immutable indicator classes; copies
+        all other indicators.
+        """
+        wrappers = [_ for _ in self._wrappers if _.annotation]
+        wrappers.extend(_ for _ in self._wrappers if not _.annotation)
+        for wrapper in wrappers:
+            indicator = wrapper.indicator
+            if type(indicator) not in self._immutable_indicator_classes:
+                indicator = copy.copy(indicator)
+            new_wrapper = Wrapper(
+                annotation=wrapper.annotation,
+                context=wrapper.context,
+                deactivate=wrapper.deactivate,
+                indicator=indicator,
+                synthetic_offset=wrapper.synthetic_offset,
+                tag=wrapper.tag,
+            )
+            new_wrapper._component = component
+            component._wrappers.append(new_wrapper)
+            if new_wrapper.context is not None:
+                new_wrapper._update_effective_context()
+                LilyPondFormatManager._invalidate_bundle_caches()
+            if getattr(indicator, "_mutates_offsets_in_seconds", False):
+                component._update_later(offsets_in_seconds=True)
+            if getattr(indicator, "_mutates_measure_numbers", False):
+                component._update_later(measure_numbers=True)
+        if wrappers:
+            component._mark_modified()
+
     def _extract(self, scale_contents=False):
         if scale_contents:
             self._scale_contents(self.multiplier)
@@ -326,6 +419,7 @@ class Component(object):
         from .Voice import Voice
 
         self._update_now(indicators=True)
+        start_offset = None
         candidate_wrappers = {}
         parentage = inspect(self).parentage()
         enclosing_voice_name = None
@@ -340,18 +434,9 @@ class Component(object):
                     enclosing_voice_name = component.name or id(component)
             local_wrappers = []
             for wrapper in component._wrappers:
-                if wrapper.annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
-                    append_wrapper = True
-                    if command is not None and wrapper.indicator.command != command:
-                        continue
-                    if attributes is not None:
-                        for name, value in attributes.items():
-                            if getattr(wrapper.indicator, name, None) != value:
-                                append_wrapper = False
-                    if not append_wrapper:
-                        continue
+                if self._is_effective_candidate(
+                    wrapper, prototype, attributes=attributes, command=command
+                ):
                     local_wrappers.append(wrapper)
             # active indicator takes precendence over inactive indicator
             if any(_.deactivate is True for _ in local_wrappers) and not all(
@@ -363,25 +448,20 @@ class Component(object):
                 candidate_wrappers.setdefault(offset, []).append(wrapper)
             if not isinstance(component, Context):
                 continue
-            for wrapper in component._dependent_wrappers:
-                if wrapper.annotation:
-                    continue
-                if isinstance(wrapper.indicator, prototype):
-                    append_wrapper = True
-                    if command is not None and wrapper.indicator.command != command:
-                        continue
-                    if attributes is not None:
-                        for name, value in attributes.items():
-                            if getattr(wrapper.indicator, name, None) != value:
-                                append_wrapper = False
-                    if not append_wrapper:
-                        continue
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(wrapper)
+            if not component._dependent_wrappers:
+                continue
+            if start_offset is None:
+                start_offset = inspect(self).timespan().start_offset
+            dependent_wrappers = component._get_dependent_wrappers_near(
+                prototype, start_offset, attributes=attributes, command=command, n=n
+            )
+            for offset, wrappers in dependent_wrappers.items():
+                candidate_wrappers.setdefault(offset, []).extend(wrappers)
         if not candidate_wrappers:
             return
+        if start_offset is None:
+            start_offset = inspect(self).timespan().start_offset
         all_offsets = sorted(candidate_wrappers)
-        start_offset = inspect(self).timespan().start_offset
         index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
         if index < 0:
             return
@@ -644,6 +724,67 @@ class Component(object):
                 break
         return component in successors
 
+    @staticmethod
+    def _indent_lines(string, depth):
+        indent = LilyPondFormatManager.indent * depth
+        for line in string.split("\n"):
+            if not line or line.isspace():
+                yield ""
+            else:
+                yield indent + line
+
+    @staticmethod
+    def _invalidate_parentages():
+        """
+        Invalidates parentage cached on every component.
+
+        Called whenever parent, grace container main leaf, name or implied
+        prolation of any component changes.
+        """
+        Component._parentage_generation += 1
+
+    @staticmethod
+    def _is_effective_candidate(wrapper, prototype, *, attributes=None, command=None):
+        if wrapper.annotation:
+            return False
+        if not isinstance(wrapper.indicator, prototype):
+            return False
+        if command is not None and wrapper.indicator.command != command:
+            return False
+        if attributes is not None:
+            for name, value in attributes.items():
+                if getattr(wrapper.indicator, name, None) != value:
+                    return False
+        return True
+
+    def _iterate_lilypond_format(self, depth=0):
+        """
+        Iterates LilyPond format lines indented ``depth`` levels.
+
+        Lines joined with newlines equal ``format(self, "lilypond")`` when
+        ``depth`` is zero. Whitespace-only lines come out empty.
+        """
+        string = self._get_lilypond_format()
+        yield from self._indent_lines(string, depth)
+
+    def _mark_modified(self):
+        """
+        Marks component modified.
+
+        Invalidates format bundles cached on component and on its
+        descendants; invalidates wellformedness results cached for component
+        and for its parents.
+        """
+        Component._modification_counter += 1
+        self._modification_count = Component._modification_counter
+        component = self
+        while component is not None:
+            component._wellformedness_is_current = False
+            parent = getattr(component, "_main_leaf", None)
+            if parent is None:
+                parent = getattr(component, "_parent", None)
+            component = parent
+
     def _move_indicators(self, recipient_component):
         for wrapper in inspect(self).wrappers():
             detach(wrapper, self)
@@ -659,9 +800,11 @@ class Component(object):
             for wrapper in component._dependent_wrappers[:]:
                 if wrapper.component is self:
                     component._dependent_wrappers.remove(wrapper)
+                    component._effective_indicator_index = None
         if self._parent is not None:
             self._parent._components.remove(self)
         self._parent = None
+        self._invalidate_parentages()
 
     def _remove_named_children_from_parentage(self, name_dictionary):
         if self._parent is not None and name_dictionary:
@@ -691,8 +834,10 @@ class Component(object):
         self._remove_named_children_from_parentage(named_children)
         self._remove_from_parent()
         self._parent = new_parent
+        self._invalidate_parentages()
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
+        self._update_descendants_later()
 
     def _sibling(self, n):
         assert n in (-1, 0, 1), repr(n)
@@ -706,13 +851,51 @@ class Component(object):
     def _tag_strings(self, strings):
         return LilyPondFormatManager.tag(strings, tag=self.tag)
 
-    def _update_later(self, offsets=False, offsets_in_seconds=False):
-        assert offsets or offsets_in_seconds
+    def _update_descendants_later(self):
+        """
+        Marks offsets of component and of every descendant stale.
+
+        Needed whenever prolation of descendants may change.
+        """
+        components = [self]
+        while components:
+            component = components.pop()
+            component._offsets_are_current = False
+            component._wellformedness_is_current = False
+            components.extend(getattr(component, "_components", ()))
+
+    def _update_after_grace_later(self):
+        """
+        Marks offsets of after grace music that ends component stale.
+
+        After grace music is displaced by before grace music of the next
+        leaf; needed whenever the leaf that follows component may change.
+        """
+        for component in self._get_descendants_stopping_with():
+            container = getattr(component, "_after_grace_container", None)
+            if container is not None:
+                container._offsets_are_current = False
+                component._update_later(offsets=True)
+
+    def _update_later(
+        self, offsets=False, offsets_in_seconds=False, measure_numbers=False
+    ):
+        assert offsets or offsets_in_seconds or measure_numbers
+        if offsets:
+            LilyPondFormatManager._invalidate_bundle_caches()
         for component in inspect(self).parentage():
             if offsets:
                 component._offsets_are_current = False
+                component._measure_start_offsets = None
+                component._wellformedness_is_current = False
             elif offsets_in_seconds:
                 component._offsets_in_seconds_are_current = False
+            elif measure_numbers:
+                component._measure_start_offsets = None
+
+    def _update_measure_number(self):
+        update_manager = UpdateManager()
+        update_manager._update_measure_number(self)
 
     def _update_measure_numbers(self):
         update_manager = UpdateManager()
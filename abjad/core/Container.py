@@ -13,6 +13,7 @@ from abjad.top.mutate import mutate
 from abjad.top.parse import parse
 from abjad.top.select import select
 from abjad.utilities.Duration import Duration
+from abjad.utilities.Offset import Offset
 
 from .Component import Component
 from .Leaf import Leaf
@@ -303,7 +304,12 @@ class Container(Component):
         components = self[i]
         if not isinstance(components, Selection):
             components = select([components])
+        previous = None
+        if components:
+            previous = components[0]._sibling(-1)
         components._set_parents(None)
+        if previous is not None:
+            previous._update_after_grace_later()
 
     def __getitem__(self, argument) -> typing.Union[Component, Selection]:
         """
@@ -449,13 +455,76 @@ class Container(Component):
         return node
 
     def _copy_with_children(self):
+        """
+        Copies container and descendants of container.
+
+        Links copied children to copied parents directly, top-down, and
+        updates effective contexts of copied wrappers once tree is complete.
+        Copies offsets when offsets of container are current and container
+        is neither scaled by enclosing tuplets nor inside grace music.
+        """
+        from .AfterGraceContainer import AfterGraceContainer
+        from .BeforeGraceContainer import BeforeGraceContainer
+        from .OnBeatGraceContainer import OnBeatGraceContainer
+
+        prototype = (AfterGraceContainer, BeforeGraceContainer, OnBeatGraceContainer)
         new_container = self.__copy__()
-        for component in self:
-            if isinstance(component, Container):
-                new_component = component._copy_with_children()
-            else:
+        stack = [(self, new_container)]
+        while stack:
+            container, new_parent = stack.pop()
+            for component in container._components:
                 new_component = component.__copy__()
-            new_container.append(new_component)
+                new_component._parent = new_parent
+                new_parent._components.append(new_component)
+                name = getattr(new_component, "_name", None)
+                if name is not None:
+                    parent = new_parent
+                    while parent is not None:
+                        named_children = parent._named_children
+                        named_children.setdefault(name, []).append(new_component)
+                        parent = parent._parent
+                if isinstance(component, Container):
+                    stack.append((component, new_component))
+        Component._invalidate_parentages()
+        copy_offsets = self._start_offset is not None
+        copy_offsets = copy_offsets and self._start_offset.displacement is None
+        parentage = inspect(self).parentage()
+        if parentage.parent is not None:
+            if inspect(parentage.parent).parentage().prolation != 1:
+                copy_offsets = False
+        for component in parentage:
+            if not component._offsets_are_current:
+                copy_offsets = False
+            if isinstance(component, prototype):
+                copy_offsets = False
+        components = iterate(self).components()
+        new_components = iterate(new_container).components()
+        pairs = list(zip(components, new_components))
+        for component, new_component in pairs:
+            for wrapper in new_component._wrappers:
+                if wrapper.context is not None:
+                    wrapper._update_effective_context()
+            if not component._offsets_are_current:
+                copy_offsets = False
+        if not copy_offsets:
+            return new_container
+        for component, new_component in pairs:
+            start_offset = component._start_offset
+            stop_offset = component._stop_offset
+            if self._start_offset != 0:
+                start_offset = Offset(
+                    start_offset - self._start_offset,
+                    displacement=start_offset.displacement,
+                )
+                stop_offset = Offset(
+                    stop_offset - self._start_offset,
+                    displacement=stop_offset.displacement,
+                )
+            new_component._start_offset = start_offset
+            new_component._stop_offset = stop_offset
+            new_component._timespan._start_offset = start_offset
+            new_component._timespan._stop_offset = stop_offset
+            new_component._offsets_are_current = True
         return new_container
 
     def _eject_contents(self):
@@ -508,13 +577,8 @@ class Container(Component):
         indent = LilyPondFormatManager.indent
         strings = []
         for component in self.components:
-            string = component.__format__(format_specification="lilypond")
-            for string in string.split("\n"):
-                if string.isspace():
-                    string = ""
-                else:
-                    string = indent + string
-                strings.append(string)
+            for string in component._iterate_lilypond_format():
+                strings.append(indent + string)
         return strings
 
     def _format_contents_slot(self, bundle):
@@ -735,6 +799,61 @@ class Container(Component):
 
         return recurse(self)
 
+    def _iterate_format_pieces(self, depth=None):
+        """
+        Iterates format pieces.
+
+        Yields the same pieces as ``_format_component(pieces=True)`` when
+        ``depth`` is none. Otherwise yields lines indented ``depth`` levels,
+        as ``_iterate_lilypond_format()`` does.
+
+        Formats children one line at a time in either case.
+        """
+        bundle = LilyPondFormatManager.bundle_format_contributions(self)
+        opening_slots = (
+            self._format_absolute_before_slot,
+            self._format_before_slot,
+            self._format_open_brackets_slot,
+            self._format_opening_slot,
+        )
+        closing_slots = (
+            self._format_closing_slot,
+            self._format_close_brackets_slot,
+            self._format_after_slot,
+            self._format_absolute_after_slot,
+        )
+        for method in opening_slots:
+            for contributor, contributions in method(bundle):
+                if depth is None:
+                    yield from contributions
+                else:
+                    for string in contributions:
+                        yield from self._indent_lines(string, depth)
+        indent = LilyPondFormatManager.indent
+        for component in self.components:
+            if depth is None:
+                for string in component._iterate_lilypond_format():
+                    yield indent + string
+            else:
+                yield from component._iterate_lilypond_format(depth=depth + 1)
+        for method in closing_slots:
+            for contributor, contributions in method(bundle):
+                if depth is None:
+                    yield from contributions
+                else:
+                    for string in contributions:
+                        yield from self._indent_lines(string, depth)
+
+    def _iterate_lilypond_format(self, depth=0):
+        """
+        Iterates LilyPond format lines indented ``depth`` levels.
+
+        Formats children directly at ``depth + 1`` so that no intermediate
+        string is built for any child.
+        """
+        self._update_now(indicators=True)
+        yield from self._iterate_format_pieces(depth=depth)
+
     def _iterate_top_down(self):
         def recurse(node):
             yield node
@@ -761,9 +880,10 @@ class Container(Component):
 
         user_input = string.strip()
         if user_input.startswith("abj:"):
-            parser = ReducedLyParser()
-            parsed = parser(user_input[4:])
-            if parser._toplevel_component_count == 1:
+            with ReducedLyParser._get_pooled_parser() as parser:
+                parsed = parser(user_input[4:])
+                count = parser._toplevel_component_count
+            if count == 1:
                 parent = inspect(parsed).parentage().parent
                 if parent is None:
                     parsed = Container([parsed])
@@ -834,6 +954,10 @@ class Container(Component):
         self._components.__setitem__(slice(start, start), argument)
         for component in argument:
             component._set_parent(self)
+        if argument:
+            previous = argument[0]._sibling(-1)
+            if previous is not None:
+                previous._update_after_grace_later()
         for indicator in argument_indicators:
             if hasattr(indicator, "_update_effective_context"):
                 indicator._update_effective_context()
@@ -1187,6 +1311,9 @@ class Container(Component):
                 else:
                     named_children[argument].append(self)
         self._name = argument
+        self._invalidate_parentages()
+        if argument != old_name:
+            self._mark_modified()
 
     ### PUBLIC METHODS ###
 
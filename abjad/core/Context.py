@@ -1,3 +1,4 @@
+import bisect
 import copy
 import typing
 
@@ -42,6 +43,7 @@ class Context(Container):
         "_lilypond_type",
         "_consists_commands",
         "_dependent_wrappers",
+        "_effective_indicator_index",
         "_remove_commands",
     )
 
@@ -82,6 +84,7 @@ class Context(Container):
     ) -> None:
         self._consists_commands: typing.List[str] = []
         self._dependent_wrappers: typing.List[Wrapper] = []
+        self._effective_indicator_index: typing.Optional[typing.Dict] = None
         self._remove_commands: typing.List[str] = []
         self.lilypond_type = lilypond_type
         Container.__init__(
@@ -230,6 +233,73 @@ class Context(Container):
             result.append(string)
         return result
 
+    def _get_dependent_wrappers_near(
+        self, prototype, offset, *, attributes=None, command=None, n=0
+    ):
+        """
+        Gets dependent wrappers near ``offset``.
+
+        Gets wrappers at the ``abs(n) + 1`` nearest start offsets at or
+        before ``offset`` and at the ``abs(n) + 1`` nearest start offsets
+        after ``offset``. This is always enough for ``_get_effective()`` to
+        locate the ``n``-th effective indicator.
+
+        Returns dictionary of offset-wrapper list pairs. Wrappers at each
+        offset appear in dependent wrapper order.
+        """
+        count = abs(int(n)) + 1
+        entries: typing.Dict = {}
+        index = self._get_effective_indicator_index()
+        for class_, (offsets, offset_to_entries) in index.items():
+            if not issubclass(class_, prototype):
+                continue
+            i = bisect.bisect(offsets, offset)
+            for range_ in (range(i - 1, -1, -1), range(i, len(offsets))):
+                found = 0
+                for j in range_:
+                    offset_entries = [
+                        _
+                        for _ in offset_to_entries[offsets[j]]
+                        if self._is_effective_candidate(
+                            _[1], prototype, attributes=attributes, command=command
+                        )
+                    ]
+                    if not offset_entries:
+                        continue
+                    entries.setdefault(offsets[j], []).extend(offset_entries)
+                    found += 1
+                    if found == count:
+                        break
+        result = {}
+        for offset_, offset_entries in entries.items():
+            offset_entries.sort(key=lambda _: _[0])
+            result[offset_] = [_[1] for _ in offset_entries]
+        return result
+
+    def _get_effective_indicator_index(self):
+        """
+        Gets effective indicator index.
+
+        Groups dependent wrappers first by indicator class and then by start
+        offset. Start offsets of each indicator class are kept sorted for
+        bisection.
+
+        Built lazily; discarded whenever dependent wrappers change and
+        whenever offsets of context change.
+        """
+        if self._effective_indicator_index is None:
+            index: typing.Dict = {}
+            for position, wrapper in enumerate(self._dependent_wrappers):
+                if wrapper.annotation:
+                    continue
+                offset_to_entries = index.setdefault(type(wrapper.indicator), {})
+                entries = offset_to_entries.setdefault(wrapper.start_offset, [])
+                entries.append((position, wrapper))
+            for class_, offset_to_entries in index.items():
+                index[class_] = (sorted(offset_to_entries), offset_to_entries)
+            self._effective_indicator_index = index
+        return self._effective_indicator_index
+
     def _get_format_pieces(self):
         return self._format_component(pieces=True)
 
@@ -328,6 +398,7 @@ class Context(Container):
         else:
             argument = str(argument)
         self._lilypond_type = argument
+        self._mark_modified()
 
     @property
     def lilypond_context(self):
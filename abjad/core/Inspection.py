@@ -3244,7 +3244,7 @@ class Inspection(object):
         """
         if not isinstance(self.client, Component):
             raise Exception("can only get measure number on component.")
-        self.client._update_measure_numbers()
+        self.client._update_measure_number()
         assert isinstance(self.client._measure_number, int)
         return self.client._measure_number
 
@@ -3734,11 +3734,13 @@ class Inspection(object):
         Tabulates wellformedness.
         """
         manager = Wellformedness()
-        triples = manager(self.client)
+        check_names = []
+        for check_name in sorted(_ for _ in dir(manager) if _.startswith("check_")):
+            if eval(check_name) is True:
+                check_names.append(check_name)
+        triples = manager(self.client, check_names=check_names)
         strings = []
         for violators, total, check_name in triples:
-            if eval(check_name) is not True:
-                continue
             violator_count = len(violators)
             check_name = check_name.replace("check_", "")
             check_name = check_name.replace("_", " ")
@@ -3935,9 +3937,13 @@ class Inspection(object):
         Is true when client is wellformed.
         """
         manager = Wellformedness()
-        for violators, total, check_name in manager(self.client):
-            if eval(check_name) is not True:
-                continue
+        check_names = []
+        for check_name in sorted(_ for _ in dir(manager) if _.startswith("check_")):
+            if eval(check_name) is True:
+                check_names.append(check_name)
+        for violators, total, check_name in manager(
+            self.client, check_names=check_names
+        ):
             if violators:
                 return False
         return True
@@ -77,108 +77,93 @@ class Iteration(object):
         grace=None,
         reverse=None,
     ):
+        """
+        Iterates components depth-first with an explicit stack.
+
+        Stack frames are (kind, item, exclude, is_grace) tuples: kind 0
+        visits component ``item``; kind 1 only tests component ``item``
+        for output; kind 2 iterates children from iterator ``item``.
+        Children iterators are consumed lazily, just like nested ``for``
+        loops.
+
+        Grace status propagates from parent to child; only the client
+        calls ``Inspection.grace()``.
+        """
+        from .AfterGraceContainer import AfterGraceContainer
+        from .BeforeGraceContainer import BeforeGraceContainer
         from .Component import Component
         from .Leaf import Leaf
+        from .OnBeatGraceContainer import OnBeatGraceContainer
 
-        argument = client
         prototype = prototype or Component
-        before_grace_container = None
-        after_grace_container = None
         exclude = Iteration._coerce_exclude(exclude)
-        assert isinstance(exclude, tuple), repr(exclude)
-        if grace is not False and isinstance(argument, Leaf):
-            inspection = inspect(argument)
-            before_grace_container = inspection.before_grace_container()
-            after_grace_container = inspection.after_grace_container()
-        if not reverse:
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and before_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    before_grace_container,
-                    prototype,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, prototype):
-                if (
-                    grace is None
-                    or (grace is True and inspect(argument).grace())
-                    or (grace is False and not inspect(argument).grace())
-                ):
-                    if not Iteration._should_exclude(argument, exclude):
-                        yield argument
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and after_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    after_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, collections.abc.Iterable):
-                for item in argument:
-                    yield from Iteration._iterate_components(
-                        item,
-                        prototype,
-                        exclude=exclude,
-                        do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                        grace=grace,
-                        reverse=reverse,
-                    )
-        else:
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and after_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    after_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, prototype):
-                if (
-                    grace is None
-                    or (grace is True and inspect(argument).grace())
-                    or (grace is False and not inspect(argument).grace())
-                ):
-                    if not Iteration._should_exclude(argument, exclude):
-                        yield argument
-            if (
-                not do_not_iterate_grace_containers
-                and grace is not False
-                and before_grace_container
-            ):
-                yield from Iteration._iterate_components(
-                    before_grace_container,
-                    prototype,
-                    exclude=exclude,
-                    do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                    grace=grace,
-                    reverse=reverse,
-                )
-            if isinstance(argument, collections.abc.Iterable):
-                for item in reversed(argument):
-                    yield from Iteration._iterate_components(
-                        item,
-                        prototype,
-                        exclude=exclude,
-                        do_not_iterate_grace_containers=do_not_iterate_grace_containers,
-                        grace=grace,
-                        reverse=reverse,
-                    )
+        grace_prototype = (
+            AfterGraceContainer,
+            BeforeGraceContainer,
+            OnBeatGraceContainer,
+        )
+        iterate_grace_containers = (
+            not do_not_iterate_grace_containers and grace is not False
+        )
+        iterable = collections.abc.Iterable
+
+        def should_yield(component, exclude, is_grace):
+            if not isinstance(component, prototype):
+                return False
+            if grace is not None:
+                if is_grace is None:
+                    is_grace = inspect(component).grace()
+                if grace is not is_grace:
+                    return False
+            if exclude and Iteration._should_exclude(component, exclude):
+                return False
+            return True
+
+        stack = [(0, client, exclude, None)]
+        while stack:
+            kind, item, exclude, is_grace = stack[-1]
+            if kind == 2:
+                component = next(item, None)
+                if component is None:
+                    stack.pop()
+                    continue
+                if grace is not None and not is_grace:
+                    is_grace = isinstance(component, grace_prototype)
+            else:
+                stack.pop()
+                component = item
+                if kind == 1:
+                    if should_yield(component, exclude, is_grace):
+                        yield component
+                    continue
+            if is_grace is None and grace is not None:
+                if isinstance(component, Component):
+                    is_grace = inspect(component).grace()
+            before_grace_container = after_grace_container = None
+            if iterate_grace_containers and isinstance(component, Leaf):
+                before_grace_container = component._before_grace_container
+                after_grace_container = component._after_grace_container
+            if not reverse:
+                if isinstance(component, iterable):
+                    stack.append((2, iter(component), exclude, is_grace))
+                if after_grace_container is not None:
+                    stack.append((0, after_grace_container, exclude, True))
+                if before_grace_container is not None:
+                    stack.append((1, component, exclude, is_grace))
+                    # exclude does not apply to before-grace music:
+                    stack.append((0, before_grace_container, (), True))
+                elif should_yield(component, exclude, is_grace):
+                    yield component
+            else:
+                if isinstance(component, iterable):
+                    stack.append((2, reversed(component), exclude, is_grace))
+                if before_grace_container is not None:
+                    stack.append((0, before_grace_container, exclude, True))
+                if after_grace_container is not None:
+                    stack.append((1, component, exclude, is_grace))
+                    stack.append((0, after_grace_container, exclude, True))
+                elif should_yield(component, exclude, is_grace):
+                    yield component
 
     @staticmethod
     def _should_exclude(argument, exclude):
@@ -3897,7 +3897,9 @@ class Label(object):
             prototype = prototype()
         assert isinstance(prototype, SetClass), repr(prototype)
         for selection in self._client:
-            pitch_class_set = PitchClassSet.from_selection(selection)
+            pitch_class_set = PitchClassSet.from_selection(
+                selection, item_class=NumberedPitchClass
+            )
             if not pitch_class_set:
                 continue
             set_class = SetClass.from_pitch_class_set(
@@ -115,6 +115,7 @@ class Leaf(Component):
         return node
 
     def _copy_override_and_set_from_leaf(self, leaf):
+        self._mark_modified()
         if getattr(leaf, "_overrides", None) is not None:
             self._overrides = copy.copy(override(leaf))
         if getattr(leaf, "_lilypond_setting_name_manager", None) is not None:
@@ -523,6 +524,7 @@ class Leaf(Component):
         else:
             multiplier = Multiplier(argument)
         self._multiplier = multiplier
+        self._update_later(offsets=True)
 
     @property
     def written_duration(self) -> Duration:
@@ -538,3 +540,4 @@ class Leaf(Component):
             message = f"not assignable duration: {duration!r}."
             raise exceptions.AssignabilityError(message)
         self._written_duration = duration
+        self._update_later(offsets=True)
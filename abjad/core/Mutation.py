@@ -775,6 +775,7 @@ class Mutation(object):
             context = wrapper._find_correct_effective_context()
             if context is not None:
                 context._dependent_wrappers.append(wrapper)
+                context._effective_indicator_index = None
 
     def rewrite_meter(
         self,
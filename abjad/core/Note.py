@@ -100,7 +100,7 @@ class Note(Leaf):
             raise ValueError("can not initialize note from {arguments!r}.")
         Leaf.__init__(self, written_duration, multiplier=multiplier, tag=tag)
         if written_pitch is not None:
-            if written_pitch not in drums:
+            if not isinstance(written_pitch, str) or written_pitch not in drums:
                 self.note_head = NoteHead(
                     written_pitch=written_pitch,
                     is_cautionary=is_cautionary,
@@ -200,10 +200,12 @@ class Note(Leaf):
         if isinstance(argument, type(None)):
             self._note_head = None
         elif isinstance(argument, NoteHead):
+            argument._client = self
             self._note_head = argument
         else:
             note_head = NoteHead(client=self, written_pitch=argument)
             self._note_head = note_head
+        self._mark_modified()
 
     @property
     def written_duration(self) -> Duration:
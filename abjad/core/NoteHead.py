@@ -552,3 +552,5 @@ class NoteHead(object):
         self._written_pitch = written_pitch
         if self.alternative is not None:
             self.alternative[0].written_pitch = written_pitch
+        if self.client is not None:
+            self.client._mark_modified()
@@ -77,23 +77,7 @@ class Parentage(collections.abc.Sequence):
     def __init__(self, component=None):
         assert isinstance(component, (Component, type(None)))
         self._component = component
-        if component is None:
-            components = ()
-        else:
-            components = []
-            parent = component
-            prototype = (AfterGraceContainer, BeforeGraceContainer)
-            while parent is not None:
-                components.append(parent)
-                if isinstance(parent, prototype):
-                    if parent._main_leaf is not None:
-                        parent = parent._main_leaf._parent
-                    else:
-                        parent = None
-                else:
-                    parent = parent._parent
-            components = tuple(components)
-        self._components = components
+        self._components = self._get_cache(component)["components"]
 
     ### SPECIAL METHODS ###
 
@@ -105,6 +89,12 @@ class Parentage(collections.abc.Sequence):
         """
         return self.components.__getitem__(argument)
 
+    def __iter__(self) -> typing.Iterator[Component]:
+        """
+        Iterates components in parentage.
+        """
+        return iter(self._components)
+
     def __len__(self) -> int:
         """
         Gets number of components in parentage.
@@ -119,6 +109,42 @@ class Parentage(collections.abc.Sequence):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _get_cache(component):
+        """
+        Gets parentage cache of ``component``.
+
+        Parentage components, prolation and logical voice are cached on
+        ``component`` and discarded when the generation counter maintained
+        by ``Component._invalidate_parentages()`` changes.
+        """
+        generation = Component._parentage_generation
+        if component is not None:
+            cache = component._parentage_cache
+            if cache is not None and cache["generation"] == generation:
+                return cache
+        components = []
+        parent = component
+        prototype = (AfterGraceContainer, BeforeGraceContainer)
+        while parent is not None:
+            components.append(parent)
+            if isinstance(parent, prototype):
+                if parent._main_leaf is not None:
+                    parent = parent._main_leaf._parent
+                else:
+                    parent = None
+            else:
+                parent = parent._parent
+        cache = {
+            "components": tuple(components),
+            "generation": generation,
+            "logical_voice": None,
+            "prolation": None,
+        }
+        if component is not None:
+            component._parentage_cache = cache
+        return cache
+
     @staticmethod
     def _id_string(component):
         lhs = component.__class__.__name__
@@ -672,9 +698,14 @@ class Parentage(collections.abc.Sequence):
             Note("fs'16")                  Multiplier(2, 3)
 
         """
-        prolations = [Multiplier(1)] + self._prolations()
-        products = mathtools.cumulative_products(prolations)
-        return products[-1]
+        cache = self._get_cache(self.component)
+        prolation = cache["prolation"]
+        if prolation is None:
+            prolations = [Multiplier(1)] + self._prolations()
+            products = mathtools.cumulative_products(prolations)
+            prolation = products[-1]
+            cache["prolation"] = prolation
+        return prolation
 
     @property
     def root(self) -> Component:
@@ -1383,27 +1414,30 @@ class Parentage(collections.abc.Sequence):
                 )
 
         """
-        keys = ("score", "staff group", "staff", "voice")
-        logical_voice = collections.OrderedDict.fromkeys(keys, "")
-        for component in self:
-            if isinstance(component, Voice):
-                if not logical_voice["voice"]:
-                    logical_voice["voice"] = self._id_string(component)
-            elif isinstance(component, Staff):
-                if not logical_voice["staff"]:
-                    logical_voice["staff"] = self._id_string(component)
-                    # explicit staff demands a nested voice:
-                    # if no explicit voice has been found,
-                    # create implicit voice here with random integer
+        cache = self._get_cache(self.component)
+        if cache["logical_voice"] is None:
+            keys = ("score", "staff group", "staff", "voice")
+            logical_voice = collections.OrderedDict.fromkeys(keys, "")
+            for component in self:
+                if isinstance(component, Voice):
                     if not logical_voice["voice"]:
-                        logical_voice["voice"] = str(id(component))
-            elif isinstance(component, StaffGroup):
-                if not logical_voice["staff group"]:
-                    logical_voice["staff group"] = self._id_string(component)
-            elif isinstance(component, Score):
-                if not logical_voice["score"]:
-                    logical_voice["score"] = self._id_string(component)
-        logical_voice_ = OrderedDict(logical_voice)
+                        logical_voice["voice"] = self._id_string(component)
+                elif isinstance(component, Staff):
+                    if not logical_voice["staff"]:
+                        logical_voice["staff"] = self._id_string(component)
+                        # explicit staff demands a nested voice:
+                        # if no explicit voice has been found,
+                        # create implicit voice here with random integer
+                        if not logical_voice["voice"]:
+                            logical_voice["voice"] = str(id(component))
+                elif isinstance(component, StaffGroup):
+                    if not logical_voice["staff group"]:
+                        logical_voice["staff group"] = self._id_string(component)
+                elif isinstance(component, Score):
+                    if not logical_voice["score"]:
+                        logical_voice["score"] = self._id_string(component)
+            cache["logical_voice"] = logical_voice
+        logical_voice_ = OrderedDict(cache["logical_voice"])
         return logical_voice_
 
     def score_index(self) -> typing.Tuple[typing.Union[int, str], ...]:
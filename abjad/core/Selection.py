@@ -3919,12 +3919,11 @@ class Selection(collections.abc.Sequence):
 
         def _get_measure_number(argument):
             first_component = _get_first_component(argument)
+            first_component._update_measure_number()
             assert first_component._measure_number is not None
             return first_component._measure_number
 
         selections = []
-        first_component = _get_first_component(self)
-        first_component._update_measure_numbers()
         pairs = itertools.groupby(self, _get_measure_number)
         for value, group in pairs:
             selection = type(self)(group)
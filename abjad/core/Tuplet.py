@@ -747,6 +747,9 @@ class Tuplet(Container):
             raise ValueError(message)
         if 0 < rational:
             self._multiplier = rational
+            self._invalidate_parentages()
+            self._update_later(offsets=True)
+            self._update_descendants_later()
         else:
             message = f"tuplet multiplier must be positive: {argument!r}."
             raise ValueError(message)
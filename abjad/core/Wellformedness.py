@@ -11,13 +11,18 @@ from abjad.indicators.StopTextSpan import StopTextSpan
 from abjad.instruments import Instrument
 from abjad.system.StorageFormatManager import StorageFormatManager
 from abjad.system.Tags import Tags
+from abjad.system.WellformednessCache import WellformednessCache
 from abjad.top.inspect import inspect
 from abjad.top.iterate import iterate
 from abjad.utilities.Duration import Duration
 from abjad.utilities.Sequence import Sequence
 
+from .Chord import Chord
+from .Component import Component
 from .Container import Container
 from .Context import Context
+from .Leaf import Leaf
+from .Note import Note
 
 abjad_tags = Tags()
 
@@ -31,30 +36,82 @@ class Wellformedness(object):
         >>> abjad.Wellformedness()
         Wellformedness()
 
+    ..  container:: example
+
+        Visits score once to call all checks; set ``check_names`` to call
+        only some checks:
+
+        >>> staff = abjad.Staff("c'4 [ d'4 ] e'4 f'2")
+        >>> manager = abjad.Wellformedness()
+        >>> check_names = ["check_beamed_long_notes", "check_empty_containers"]
+        >>> for triple in manager(staff, check_names=check_names):
+        ...     triple
+        ([Note("c'4")], 4, 'check_beamed_long_notes')
+        ([], 1, 'check_empty_containers')
+
+    Each check registers the kind of component it visits together with the
+    indicators it looks for. Checks that look for effective indicators are
+    skipped when no such indicator attaches anywhere in score.
     """
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Collaborators"
 
+    _check_prototypes: typing.Dict[str, typing.Tuple] = {
+        "check_beamed_long_notes": (Leaf, (StartBeam, StopBeam)),
+        "check_duplicate_ids": (Component, None),
+        "check_empty_containers": (Container, None),
+        "check_missing_parents": (Component, None),
+        "check_notes_on_wrong_clef": (Leaf, (Clef, Instrument)),
+        "check_out_of_range_pitches": ((Chord, Note), Instrument),
+        "check_overlapping_text_spanners": (Context, None),
+        "check_unmatched_stop_text_spans": (Context, None),
+        "check_unterminated_hairpins": (Context, None),
+        "check_unterminated_text_spanners": (Context, None),
+    }
+
     _publish_storage_format = True
 
     ### SPECIAL METHODS ###
 
-    def __call__(self, argument=None):
+    def __call__(self, argument=None, check_names=None):
         """
-        Calls all wellformedness checks on ``argument``.
+        Calls wellformedness checks on ``argument``.
+
+        Calls all checks when ``check_names`` is none.
 
         Returns triples.
         """
         if argument is None:
             return
-        check_names = [_ for _ in dir(self) if _.startswith("check_")]
+        all_check_names = sorted(_ for _ in dir(self) if _.startswith("check_"))
+        if check_names is None:
+            check_names = all_check_names
+        else:
+            for check_name in check_names:
+                if check_name not in all_check_names:
+                    message = f"unknown wellformedness check: {check_name!r}."
+                    raise Exception(message)
+            check_names = [_ for _ in all_check_names if _ in check_names]
+        visited_check_names = [_ for _ in check_names if _ in self._check_prototypes]
+        results = None
+        if WellformednessCache._depth and self._is_score_root(argument):
+            results = self._call_checks_incrementally(argument)
+        else:
+            state = self._visit(argument, visited_check_names)
         triples = []
-        for current_check_name in sorted(check_names):
-            current_check = getattr(self, current_check_name)
-            current_violators, current_total = current_check(argument=argument)
-            triple = (current_violators, current_total, current_check_name)
+        for check_name in check_names:
+            if results is not None and check_name in results:
+                violators, total = results[check_name]
+                violators = list(violators)
+            elif check_name in self._check_prototypes:
+                check = getattr(self, "_" + check_name)
+                violators, total = check(state)
+            else:
+                check = getattr(self, check_name)
+                violators, total = check(argument=argument)
+            triple = (violators, total, check_name)
             triples.append(triple)
         return triples
 
@@ -66,19 +123,598 @@ class Wellformedness(object):
 
     ### PRIVATE METHODS ###
 
-    def _aggregate_context_wrappers(self, argument):
+    def _call_checks_incrementally(self, root):
+        """
+        Calls registered checks on score ``root``, reusing results cached on
+        ``root`` for containers that have not changed since last call.
+
+        Returns (violators, total) pairs keyed by check name.
+        """
+        cache = root._wellformedness_cache
+        if cache is not None and root._wellformedness_is_current:
+            return cache["results"]
+        root._update_now(offsets=True)
+        if cache is None:
+            cache = {
+                "context_results": {},
+                "entries": {},
+                "leaf_results": {},
+                "records": {},
+                "results": None,
+            }
+        changes: typing.Dict = {
+            "classes": set(),
+            "effective": False,
+            "leaves": [],
+            "names": set(),
+            "removed": [],
+            "seen": set(),
+        }
+        entry = self._update_cache_entry(root, cache, changes, False)
+        self._remove_cache_entries(cache, changes)
+        components = entry["components"]
+        if len(set(id(_) for _ in components)) < len(components):
+            root._wellformedness_cache = None
+            state = self._visit(root, list(self._check_prototypes))
+            results = {}
+            for check_name in self._check_prototypes:
+                check = getattr(self, "_" + check_name)
+                results[check_name] = check(state)
+            return results
+        state: typing.Dict = {
+            "allowable_clefs": {},
+            "indicator_classes": entry["classes"],
+            "instruments": {},
+            "pitch_range_results": {},
+        }
+        for prototype, _ in self._check_prototypes.values():
+            if prototype not in state:
+                state[prototype] = [_ for _ in components if isinstance(_, prototype)]
+        changed_leaves = set(id(_) for _ in changes["leaves"])
+        results = {}
+        for check_name, pair in self._check_prototypes.items():
+            prototype, indicator_prototype = pair
+            check = getattr(self, "_" + check_name)
+            if prototype is Context:
+                continue
+            if indicator_prototype is None:
+                results[check_name] = check(state)
+                continue
+            # rechecks only changed leaves unless indicators looked up changed:
+            leaves = state[prototype]
+            leaf_results = cache["leaf_results"].get(check_name)
+            if (
+                leaf_results is None
+                or changes["effective"]
+                or any(issubclass(_, indicator_prototype) for _ in changes["classes"])
+            ):
+                leaf_results, state_ = {}, state
+            else:
+                state_ = dict(state)
+                state_[prototype] = [_ for _ in leaves if id(_) in changed_leaves]
+            violators, total = check(state_)
+            violator_ids = set(id(_) for _ in violators)
+            for leaf in state_[prototype]:
+                leaf_results[id(leaf)] = id(leaf) in violator_ids
+            leaf_results = {id(_): leaf_results[id(_)] for _ in leaves}
+            cache["leaf_results"][check_name] = leaf_results
+            violators = [_ for _ in leaves if leaf_results[id(_)]]
+            results[check_name] = (violators, len(leaves))
+        # rechecks all contexts that share name with changed context:
+        name_to_contexts: typing.Dict = {}
+        for context in state[Context]:
+            if context.name not in name_to_contexts:
+                name_to_contexts[context.name] = []
+            name_to_contexts[context.name].append(context)
+        context_check_names = [
+            _ for _, pair in self._check_prototypes.items() if pair[0] is Context
+        ]
+        context_results = {}
+        for name, contexts in name_to_contexts.items():
+            if name in changes["names"] or name not in cache["context_results"]:
+                state_ = {Context: contexts}
+                context_results[name] = {}
+                for check_name in context_check_names:
+                    check = getattr(self, "_" + check_name)
+                    context_results[name][check_name] = check(state_)
+            else:
+                context_results[name] = cache["context_results"][name]
+        cache["context_results"] = context_results
+        for check_name in context_check_names:
+            violators, total = [], 0
+            for name in name_to_contexts:
+                violators_, total_ = context_results[name][check_name]
+                violators.extend(violators_)
+                total += total_
+            results[check_name] = (violators, total)
+        cache["results"] = results
+        root._wellformedness_cache = cache
+        return results
+
+    def _check_beamed_long_notes(self, state):
+        violators, total = [], 0
+        duration = Duration((1, 4))
+        leaves = state[Leaf]
+        if not self._has_indicator(state, StartBeam):
+            return violators, len(leaves)
+        for leaf in leaves:
+            total += 1
+            if leaf.written_duration < duration:
+                continue
+            start_wrapper = inspect(leaf).effective_wrapper(StartBeam)
+            if start_wrapper is None:
+                continue
+            stop_wrapper = inspect(leaf).effective_wrapper(StopBeam)
+            if stop_wrapper is None:
+                violators.append(leaf)
+                continue
+            if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
+                violators.append(leaf)
+                continue
+            leaf_start_offset = inspect(leaf).timespan().start_offset
+            if stop_wrapper.leaked_start_offset == leaf_start_offset:
+                violators.append(leaf)
+        return violators, total
+
+    def _check_duplicate_ids(self, state):
+        violators = []
+        components = state[Component]
+        total_ids = [id(_) for _ in components]
+        unique_ids = Sequence(total_ids).remove_repeats()
+        if len(unique_ids) < len(total_ids):
+            for current_id in unique_ids:
+                if 1 < total_ids.count(current_id):
+                    violators.extend([_ for _ in components if id(_) == current_id])
+        return violators, len(total_ids)
+
+    def _check_empty_containers(self, state):
+        violators, containers = [], set()
+        for container in state[Container]:
+            containers.add(container)
+            if len(container) == 0:
+                violators.append(container)
+        return violators, len(containers)
+
+    def _check_missing_parents(self, state):
+        violators, total = [], set()
+        for i, component in enumerate(state[Component]):
+            total.add(component)
+            if 0 < i:
+                parentage = inspect(component).parentage()
+                if parentage.parent is None:
+                    violators.append(component)
+        return violators, len(total)
+
+    def _check_notes_on_wrong_clef(self, state):
+        violators, total = [], set(state[Leaf])
+        if not self._has_indicator(state, Clef):
+            return violators, len(total)
+        if not self._has_indicator(state, Instrument):
+            return violators, len(total)
+        for leaf in state[Leaf]:
+            instrument = self._get_effective_instrument(state, leaf)
+            if instrument is None:
+                continue
+            clef = inspect(leaf).effective(Clef)
+            if clef is None:
+                continue
+            key = (id(clef), id(instrument))
+            if key not in state["allowable_clefs"]:
+                allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
+                allowable_clefs.append(Clef("percussion"))
+                state["allowable_clefs"][key] = clef in allowable_clefs
+            if not state["allowable_clefs"][key]:
+                violators.append(leaf)
+        return violators, len(total)
+
+    def _check_out_of_range_pitches(self, state):
+        violators, total = [], set(state[(Chord, Note)])
+        if not self._has_indicator(state, Instrument):
+            return violators, len(total)
+        for leaf in state[(Chord, Note)]:
+            if leaf._wrappers:
+                if inspect(leaf).has_indicator(const.ALLOW_OUT_OF_RANGE):
+                    continue
+                if inspect(leaf).has_indicator(const.HIDDEN):
+                    continue
+            instrument = self._get_effective_instrument(state, leaf)
+            if instrument is None:
+                continue
+            # sounding pitch depends on string indicators attached to leaf:
+            if any(isinstance(_.indicator, str) for _ in leaf._wrappers):
+                if leaf not in instrument.pitch_range:
+                    violators.append(leaf)
+                continue
+            if isinstance(leaf, Note):
+                pitches = [leaf.written_pitch]
+            else:
+                pitches = leaf.written_pitches
+            names = tuple((_.name, _.arrow) for _ in pitches)
+            key = (id(instrument), type(leaf), names)
+            if key not in state["pitch_range_results"]:
+                state["pitch_range_results"][key] = leaf in instrument.pitch_range
+            if not state["pitch_range_results"][key]:
+                violators.append(leaf)
+        return violators, len(total)
+
+    def _check_overlapping_text_spanners(self, state):
+        violators, total = [], 0
+
+        def key(pair):
+            if isinstance(pair[1].indicator, StartTextSpan):
+                priority = 1
+            else:
+                priority = 0
+            return (pair[0], priority)
+
+        for name, pairs in self._get_text_span_wrappers(state).items():
+            pairs = sorted(pairs, key=key)
+            open_spanners: typing.Dict = {}
+            for offset, wrapper in pairs:
+                if isinstance(wrapper.indicator, StartTextSpan):
+                    total += 1
+                    command = self._get_text_span_command(wrapper)
+                    if command not in open_spanners:
+                        open_spanners[command] = []
+                    if open_spanners[command]:
+                        violators.append(wrapper.component)
+                    open_spanners[command].append(wrapper.component)
+                else:
+                    command = self._get_text_span_command(wrapper)
+                    if command in open_spanners and open_spanners[command]:
+                        open_spanners[command].pop()
+        return violators, total
+
+    def _check_unmatched_stop_text_spans(self, state):
+        violators, total = [], 0
+        for name, pairs in self._get_text_span_wrappers(state).items():
+            open_spanners: typing.Dict = {}
+            for offset, wrapper in pairs:
+                if isinstance(wrapper.indicator, StartTextSpan):
+                    total += 1
+                    command = self._get_text_span_command(wrapper)
+                    if command not in open_spanners:
+                        open_spanners[command] = []
+                    open_spanners[command].append(wrapper.component)
+                else:
+                    command = self._get_text_span_command(wrapper)
+                    if command not in open_spanners or not open_spanners[command]:
+                        violators.append(wrapper.component)
+                    else:
+                        open_spanners[command].pop()
+        return violators, total
+
+    def _check_unterminated_hairpins(self, state):
+        violators, total = [], 0
+        for name, wrappers in self._get_context_wrappers(state).items():
+            last_dynamic = None
+            last_tag = None
+            pairs = []
+            for wrapper in wrappers:
+                parameter = getattr(wrapper.indicator, "parameter", None)
+                if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
+                    pairs.append((wrapper.leaked_start_offset, wrapper))
+                    if isinstance(wrapper.indicator, StartHairpin):
+                        total += 1
+            if pairs:
+                pairs.sort(key=lambda _: _[0])
+                last_dynamic = pairs[-1][1].indicator
+                last_tag = pairs[-1][1].tag
+            if isinstance(last_dynamic, StartHairpin) and str(
+                abjad_tags.RIGHT_BROKEN
+            ) not in str(last_tag):
+                # reports last wrapper of context, whatever its indicator:
+                offsets = [_.leaked_start_offset for _ in wrappers]
+                index = len(offsets) - 1 - offsets[::-1].index(max(offsets))
+                violators.append(wrappers[index].component)
+        return violators, total
+
+    def _check_unterminated_text_spanners(self, state):
+        violators, total = [], 0
+        for name, pairs in self._get_text_span_wrappers(state).items():
+            open_spanners: typing.Dict = {}
+            for offset, wrapper in pairs:
+                if isinstance(wrapper.indicator, StartTextSpan):
+                    total += 1
+                    command = self._get_text_span_command(wrapper)
+                    if command not in open_spanners:
+                        open_spanners[command] = []
+                    open_spanners[command].append(wrapper.component)
+                else:
+                    command = self._get_text_span_command(wrapper)
+                    if command in open_spanners and open_spanners[command]:
+                        open_spanners[command].pop()
+            for command, list_ in open_spanners.items():
+                for component in list_:
+                    violators.append(component)
+        return violators, total
+
+    def _get_context_wrappers(self, state):
         """
         Special_Voice may contain other instances of Special_Voice.
         This currently happens with OnBeatGraceContainer.
         This method aggregates all Special_Voice wrappers for checks.
         """
-        name_to_wrappers: typing.Dict = {}
-        for context in iterate(argument).components(Context):
-            if context.name not in name_to_wrappers:
-                name_to_wrappers[context.name] = []
-            wrappers = context._dependent_wrappers[:]
-            name_to_wrappers[context.name].extend(wrappers)
-        return name_to_wrappers
+        if "context_wrappers" not in state:
+            name_to_wrappers: typing.Dict = {}
+            for context in state[Context]:
+                context._update_now(indicators=True)
+                if context.name not in name_to_wrappers:
+                    name_to_wrappers[context.name] = []
+                wrappers = context._dependent_wrappers[:]
+                name_to_wrappers[context.name].extend(wrappers)
+            state["context_wrappers"] = name_to_wrappers
+        return state["context_wrappers"]
+
+    def _get_effective_instrument(self, state, leaf):
+        instruments = state["instruments"]
+        if leaf not in instruments:
+            instruments[leaf] = inspect(leaf).effective(Instrument)
+        return instruments[leaf]
+
+    @staticmethod
+    def _get_text_span_command(wrapper):
+        command = wrapper.indicator.command
+        if isinstance(wrapper.indicator, StartTextSpan):
+            command = command.replace("start", "")
+            command = command.replace("Start", "")
+        else:
+            command = command.replace("stop", "")
+            command = command.replace("Stop", "")
+        return command
+
+    def _get_text_span_wrappers(self, state):
+        """
+        Gets (offset, wrapper) pairs of start- and stop-text-spans in each
+        context, sorted by leaked start offset.
+        """
+        if "text_span_wrappers" not in state:
+            prototype = (StartTextSpan, StopTextSpan)
+            name_to_pairs = {}
+            for name, wrappers in self._get_context_wrappers(state).items():
+                pairs = [
+                    (_.leaked_start_offset, _)
+                    for _ in wrappers
+                    if isinstance(_.indicator, prototype)
+                ]
+                pairs.sort(key=lambda _: _[0])
+                name_to_pairs[name] = pairs
+            state["text_span_wrappers"] = name_to_pairs
+        return state["text_span_wrappers"]
+
+    @staticmethod
+    def _has_indicator(state, prototype):
+        indicator_classes = state["indicator_classes"]
+        if indicator_classes is None:
+            return True
+        return any(issubclass(_, prototype) for _ in indicator_classes)
+
+    @staticmethod
+    def _is_score_root(argument):
+        if not isinstance(argument, Component):
+            return False
+        if argument._is_forbidden_to_update:
+            return False
+        return inspect(argument).parentage().parent is None
+
+    @staticmethod
+    def _is_same(sequence_1, sequence_2):
+        if len(sequence_1) != len(sequence_2):
+            return False
+        return all(_ is sequence_2[i] for i, _ in enumerate(sequence_1))
+
+    @staticmethod
+    def _remove_cache_entries(cache, changes):
+        """
+        Removes cache entries of components no longer in score.
+        """
+        components = list(changes["removed"])
+        while components:
+            component = components.pop()
+            if id(component) in changes["seen"]:
+                continue
+            if isinstance(component, Leaf):
+                record = cache["records"].get(id(component))
+                if record is not None and record["component"] is component:
+                    del cache["records"][id(component)]
+                    changes["classes"].update(record["classes"])
+                continue
+            entry = cache["entries"].get(id(component))
+            if entry is not None and entry["component"] is component:
+                del cache["entries"][id(component)]
+                changes["classes"].update(entry["classes"])
+                changes["names"].update(entry["names"])
+                components.extend(entry["children"])
+                components.extend(entry["leaves"])
+
+    def _update_cache_entry(self, container, cache, changes, moved):
+        """
+        Updates cache entry of ``container`` and of changed containers in
+        ``container``.
+
+        Reuses entry of unchanged container that has neither moved nor
+        shifted in time. Otherwise visits children of container and adds
+        changed leaves, indicator classes and context names to
+        ``changes``.
+
+        Returns entry.
+        """
+        entry = cache["entries"].get(id(container))
+        if entry is not None and entry["component"] is not container:
+            entry = None
+        changes["seen"].add(id(container))
+        parent = (container._parent, getattr(container, "_main_leaf", None))
+        offsets = (container._start_offset, container._stop_offset)
+        if (
+            entry is not None
+            and not moved
+            and container._wellformedness_is_current
+            and self._is_same(entry["parent"], parent)
+            and entry["offsets"] == offsets
+        ):
+            return entry
+        if entry is None or not self._is_same(entry["parent"], parent):
+            moved = True
+        if entry is not None and entry["offsets"] != offsets:
+            if container._wellformedness_is_current:
+                moved = True
+        wrappers = tuple(container._wrappers)
+        deactivates = tuple(_.deactivate for _ in wrappers)
+        own_classes = set(type(_.indicator) for _ in wrappers)
+        if (
+            moved
+            or entry["offsets"] != offsets
+            or not self._is_same(entry["wrappers"], wrappers)
+            or entry["deactivates"] != deactivates
+        ):
+            changes["classes"].update(own_classes)
+            if entry is not None:
+                changes["classes"].update(entry["own_classes"])
+        name = None
+        if isinstance(container, Context):
+            name = (container.name, container.lilypond_type)
+            changes["names"].add(container.name)
+            if entry is not None and entry["name"] != name:
+                changes["effective"] = True
+                changes["names"].add(entry["name"][0])
+        components, children, leaves = [container], [], []
+        classes, names = set(own_classes), set()
+        if name is not None:
+            names.add(container.name)
+        for component in container._components:
+            if isinstance(component, Leaf):
+                record = self._update_cache_record(component, cache, changes, moved)
+                graces = (
+                    component._before_grace_container,
+                    component,
+                    component._after_grace_container,
+                )
+                for grace in graces:
+                    if grace is component:
+                        components.append(component)
+                        classes.update(record["classes"])
+                        leaves.append(component)
+                    elif grace is not None:
+                        entry_ = self._update_cache_entry(grace, cache, changes, moved)
+                        components.extend(entry_["components"])
+                        classes.update(entry_["classes"])
+                        names.update(entry_["names"])
+                        children.append(grace)
+            else:
+                entry_ = self._update_cache_entry(component, cache, changes, moved)
+                components.extend(entry_["components"])
+                classes.update(entry_["classes"])
+                names.update(entry_["names"])
+                children.append(component)
+        if entry is not None:
+            ids = set(id(_) for _ in children + leaves)
+            for component in entry["children"] + entry["leaves"]:
+                if id(component) not in ids:
+                    changes["removed"].append(component)
+        entry = {
+            "children": children,
+            "classes": classes,
+            "component": container,
+            "components": components,
+            "deactivates": deactivates,
+            "leaves": leaves,
+            "name": name,
+            "names": names,
+            "offsets": offsets,
+            "own_classes": own_classes,
+            "parent": parent,
+            "wrappers": wrappers,
+        }
+        cache["entries"][id(container)] = entry
+        container._wellformedness_is_current = True
+        return entry
+
+    def _update_cache_record(self, leaf, cache, changes, moved):
+        """
+        Updates cache record of ``leaf``.
+
+        Adds changed leaf to ``changes``, together with indicator classes of
+        leaf when indicators of leaf have changed or moved in time.
+
+        Returns record.
+        """
+        record = cache["records"].get(id(leaf))
+        if record is not None and record["component"] is not leaf:
+            record = None
+        changes["seen"].add(id(leaf))
+        offsets = (leaf._start_offset, leaf._stop_offset)
+        if (
+            record is not None
+            and not moved
+            and record["modification_count"] == leaf._modification_count
+            and record["parent"] is leaf._parent
+            and record["offsets"] == offsets
+            and record["written_duration"] == leaf.written_duration
+        ):
+            return record
+        wrappers = tuple(leaf._wrappers)
+        deactivates = tuple(_.deactivate for _ in wrappers)
+        classes = set(type(_.indicator) for _ in wrappers)
+        changes["leaves"].append(leaf)
+        if (
+            record is None
+            or moved
+            or record["parent"] is not leaf._parent
+            or record["offsets"] != offsets
+            or not self._is_same(record["wrappers"], wrappers)
+            or record["deactivates"] != deactivates
+        ):
+            changes["classes"].update(classes)
+            if record is not None:
+                changes["classes"].update(record["classes"])
+        record = {
+            "classes": classes,
+            "component": leaf,
+            "deactivates": deactivates,
+            "modification_count": leaf._modification_count,
+            "offsets": offsets,
+            "parent": leaf._parent,
+            "wrappers": wrappers,
+            "written_duration": leaf.written_duration,
+        }
+        cache["records"][id(leaf)] = record
+        return record
+
+    def _visit(self, argument, check_names):
+        """
+        Iterates ``argument`` once and collects the components each check
+        registers.
+
+        Collects classes of indicators attached anywhere in score when
+        ``argument`` is score root; effective indicators can not attach
+        outside score.
+        """
+        state: typing.Dict = {
+            "allowable_clefs": {},
+            "instruments": {},
+            "pitch_range_results": {},
+        }
+        prototypes = []
+        for check_name in check_names:
+            prototype = self._check_prototypes[check_name][0]
+            if prototype not in state:
+                prototypes.append(prototype)
+                state[prototype] = []
+        indicator_classes: typing.Optional[typing.Set] = None
+        if isinstance(argument, Component):
+            if inspect(argument).parentage().parent is None:
+                indicator_classes = set()
+        if not any(self._check_prototypes[_][1] for _ in check_names):
+            indicator_classes = None
+        for component in iterate(argument).components():
+            for prototype in prototypes:
+                if isinstance(component, prototype):
+                    state[prototype].append(component)
+            if indicator_classes is not None:
+                for wrapper in component._wrappers:
+                    indicator_classes.add(type(wrapper.indicator))
+        state["indicator_classes"] = indicator_classes
+        return state
 
     ### PUBLIC METHODS ###
 
@@ -193,39 +829,15 @@ class Wellformedness(object):
         The examples above feature Abjad voice containers because beams are
         voice-persistent.
         """
-        violators, total = [], 0
-        for leaf in iterate(argument).leaves():
-            total += 1
-            if leaf.written_duration < Duration((1, 4)):
-                continue
-            start_wrapper = inspect(leaf).effective_wrapper(StartBeam)
-            if start_wrapper is None:
-                continue
-            stop_wrapper = inspect(leaf).effective_wrapper(StopBeam)
-            if stop_wrapper is None:
-                violators.append(leaf)
-                continue
-            if stop_wrapper.leaked_start_offset < start_wrapper.leaked_start_offset:
-                violators.append(leaf)
-                continue
-            leaf_start_offset = inspect(leaf).timespan().start_offset
-            if stop_wrapper.leaked_start_offset == leaf_start_offset:
-                violators.append(leaf)
-        return violators, total
+        state = self._visit(argument, ["check_beamed_long_notes"])
+        return self._check_beamed_long_notes(state)
 
     def check_duplicate_ids(self, argument=None) -> typing.Tuple[typing.List, int]:
         """
         Checks duplicate IDs.
         """
-        violators = []
-        components = iterate(argument).components()
-        total_ids = [id(_) for _ in components]
-        unique_ids = Sequence(total_ids).remove_repeats()
-        if len(unique_ids) < len(total_ids):
-            for current_id in unique_ids:
-                if 1 < total_ids.count(current_id):
-                    violators.extend([_ for _ in components if id(_) == current_id])
-        return violators, len(total_ids)
+        state = self._visit(argument, ["check_duplicate_ids"])
+        return self._check_duplicate_ids(state)
 
     def check_empty_containers(self, argument=None) -> typing.Tuple[typing.List, int]:
         r"""
@@ -253,26 +865,15 @@ class Wellformedness(object):
             [Container()]
 
         """
-        violators, containers = [], set()
-        for container in iterate(argument).components(Container):
-            containers.add(container)
-            if len(container) == 0:
-                violators.append(container)
-        return violators, len(containers)
+        state = self._visit(argument, ["check_empty_containers"])
+        return self._check_empty_containers(state)
 
     def check_missing_parents(self, argument=None) -> typing.Tuple[typing.List, int]:
         """
         Checks missing parents.
         """
-        violators, total = [], set()
-        components = iterate(argument).components()
-        for i, component in enumerate(components):
-            total.add(component)
-            if 0 < i:
-                parentage = inspect(component).parentage()
-                if parentage.parent is None:
-                    violators.append(component)
-        return violators, len(total)
+        state = self._visit(argument, ["check_missing_parents"])
+        return self._check_missing_parents(state)
 
     def check_notes_on_wrong_clef(
         self, argument=None
@@ -351,20 +952,8 @@ class Wellformedness(object):
             0 /	0 unterminated text spanners
 
         """
-        violators, total = [], set()
-        for leaf in iterate(argument).leaves():
-            total.add(leaf)
-            instrument = inspect(leaf).effective(Instrument)
-            if instrument is None:
-                continue
-            clef = inspect(leaf).effective(Clef)
-            if clef is None:
-                continue
-            allowable_clefs = [Clef(_) for _ in instrument.allowable_clefs]
-            allowable_clefs.append(Clef("percussion"))
-            if clef not in allowable_clefs:
-                violators.append(leaf)
-        return violators, len(total)
+        state = self._visit(argument, ["check_notes_on_wrong_clef"])
+        return self._check_notes_on_wrong_clef(state)
 
     def check_out_of_range_pitches(
         self, argument=None
@@ -440,19 +1029,8 @@ class Wellformedness(object):
             0 /	0 unterminated text spanners
 
         """
-        violators, total = [], set()
-        for leaf in iterate(argument).leaves(pitched=True):
-            total.add(leaf)
-            if inspect(leaf).has_indicator(const.ALLOW_OUT_OF_RANGE):
-                continue
-            if inspect(leaf).has_indicator(const.HIDDEN):
-                continue
-            instrument = inspect(leaf).effective(Instrument)
-            if instrument is None:
-                continue
-            if leaf not in instrument.pitch_range:
-                violators.append(leaf)
-        return violators, len(total)
+        state = self._visit(argument, ["check_out_of_range_pitches"])
+        return self._check_out_of_range_pitches(state)
 
     def check_overlapping_text_spanners(
         self, argument=None
@@ -606,37 +1184,8 @@ class Wellformedness(object):
             0 /	2 unterminated text spanners
 
         """
-        violators, total = [], 0
-
-        def key(wrapper):
-            if isinstance(wrapper.indicator, StartTextSpan):
-                priority = 1
-            else:
-                priority = 0
-            return (wrapper.leaked_start_offset, priority)
-
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=key)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    if open_spanners[command]:
-                        violators.append(wrapper.component)
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command in open_spanners and open_spanners[command]:
-                        open_spanners[command].pop()
-        return violators, total
+        state = self._visit(argument, ["check_overlapping_text_spanners"])
+        return self._check_overlapping_text_spanners(state)
 
     def check_unmatched_stop_text_spans(
         self, argument=None
@@ -700,29 +1249,8 @@ class Wellformedness(object):
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command not in open_spanners or not open_spanners[command]:
-                        violators.append(wrapper.component)
-                    else:
-                        open_spanners[command].pop()
-        return violators, total
+        state = self._visit(argument, ["check_unmatched_stop_text_spans"])
+        return self._check_unmatched_stop_text_spans(state)
 
     def check_unterminated_hairpins(
         self, argument=None
@@ -844,24 +1372,8 @@ class Wellformedness(object):
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            last_dynamic = None
-            last_tag = None
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            for wrapper in wrappers:
-                parameter = getattr(wrapper.indicator, "parameter", None)
-                if parameter == "DYNAMIC" or isinstance(wrapper.indicator, StopHairpin):
-                    last_dynamic = wrapper.indicator
-                    last_tag = wrapper.tag
-                    if isinstance(wrapper.indicator, StartHairpin):
-                        total += 1
-            if isinstance(last_dynamic, StartHairpin) and str(
-                abjad_tags.RIGHT_BROKEN
-            ) not in str(last_tag):
-                violators.append(wrapper.component)
-        return violators, total
+        state = self._visit(argument, ["check_unterminated_hairpins"])
+        return self._check_unterminated_hairpins(state)
 
     def check_unterminated_text_spanners(
         self, argument=None
@@ -925,30 +1437,5 @@ class Wellformedness(object):
             True
 
         """
-        violators, total = [], 0
-        name_to_wrappers = self._aggregate_context_wrappers(argument)
-        for name, wrappers in name_to_wrappers.items():
-            wrappers.sort(key=lambda _: _.leaked_start_offset)
-            open_spanners: typing.Dict = {}
-            for wrapper in wrappers:
-                if isinstance(wrapper.indicator, StartTextSpan):
-                    total += 1
-                    command = wrapper.indicator.command
-                    command = command.replace("start", "")
-                    command = command.replace("Start", "")
-                    if command not in open_spanners:
-                        open_spanners[command] = []
-                    open_spanners[command].append(wrapper.component)
-                elif isinstance(wrapper.indicator, StopTextSpan):
-                    command = wrapper.indicator.command
-                    command = command.replace("stop", "")
-                    command = command.replace("Stop", "")
-                    if command not in open_spanners or not open_spanners[command]:
-                        # unmatched stop text span
-                        pass
-                    else:
-                        open_spanners[command].pop()
-            for command, list_ in open_spanners.items():
-                for component in list_:
-                    violators.append(component)
-        return violators, total
+        state = self._visit(argument, ["check_unterminated_text_spanners"])
+        return self._check_unterminated_text_spanners(state)
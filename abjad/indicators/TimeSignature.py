@@ -124,6 +124,8 @@ class TimeSignature(object):
 
     _format_slot = "opening"
 
+    _mutates_measure_numbers = True
+
     _persistent = True
 
     ### INITIALIZER ###
@@ -11,7 +11,7 @@ from uqbar.graphs import Grapher
 
 import abjad
 from abjad.lilypondfile import Block
-from abjad.system import AbjadConfiguration, IOManager, Timer
+from abjad.system import AbjadConfiguration, IOManager, RenderCache, Timer
 
 _configuration = AbjadConfiguration()
 
@@ -58,7 +58,7 @@ class LilyPondIO:
             self.copy_stylesheets(render_directory)
         render_command = self.get_render_command(input_path, lilypond_path)
         with Timer() as render_timer:
-            log, success = self.run_command(render_command)
+            log, success = self.render(string, render_command, input_path)
         render_time = render_timer.elapsed_time
         if self.should_persist_log:
             self.persist_log(log, input_path.with_suffix(".log"))
@@ -148,6 +148,22 @@ class LilyPondIO:
     def persist_string(self, string, input_path):
         input_path.write_text(string)
 
+    def render(self, string, render_command, input_path):
+        cache = RenderCache()
+        flags = " ".join(self.flags)
+        key = cache.get_key(string, flags=flags, directory=str(input_path.parent))
+        prefix = str(input_path.with_suffix(""))
+        if key is not None:
+            paths = cache.restore(key, prefix)
+            log_path = input_path.with_suffix(".log")
+            if str(log_path) in paths:
+                return log_path.read_text(), True
+        log, success = self.run_command(render_command)
+        if success and key is not None:
+            since = input_path.stat().st_mtime
+            cache.store(key, prefix, since=since, log=log)
+        return log, success
+
     def run_command(self, command):
         completed_process = subprocess.run(
             command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
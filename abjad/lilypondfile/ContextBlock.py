@@ -62,40 +62,39 @@ class ContextBlock(Block):
 
     ### PRIVATE METHODS ###
 
-    def _get_format_pieces(self, tag=None):
+    def _iterate_format_pieces(self, tag=None):
         indent = LilyPondFormatManager.indent
-        result = []
         string = f"{self._escaped_name} {{"
-        result.append(string)
+        yield string
         manager = LilyPondFormatManager
         # CAUTION: source context name must come before type_ to allow
         # context redefinition.
         if self.source_lilypond_type is not None:
             string = indent + rf"\{self.source_lilypond_type}"
-            result.append(string)
+            yield string
         if self.name is not None:
             string = indent + rf"\name {self.name}"
-            result.append(string)
+            yield string
         if self.type_ is not None:
             string = indent + rf"\type {self.type_}"
-            result.append(string)
+            yield string
         if self.alias is not None:
             string = indent + rf"\alias {self.alias}"
-            result.append(string)
+            yield string
         for statement in self.remove_commands:
             string = indent + rf"\remove {statement}"
-            result.append(string)
+            yield string
         # CAUTION: LilyPond \consists statements are order-significant!
         for statement in self.consists_commands:
             string = indent + rf"\consists {statement}"
-            result.append(string)
+            yield string
         for statement in self.accepts_commands:
             string = indent + rf"\accepts {statement}"
-            result.append(string)
+            yield string
         overrides = override(self)._list_format_contributions("override")
         for statement in overrides:
             string = indent + statement
-            result.append(string)
+            yield string
         setting_contributions = []
         for key, value in setting(self)._get_attribute_tuples():
             setting_contribution = manager.format_lilypond_context_setting_in_with_block(
@@ -104,22 +103,21 @@ class ContextBlock(Block):
             setting_contributions.append(setting_contribution)
         for setting_contribution in sorted(setting_contributions):
             string = indent + setting_contribution
-            result.append(string)
+            yield string
         for item in self.items:
             if isinstance(item, str):
                 string = indent + f"{item}"
-                result.append(string)
+                yield string
             elif "_get_format_pieces" in dir(item):
                 for piece in item._get_format_pieces():
                     if piece.isspace():
                         piece = ""
                     else:
                         piece = indent + piece
-                    result.append(piece)
+                    yield piece
             else:
                 pass
-        result.append("}")
-        return result
+        yield "}"
 
     ### PUBLIC PROPERTIES ###
 
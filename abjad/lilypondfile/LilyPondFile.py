@@ -474,6 +474,32 @@ class LilyPondFile(object):
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self, tag=None):
+        result = self._get_formatted_preamble()
+        result.extend(self._get_formatted_blocks())
+        return result
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        return FormatSpecification(client=self)
+
+    def _get_formatted_blocks(self):
+        result = []
+        tag = Tag("abjad.LilyPondFile._get_formatted_blocks()")
+        tag = self.get_tag(tag)
+        for item in self.items:
+            if "_get_lilypond_format" in dir(item) and not isinstance(item, str):
+                try:
+                    string = item._get_lilypond_format(tag=tag)
+                except TypeError:
+                    string = item._get_lilypond_format()
+                if string:
+                    result.append(string)
+            else:
+                result.append(str(item))
+        return result
+
+    def _get_formatted_preamble(self):
         result = []
         if self.date_time_token is not None:
             string = f"% {self.date_time_token}"
@@ -498,28 +524,6 @@ class LilyPondFile(object):
         postincludes.extend(self._get_formatted_includes())
         postincludes.extend(self._get_formatted_scheme_settings())
         result.extend(postincludes)
-        result.extend(self._get_formatted_blocks())
-        return result
-
-    ### PRIVATE METHODS ###
-
-    def _get_format_specification(self):
-        return FormatSpecification(client=self)
-
-    def _get_formatted_blocks(self):
-        result = []
-        tag = Tag("abjad.LilyPondFile._get_formatted_blocks()")
-        tag = self.get_tag(tag)
-        for item in self.items:
-            if "_get_lilypond_format" in dir(item) and not isinstance(item, str):
-                try:
-                    string = item._get_lilypond_format(tag=tag)
-                except TypeError:
-                    string = item._get_lilypond_format()
-                if string:
-                    result.append(string)
-            else:
-                result.append(str(item))
         return result
 
     def _get_formatted_comments(self):
@@ -577,7 +581,43 @@ class LilyPondFile(object):
         return result
 
     def _get_lilypond_format(self):
-        return "\n\n".join(self._get_format_pieces())
+        return "\n".join(self._iterate_lilypond_format())
+
+    def _iterate_lilypond_format(self):
+        """
+        Iterates LilyPond format strings.
+
+        Strings joined with newlines equal ``format(self, "lilypond")``.
+        Blocks yield one piece at a time; components in blocks format one
+        line at a time.
+        """
+        needs_separator = False
+        for string in self._get_formatted_preamble():
+            if needs_separator:
+                yield ""
+            yield string
+            needs_separator = True
+        tag = Tag("abjad.LilyPondFile._get_formatted_blocks()")
+        tag = self.get_tag(tag)
+        for item in self.items:
+            if isinstance(item, Block):
+                pieces = item._iterate_format_pieces(tag=tag)
+            elif "_get_lilypond_format" in dir(item) and not isinstance(item, str):
+                try:
+                    string = item._get_lilypond_format(tag=tag)
+                except TypeError:
+                    string = item._get_lilypond_format()
+                pieces = iter([string] if string else [])
+            else:
+                pieces = iter([str(item)])
+            piece = next(pieces, None)
+            if piece is None:
+                continue
+            if needs_separator:
+                yield ""
+            yield piece
+            yield from pieces
+            needs_separator = True
 
     @staticmethod
     def _make_global_context_block(font_size=3, minimum_distance=10, padding=4):
@@ -91,7 +91,7 @@ class LilyPondGrobNameManager(LilyPondNameManager):
         Sets attribute ``attribute`` of grob name manager to ``value``.
         """
         # make sure attribute name is valid grob name before setting value
-        object.__setattr__(self, attribute, value)
+        LilyPondNameManager.__setattr__(self, attribute, value)
 
     ### PRIVATE METHODS ###
 
@@ -1,5 +1,7 @@
 import copy
 
+from abjad.system.LilyPondFormatManager import LilyPondFormatManager
+
 
 class LilyPondNameManager(object):
     """
@@ -10,6 +12,15 @@ class LilyPondNameManager(object):
 
     ### SPECIAL METHODS ###
 
+    def __delattr__(self, name) -> None:
+        """
+        Deletes attribute ``name``.
+
+        Invalidates cached format bundles.
+        """
+        LilyPondFormatManager._invalidate_bundle_caches()
+        object.__delattr__(self, name)
+
     def __eq__(self, argument) -> bool:
         """
         Is true when ``argument`` is a LilyPond name manager with attribute
@@ -52,6 +63,15 @@ class LilyPondNameManager(object):
         for key, value in state.items():
             self.__dict__[key] = value
 
+    def __setattr__(self, name, value) -> None:
+        """
+        Sets attribute ``name`` to ``value``.
+
+        Invalidates cached format bundles.
+        """
+        LilyPondFormatManager._invalidate_bundle_caches()
+        object.__setattr__(self, name, value)
+
     ### PRIVATE METHODS ###
 
     def _get_attribute_pairs(self):
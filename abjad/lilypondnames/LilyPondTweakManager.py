@@ -236,7 +236,7 @@ class LilyPondTweakManager(LilyPondNameManager):
                 value = ("TAGGED", value, tag, True)
             else:
                 value = ("TAGGED", value, tag)
-        object.__setattr__(self, name, value)
+        LilyPondNameManager.__setattr__(self, name, value)
         if name in ("_currently_deactivated", "_currently_tagging"):
             return
         try:
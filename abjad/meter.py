@@ -261,6 +261,7 @@ class Meter(object):
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        "_cache_key",
         "_increase_monotonic",
         "_denominator",
         "_numerator",
@@ -268,6 +269,14 @@ class Meter(object):
         "_root_node",
     )
 
+    _depthwise_offset_inventories: typing.Dict[typing.Hashable, typing.Tuple] = {}
+
+    _maximum_rewrite_plan_count = 4096
+
+    _prolated_offset_inventories: typing.Dict[typing.Tuple, typing.List] = {}
+
+    _rewrite_plans: typing.Dict[typing.Tuple, typing.Optional[typing.Tuple]] = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -277,67 +286,8 @@ class Meter(object):
         assert isinstance(preferred_boundary_depth, (int, type(None)))
         self._preferred_boundary_depth = preferred_boundary_depth
 
-        def recurse(node, factors, denominator, increase_monotonic):
-            if factors:
-                factor, factors = factors[0], factors[1:]
-                preprolated_duration = node.preprolated_duration.__div__(factor)
-                # if factor in (2, 3, 4, 5):
-                if factor in (2, 3, 4):
-                    if factors:
-                        for _ in range(factor):
-                            child = rhythmtrees.RhythmTreeContainer(
-                                preprolated_duration=preprolated_duration
-                            )
-                            node.append(child)
-                            recurse(child, factors, denominator, increase_monotonic)
-                    else:
-                        for _ in range(factor):
-                            node.append(
-                                rhythmtrees.RhythmTreeLeaf(
-                                    preprolated_duration=(1, denominator)
-                                )
-                            )
-                else:
-                    parts = [3]
-                    total = 3
-                    while total < factor:
-                        if not increase_monotonic:
-                            parts.append(2)
-                        else:
-                            parts.insert(0, 2)
-                        total += 2
-                    for part in parts:
-                        grouping = rhythmtrees.RhythmTreeContainer(
-                            preprolated_duration=part * preprolated_duration
-                        )
-                        if factors:
-                            for _ in range(part):
-                                child = rhythmtrees.RhythmTreeContainer(
-                                    preprolated_duration=preprolated_duration
-                                )
-                                grouping.append(child)
-                                recurse(
-                                    child, factors, denominator, increase_monotonic,
-                                )
-                        else:
-                            for _ in range(part):
-                                grouping.append(
-                                    rhythmtrees.RhythmTreeLeaf(
-                                        preprolated_duration=(1, denominator)
-                                    )
-                                )
-                        node.append(grouping)
-            else:
-                node.extend(
-                    [
-                        rhythmtrees.RhythmTreeLeaf(
-                            preprolated_duration=(1, denominator)
-                        )
-                        for _ in range(node.preprolated_duration.numerator)
-                    ]
-                )
-
         increase_monotonic = bool(increase_monotonic)
+        cache_key = None
         try:
             numerator = argument.numerator
             denominator = argument.denominator
@@ -345,12 +295,15 @@ class Meter(object):
         except AttributeError:
             is_fraction_like = False
         if isinstance(argument, type(self)):
-            root = argument.root_node
+            root = argument._root_node
             numerator, denominator = argument.numerator, argument.denominator
             increase_monotonic = argument.increase_monotonic
+            cache_key = argument._cache_key
         elif isinstance(argument, (str, rhythmtrees.RhythmTreeContainer)):
             if isinstance(argument, str):
-                parsed = rhythmtrees.RhythmTreeParser()(argument)
+                class_ = rhythmtrees.RhythmTreeParser
+                with class_._get_pooled_parser() as parser:
+                    parsed = parser(argument)
                 assert len(parsed) == 1
                 root = parsed[0]
             else:
@@ -367,16 +320,16 @@ class Meter(object):
                     argument.numerator, argument.denominator
                 )
             numerator, denominator = fraction.numerator, fraction.denominator
-            factors = mathtools.factors(numerator)
-            # group two nested levels of 2s into a 4
-            if 1 < len(factors) and factors[0] == factors[1] == 2:
-                factors[0:2] = [4]
-            root = rhythmtrees.RhythmTreeContainer(preprolated_duration=fraction)
-            recurse(root, factors, denominator, increase_monotonic)
+            cache_key = (numerator, denominator, increase_monotonic)
+            if cache_key in Meter._depthwise_offset_inventories:
+                root = None
+            else:
+                root = Meter._make_root_node(*cache_key)
         else:
             name = type(self).__name__
             raise ValueError(f"can not initialize {name}: {argument!r}.")
 
+        self._cache_key = cache_key
         self._root_node = root
         self._numerator = numerator
         self._denominator = denominator
@@ -585,7 +538,7 @@ class Meter(object):
             node_attributes={"fontname": "Arial", "fontsize": 12, "penwidth": 2},
         )
         node_mapping = {}
-        root = self._root_node
+        root = self.root_node
         nodes = [root] + list(root.depth_first())
         leaves = [_ for _ in nodes if not hasattr(_, "children")]
         for node in nodes:
@@ -696,6 +649,11 @@ class Meter(object):
 
     ### PRIVATE METHODS ###
 
+    def _get_cache_key(self):
+        if self._cache_key is not None:
+            return self._cache_key
+        return self.rtm_format
+
     def _get_format_specification(self):
         return system.FormatSpecification(
             client=self,
@@ -704,6 +662,77 @@ class Meter(object):
             storage_format_kwargs_names=[],
         )
 
+    @staticmethod
+    def _make_root_node(numerator, denominator, increase_monotonic):
+        def recurse(node, factors, denominator, increase_monotonic):
+            if factors:
+                factor, factors = factors[0], factors[1:]
+                preprolated_duration = node.preprolated_duration.__div__(factor)
+                # if factor in (2, 3, 4, 5):
+                if factor in (2, 3, 4):
+                    if factors:
+                        for _ in range(factor):
+                            child = rhythmtrees.RhythmTreeContainer(
+                                preprolated_duration=preprolated_duration
+                            )
+                            node.append(child)
+                            recurse(child, factors, denominator, increase_monotonic)
+                    else:
+                        for _ in range(factor):
+                            node.append(
+                                rhythmtrees.RhythmTreeLeaf(
+                                    preprolated_duration=(1, denominator)
+                                )
+                            )
+                else:
+                    parts = [3]
+                    total = 3
+                    while total < factor:
+                        if not increase_monotonic:
+                            parts.append(2)
+                        else:
+                            parts.insert(0, 2)
+                        total += 2
+                    for part in parts:
+                        grouping = rhythmtrees.RhythmTreeContainer(
+                            preprolated_duration=part * preprolated_duration
+                        )
+                        if factors:
+                            for _ in range(part):
+                                child = rhythmtrees.RhythmTreeContainer(
+                                    preprolated_duration=preprolated_duration
+                                )
+                                grouping.append(child)
+                                recurse(
+                                    child, factors, denominator, increase_monotonic,
+                                )
+                        else:
+                            for _ in range(part):
+                                grouping.append(
+                                    rhythmtrees.RhythmTreeLeaf(
+                                        preprolated_duration=(1, denominator)
+                                    )
+                                )
+                        node.append(grouping)
+            else:
+                node.extend(
+                    [
+                        rhythmtrees.RhythmTreeLeaf(
+                            preprolated_duration=(1, denominator)
+                        )
+                        for _ in range(node.preprolated_duration.numerator)
+                    ]
+                )
+
+        fraction = mathtools.NonreducedFraction(numerator, denominator)
+        factors = mathtools.factors(numerator)
+        # group two nested levels of 2s into a 4
+        if 1 < len(factors) and factors[0] == factors[1] == 2:
+            factors[0:2] = [4]
+        root = rhythmtrees.RhythmTreeContainer(preprolated_duration=fraction)
+        recurse(root, factors, denominator, increase_monotonic)
+        return root
+
     @staticmethod
     def _rewrite_meter(
         components,
@@ -714,13 +743,15 @@ class Meter(object):
         rewrite_tuplets=True,
     ):
         def recurse(
-            boundary_depth=None, boundary_offsets=None, depth=0, logical_tie=None,
+            boundary_depth=None,
+            boundary_offsets=None,
+            depth=0,
+            logical_tie=None,
+            logical_tie_start_offset=None,
+            logical_tie_stop_offset=None,
         ):
             offsets = _MeterManager.get_offsets_at_depth(depth, offset_inventory)
             logical_tie_duration = logical_tie._get_preprolated_duration()
-            logical_tie_timespan = inspect(logical_tie).timespan()
-            logical_tie_start_offset = logical_tie_timespan.start_offset
-            logical_tie_stop_offset = logical_tie_timespan.stop_offset
             logical_tie_starts_in_offsets = logical_tie_start_offset in offsets
             logical_tie_stops_in_offsets = logical_tie_stop_offset in offsets
             if not _MeterManager.is_acceptable_logical_tie(
@@ -730,7 +761,6 @@ class Meter(object):
                 maximum_dot_count=maximum_dot_count,
             ):
                 split_offset = None
-                offsets = _MeterManager.get_offsets_at_depth(depth, offset_inventory)
                 # If the logical tie's start aligns,
                 # take the latest possible offset.
                 if logical_tie_starts_in_offsets:
@@ -740,23 +770,23 @@ class Meter(object):
                         split_offset = offset
                         break
                 if split_offset is not None:
-                    split_offset -= logical_tie_start_offset
-                    shards = mutate(logical_tie[:]).split([split_offset])
-                    logical_ties = [LogicalTie(_) for _ in shards]
-                    for logical_tie in logical_ties:
-                        recurse(
-                            boundary_depth=boundary_depth,
-                            boundary_offsets=boundary_offsets,
-                            depth=depth,
-                            logical_tie=logical_tie,
-                        )
-                else:
-                    recurse(
+                    return split(
                         boundary_depth=boundary_depth,
                         boundary_offsets=boundary_offsets,
-                        depth=depth + 1,
+                        depth=depth,
                         logical_tie=logical_tie,
+                        logical_tie_start_offset=logical_tie_start_offset,
+                        logical_tie_stop_offset=logical_tie_stop_offset,
+                        split_offset=split_offset,
                     )
+                return recurse(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=depth + 1,
+                    logical_tie=logical_tie,
+                    logical_tie_start_offset=logical_tie_start_offset,
+                    logical_tie_stop_offset=logical_tie_stop_offset,
+                )
             elif _MeterManager.is_boundary_crossing_logical_tie(
                 boundary_depth=boundary_depth,
                 boundary_offsets=boundary_offsets,
@@ -772,18 +802,52 @@ class Meter(object):
                         split_offset = offset
                         break
                 assert split_offset is not None
-                split_offset -= logical_tie_start_offset
-                shards = mutate(logical_tie[:]).split([split_offset])
-                logical_ties = [LogicalTie(shard) for shard in shards]
-                for logical_tie in logical_ties:
-                    recurse(
-                        boundary_depth=boundary_depth,
-                        boundary_offsets=boundary_offsets,
-                        depth=depth,
-                        logical_tie=logical_tie,
-                    )
-            else:
+                return split(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=depth,
+                    logical_tie=logical_tie,
+                    logical_tie_start_offset=logical_tie_start_offset,
+                    logical_tie_stop_offset=logical_tie_stop_offset,
+                    split_offset=split_offset,
+                )
+            logical_tie[:]._fuse()
+            return None
+
+        def replay(logical_tie, plan):
+            if plan is None:
                 logical_tie[:]._fuse()
+                return
+            split_duration, plans = plan
+            shards = mutate(logical_tie[:]).split([split_duration])
+            for shard, plan in zip(shards, plans):
+                replay(LogicalTie(shard), plan)
+
+        def split(
+            boundary_depth=None,
+            boundary_offsets=None,
+            depth=0,
+            logical_tie=None,
+            logical_tie_start_offset=None,
+            logical_tie_stop_offset=None,
+            split_offset=None,
+        ):
+            split_duration = split_offset - logical_tie_start_offset
+            shards = mutate(logical_tie[:]).split([split_duration])
+            assert len(shards) == 2, repr(shards)
+            offsets = (logical_tie_start_offset, split_offset, logical_tie_stop_offset)
+            plans = []
+            for i, shard in enumerate(shards):
+                plan = recurse(
+                    boundary_depth=boundary_depth,
+                    boundary_offsets=boundary_offsets,
+                    depth=depth,
+                    logical_tie=LogicalTie(shard),
+                    logical_tie_start_offset=offsets[i],
+                    logical_tie_stop_offset=offsets[i + 1],
+                )
+                plans.append(plan)
+            return split_duration, tuple(plans)
 
         assert isinstance(components, Selection), repr(components)
         if not isinstance(meter, Meter):
@@ -805,7 +869,9 @@ class Meter(object):
         last_start_offset = inspect(components[-1]).timespan().start_offset
         difference = last_start_offset - first_start_offset + initial_offset
         assert difference < meter.implied_time_signature.duration
-        # Build offset inventory, adjusted for initial offset and prolation.
+        # Get offset inventory, adjusted for prolation and measured from
+        # initial offset; deeper levels are added to the cached inventory
+        # as logical ties need them.
         first_offset = inspect(components[0]).timespan().start_offset
         first_offset -= initial_offset
         if components[0]._parent is None:
@@ -813,27 +879,53 @@ class Meter(object):
         else:
             parentage = inspect(components[0]._parent).parentage()
             prolation = parentage.prolation
-        offset_inventory = []
-        for offsets in meter.depthwise_offset_inventory:
-            offsets = [(_ * prolation) + first_offset for _ in offsets]
-            offset_inventory.append(tuple(offsets))
+        inventory_key = (meter._get_cache_key(), prolation)
+        if inventory_key not in Meter._prolated_offset_inventories:
+            offset_inventory = []
+            for offsets in meter.depthwise_offset_inventory:
+                offsets = [Offset(_ * prolation) for _ in offsets]
+                offset_inventory.append(tuple(offsets))
+            Meter._prolated_offset_inventories[inventory_key] = offset_inventory
+        offset_inventory = Meter._prolated_offset_inventories[inventory_key]
         # Build boundary offset inventory, if applicable.
         if boundary_depth is not None:
-            boundary_offsets = offset_inventory[boundary_depth]
+            depth_count = len(meter.depthwise_offset_inventory)
+            boundary_offsets = offset_inventory[:depth_count][boundary_depth]
         else:
             boundary_offsets = None
-        # Cache results of iterator;
+        # Cache results of iterator and logical tie timespans;
         # we'll be mutating the underlying collection
         iterator = _MeterManager.iterate_rewrite_inputs(components)
         items = tuple(iterator)
-        for item in items:
+        timespans = [
+            inspect(_).timespan() if isinstance(_, LogicalTie) else None for _ in items
+        ]
+        for item, timespan in zip(items, timespans):
             if isinstance(item, LogicalTie):
-                recurse(
+                start_offset = Offset(timespan.start_offset - first_offset)
+                stop_offset = Offset(timespan.stop_offset - first_offset)
+                plan_key = (
+                    inventory_key,
+                    boundary_depth,
+                    maximum_dot_count,
+                    item._get_preprolated_duration(),
+                    start_offset,
+                    stop_offset,
+                )
+                if plan_key in Meter._rewrite_plans:
+                    replay(item, Meter._rewrite_plans[plan_key])
+                    continue
+                plan = recurse(
                     boundary_depth=boundary_depth,
                     boundary_offsets=boundary_offsets,
                     depth=0,
                     logical_tie=item,
+                    logical_tie_start_offset=start_offset,
+                    logical_tie_stop_offset=stop_offset,
                 )
+                if Meter._maximum_rewrite_plan_count <= len(Meter._rewrite_plans):
+                    Meter._rewrite_plans.clear()
+                Meter._rewrite_plans[plan_key] = plan
             elif isinstance(item, Tuplet) and not rewrite_tuplets:
                 pass
             else:
@@ -1075,6 +1167,9 @@ class Meter(object):
 
         Returns dictionary.
         """
+        key = self._get_cache_key()
+        if key in Meter._depthwise_offset_inventories:
+            return Meter._depthwise_offset_inventories[key]
         inventory = []
         all_offsets = set()
         all_offsets.add(Offset(self.numerator, self.denominator))
@@ -1082,7 +1177,9 @@ class Meter(object):
             for node in nodes:
                 all_offsets.add(Offset(node.start_offset))
             inventory.append(tuple(sorted(all_offsets)))
-        return tuple(inventory)
+        inventory = tuple(inventory)
+        Meter._depthwise_offset_inventories[key] = inventory
+        return inventory
 
     @property
     def duration(self):
@@ -1378,6 +1475,8 @@ class Meter(object):
 
         Returns rhythm tree node.
         """
+        if self._root_node is None:
+            self._root_node = Meter._make_root_node(*self._cache_key)
         return self._root_node
 
     @property
@@ -1393,7 +1492,7 @@ class Meter(object):
 
         Returns string.
         """
-        return self._root_node.rtm_format
+        return self.root_node.rtm_format
 
 
 class MeterList(TypedList):
@@ -410,22 +410,22 @@ class LilyPondLexicalDefinition(object):
 
         # t.type = 'SCHEME_START'
         # t.lexer.push_state('INITIAL')
-        scheme_parser = abjad_parser.SchemeParser(debug=False)
-        input_string = t.lexer.lexdata[t.lexpos + 1 :]
-        # print 'PREPARSE'
-        try:
-            scheme_parser(input_string)
-        except exceptions.SchemeParserFinishedError:
-            result = scheme_parser.result
-            t.value = result
-            t.type = "SCM_TOKEN"
-            # if isinstance(result, str):
-            #    t.type = 'STRING'
-            #    if t.value.find(' ') != -1:
-            #        t.value = '"{}"'.format(t.value)
-            # else:
-            #    t.type = 'SCM_TOKEN'
-            t.lexer.skip(scheme_parser.cursor_end + 1)
+        with abjad_parser.SchemeParser._get_pooled_parser() as scheme_parser:
+            input_string = t.lexer.lexdata[t.lexpos + 1 :]
+            # print 'PREPARSE'
+            try:
+                scheme_parser(input_string)
+            except exceptions.SchemeParserFinishedError:
+                result = scheme_parser.result
+                t.value = result
+                t.type = "SCM_TOKEN"
+                # if isinstance(result, str):
+                #    t.type = 'STRING'
+                #    if t.value.find(' ') != -1:
+                #        t.value = '"{}"'.format(t.value)
+                # else:
+                #    t.type = 'SCM_TOKEN'
+                t.lexer.skip(scheme_parser.cursor_end + 1)
         return t
 
     # lexer.ll:387
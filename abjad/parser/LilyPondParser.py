@@ -1,5 +1,6 @@
 import collections
 import itertools
+import re
 import typing
 
 import ply  # type: ignore
@@ -8,6 +9,7 @@ from abjad import core
 from abjad import indicators as abjad_indicators
 from abjad import markups as abjad_markups
 from abjad import pitch as abjad_pitch
+from abjad import utilities
 from abjad.system.Parser import Parser
 from abjad.top.attach import attach
 
@@ -337,6 +339,33 @@ class LilyPondParser(Parser):
         "_syndef",
     )
 
+    _note_entry_durations: typing.Dict = {}
+
+    _note_entry_event_identifiers = {
+        "(": "parenthesisOpenSymbol",
+        ")": "parenthesisCloseSymbol",
+        "[": "bracketOpenSymbol",
+        "]": "bracketCloseSymbol",
+        "~": "tildeSymbol",
+    }
+
+    _note_entry_pattern = re.compile(
+        r"""
+        (?P<space>\s+)
+        |(?P<leaf>(?P<name>[a-zA-Z]+)(?P<quotes>'+|,+)?(?P<duration>\d+\.*)?)
+        |(?P<chord><(?P<chord_body>[^<>]*)>(?P<chord_duration>\d+\.*)?)
+        |(?P<event>[()\[\]~])
+        |(?P<open>\{)
+        |(?P<close>\})
+        |(?P<other>.)
+        """,
+        re.VERBOSE,
+    )
+
+    _note_entry_pitch_pattern = re.compile(r"([a-zA-Z]+)('+|,+)?")
+
+    _note_entry_pitches: typing.Dict = {}
+
     ### INITIALIZER ###
 
     def __init__(self, default_language="english", debug=False):
@@ -372,6 +401,10 @@ class LilyPondParser(Parser):
         Returns Abjad components.
         """
         self._reset_parser_variables()
+        if not self._debug:
+            result = self._parse_note_entry(input_string)
+            if result is not None:
+                return result
         if self._debug:
             result = self._parser._lilypond_patch_parse_debug(
                 input_string, lexer=self._lexer, debug=self._logger
@@ -559,6 +592,103 @@ class LilyPondParser(Parser):
             "symbol?": lambda x: True,
         }
 
+    def _get_note_entry_duration(self, string):
+        if string not in self._note_entry_durations:
+            if string.rstrip(".") not in ("1", "2", "4", "8", "16", "32", "64", "128"):
+                return None
+            duration = utilities.Duration.from_lilypond_duration_string(string)
+            self._note_entry_durations[string] = duration
+        return self._note_entry_durations[string]
+
+    def _get_note_entry_pitch(self, name, quotes):
+        pitch_class = self._pitch_names.get(name)
+        if pitch_class is None:
+            return None
+        string = str(pitch_class) + (quotes or "")
+        if string not in self._note_entry_pitches:
+            pitch = abjad_pitch.NamedPitch(string)
+            self._note_entry_pitches[string] = pitch
+        return self._note_entry_pitches[string]
+
+    def _parse_note_entry(self, string):
+        """
+        Parses ``string`` of notes, rests, skips and chords with ties, beams
+        and slurs in a single pair of braces without the LilyPond grammar.
+
+        Returns none when ``string`` contains anything else; the full parser
+        then handles ``string``.
+        """
+        leaves = []
+        duration = self._default_duration.duration
+        is_open, is_closed = False, False
+        for match in self._note_entry_pattern.finditer(string):
+            kind = match.lastgroup
+            if kind == "space":
+                continue
+            if is_closed:
+                return None
+            if kind == "open":
+                if is_open:
+                    return None
+                is_open = True
+                continue
+            if not is_open:
+                return None
+            if kind == "close":
+                is_closed = True
+            elif kind == "event":
+                if not leaves:
+                    return None
+                identifier = self._note_entry_event_identifiers[match.group()]
+                indicator = self._resolve_event_identifier(identifier)
+                attach(indicator, leaves[-1])
+            elif kind == "leaf":
+                if match.group("duration") is not None:
+                    duration = self._get_note_entry_duration(match.group("duration"))
+                    if duration is None:
+                        return None
+                name, quotes = match.group("name", "quotes")
+                pitch = self._get_note_entry_pitch(name, quotes)
+                if pitch is not None:
+                    leaf = core.Note(pitch, duration)
+                    leaf.note_head.is_forced = False
+                    leaf.note_head.is_cautionary = False
+                elif name == "r" and quotes is None:
+                    leaf = core.Rest(duration)
+                elif name == "s" and quotes is None:
+                    leaf = core.Skip(duration)
+                else:
+                    return None
+                leaves.append(leaf)
+            elif kind == "chord":
+                note_heads = []
+                for element in match.group("chord_body").split():
+                    match_ = self._note_entry_pitch_pattern.fullmatch(element)
+                    if match_ is None:
+                        return None
+                    pitch = self._get_note_entry_pitch(*match_.groups())
+                    if pitch is None:
+                        return None
+                    note_head = core.NoteHead(
+                        written_pitch=pitch, is_cautionary=False, is_forced=False
+                    )
+                    note_heads.append(note_head)
+                if not note_heads:
+                    return None
+                if match.group("chord_duration") is not None:
+                    string_ = match.group("chord_duration")
+                    duration = self._get_note_entry_duration(string_)
+                    if duration is None:
+                        return None
+                leaf = core.Chord([], duration)
+                leaf.note_heads.extend(note_heads)
+                leaves.append(leaf)
+            else:
+                return None
+        if not is_closed:
+            return None
+        return core.Container(leaves)
+
     def _pop_variable_scope(self):
         if self._scope_stack:
             self._scope_stack.pop()
@@ -634,6 +764,7 @@ class LilyPondParser(Parser):
             pass
         self._scope_stack = [{}]
         self._chord_pitch_orders = {}
+        self._reset_lexer()
         self._lexer.push_state("notes")
         self._default_duration = abjad_parser.LilyPondDuration((1, 4), None)
         self._last_chord = None
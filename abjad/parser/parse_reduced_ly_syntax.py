@@ -21,4 +21,5 @@ def parse_reduced_ly_syntax(string):
 
     Returns list.
     """
-    return ReducedLyParser()(string)
+    with ReducedLyParser._get_pooled_parser() as parser:
+        return parser(string)
@@ -184,7 +184,7 @@ class NumberedPitchClass(PitchClass):
 
         Returns integer.
         """
-        return super().__hash__()
+        return hash((type(self), self.arrow, self.number))
 
     def __lt__(self, argument):
         """
@@ -5,6 +5,9 @@ from abjad.system.Signature import Signature
 from abjad.top.new import new
 from abjad.utilities.Duration import Duration
 
+from . import constants
+from .NumberedPitch import NumberedPitch
+from .NumberedPitchClass import NumberedPitchClass
 from .Segment import Segment
 
 
@@ -117,7 +120,9 @@ class PitchClassSegment(Segment):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = ("_numbers",)
+
+    _numbered_pitch_classes = tuple(NumberedPitchClass(_) for _ in range(12))
 
     ### INITIALIZER ###
 
@@ -125,6 +130,7 @@ class PitchClassSegment(Segment):
         if not items and not item_class:
             item_class = self._named_item_class
         Segment.__init__(self, items=items, item_class=item_class)
+        self._numbers = None
 
     ### SPECIAL METHODS ###
 
@@ -1243,6 +1249,32 @@ class PitchClassSegment(Segment):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_numbers(class_, numbers):
+        segment = class_.__new__(class_)
+        pitch_classes = PitchClassSegment._numbered_pitch_classes
+        segment._collection = tuple(pitch_classes[_] for _ in numbers)
+        segment._equivalence_markup = None
+        segment._expression = None
+        segment._item_class = NumberedPitchClass
+        segment._numbers = numbers
+        return segment
+
+    def _get_numbers(self):
+        """
+        Gets bytes of pitch-class numbers when segment contains only
+        semitone-valued numbered pitch-classes without arrows.
+
+        Returns none otherwise.
+        """
+        if self._numbers is None:
+            self._numbers = False
+            if self.item_class is NumberedPitchClass and all(
+                type(_.number) is int and _.arrow is None for _ in self
+            ):
+                self._numbers = bytes(_.number for _ in self)
+        return self._numbers or None
+
     def _get_padded_string(self, width=2):
         string = super()._get_padded_string(width=width)
         return "PC<" + string[1:-1] + ">"
@@ -1269,6 +1301,10 @@ class PitchClassSegment(Segment):
         return "r"
 
     def _transpose_to_zero(self):
+        numbers = self._get_numbers()
+        if numbers is not None:
+            table = constants._pitch_class_transposition_tables[-numbers[0] % 12]
+            return type(self)._from_numbers(numbers.translate(table))
         numbers = [_.number for _ in self]
         first_number = self[0].number
         numbers = [pc.number - first_number for pc in self]
@@ -1715,6 +1751,12 @@ class PitchClassSegment(Segment):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
+        numbers = self._get_numbers()
+        if numbers is not None:
+            number = NumberedPitch(axis or 0).number
+            if type(number) is int:
+                table = constants._pitch_class_inversion_tables[2 * number % 12]
+                return type(self)._from_numbers(numbers.translate(table))
         items = [_.invert(axis=axis) for _ in self]
         return type(self)(items=items)
 
@@ -2125,6 +2167,10 @@ class PitchClassSegment(Segment):
 
         if self._expression:
             return self._update_expression(inspect.currentframe())
+        numbers = self._get_numbers()
+        if numbers is not None and type(n) is int:
+            table = constants._pitch_class_multiplication_tables[n % 12]
+            return type(self)._from_numbers(numbers.translate(table))
         items = [abjad.NumberedPitchClass(_) for _ in self]
         items = [_.multiply(n) for _ in items]
         return type(self)(items=items)
@@ -2411,6 +2457,9 @@ class PitchClassSegment(Segment):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
+        numbers = self._get_numbers()
+        if numbers is not None:
+            return type(self)._from_numbers(numbers[::-1])
         return type(self)(items=reversed(self))
 
     @Signature(
@@ -2740,6 +2789,14 @@ class PitchClassSegment(Segment):
 
         if self._expression:
             return self._update_expression(inspect.currentframe())
+        numbers = self._get_numbers()
+        if numbers is not None and type(n) is int:
+            n %= len(numbers)
+            numbers = numbers[-n:] + numbers[:-n]
+            if stravinsky:
+                table = constants._pitch_class_transposition_tables[-numbers[0] % 12]
+                numbers = numbers.translate(table)
+            return type(self)._from_numbers(numbers)
         items = abjad.sequence(self._collection).rotate(n=n)
         if stravinsky:
             n = 0 - float(items[0].number)
@@ -3242,6 +3299,10 @@ class PitchClassSegment(Segment):
         """
         if self._expression:
             return self._update_expression(inspect.currentframe())
+        numbers = self._get_numbers()
+        if numbers is not None and type(n) is int:
+            table = constants._pitch_class_transposition_tables[n % 12]
+            return type(self)._from_numbers(numbers.translate(table))
         items = [_.transpose(n=n) for _ in self]
         return type(self)(items=items)
 
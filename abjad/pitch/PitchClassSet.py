@@ -2,7 +2,12 @@ import copy
 
 from abjad.utilities.Enumerator import Enumerator
 
+from . import constants
+from .NumberedPitch import NumberedPitch
+from .NumberedPitchClass import NumberedPitchClass
+from .PitchClassSegment import PitchClassSegment
 from .Set import Set
+from .SetClass import SetClass
 
 
 class PitchClassSet(Set):
@@ -35,7 +40,13 @@ class PitchClassSet(Set):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = ("_numbers",)
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None, item_class=None):
+        Set.__init__(self, items=items, item_class=item_class)
+        self._numbers = None
 
     ### SPECIAL METHODS ###
 
@@ -188,6 +199,16 @@ class PitchClassSet(Set):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_numbers(class_, numbers):
+        set_ = class_.__new__(class_)
+        pitch_classes = PitchClassSegment._numbered_pitch_classes
+        set_._collection = frozenset(pitch_classes[_] for _ in numbers)
+        set_._expression = None
+        set_._item_class = NumberedPitchClass
+        set_._numbers = bytes(sorted(set(numbers)))
+        return set_
+
     @staticmethod
     def _get_most_compact_ordering(candidates):
         import abjad
@@ -240,6 +261,21 @@ class PitchClassSet(Set):
         )
         return segment
 
+    def _get_numbers(self):
+        """
+        Gets sorted bytes of pitch-class numbers when set contains only
+        semitone-valued numbered pitch-classes without arrows.
+
+        Returns none otherwise.
+        """
+        if self._numbers is None:
+            self._numbers = False
+            if self.item_class is NumberedPitchClass and all(
+                type(_.number) is int and _.arrow is None for _ in self
+            ):
+                self._numbers = bytes(sorted(_.number for _ in self))
+        return self._numbers or None
+
     ### PUBLIC METHODS ###
 
     @classmethod
@@ -316,6 +352,10 @@ class PitchClassSet(Set):
             return abjad.PitchClassSegment(
                 items=None, item_class=abjad.NumberedPitchClass
             )
+        numbers = self._get_numbers()
+        if numbers is not None:
+            entry = SetClass._get_pitch_class_set_table_entry(numbers)
+            return PitchClassSegment._from_numbers(entry[0])
         pitch_classes = list(self)
         pitch_classes.sort()
         candidates = []
@@ -435,6 +475,12 @@ class PitchClassSet(Set):
 
         if not len(self):
             return copy.copy(self)
+        numbers = self._get_numbers()
+        if numbers is not None:
+            entry = SetClass._get_pitch_class_set_table_entry(numbers)
+            if transposition_only:
+                return type(self)._from_numbers(entry[2])
+            return type(self)._from_numbers(entry[1])
         normal_order = self.get_normal_order()
         if not transposition_only:
             normal_orders = [normal_order]
@@ -471,6 +517,12 @@ class PitchClassSet(Set):
 
         Returns numbered pitch-class set.
         """
+        numbers = self._get_numbers()
+        if numbers is not None:
+            number = NumberedPitch(axis or 0).number
+            if type(number) is int:
+                table = constants._pitch_class_inversion_tables[2 * number % 12]
+                return type(self)._from_numbers(numbers.translate(table))
         return type(self)([pc.invert(axis=axis) for pc in self])
 
     def is_transposed_subset(self, pcset):
@@ -534,6 +586,10 @@ class PitchClassSet(Set):
         """
         import abjad
 
+        numbers = self._get_numbers()
+        if numbers is not None and type(n) is int:
+            table = constants._pitch_class_multiplication_tables[n % 12]
+            return type(self)._from_numbers(numbers.translate(table))
         items = (pitch_class.multiply(n) for pitch_class in self)
         return abjad.new(self, items=items)
 
@@ -595,5 +651,9 @@ class PitchClassSet(Set):
         """
         import abjad
 
+        numbers = self._get_numbers()
+        if numbers is not None and type(n) is int:
+            table = constants._pitch_class_transposition_tables[n % 12]
+            return type(self)._from_numbers(numbers.translate(table))
         items = (pitch_class + n for pitch_class in self)
         return abjad.new(self, items=items)
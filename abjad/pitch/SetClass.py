@@ -1,6 +1,10 @@
+import typing
+
 from abjad import mathtools
 from abjad.system.StorageFormatManager import StorageFormatManager
 
+from . import constants
+
 
 class SetClass(object):
     """
@@ -958,6 +962,14 @@ class SetClass(object):
         v: k for k, v in _transposition_only_identifier_to_prime_form.items()
     }
 
+    # item n describes pitch-class set with bitmask n (pitch-class p in set
+    # when bit p is set) as (normal order, prime form, transposition-only
+    # prime form, interval-class vector, degree of symmetry, degree of
+    # inversional symmetry); built on first use
+    _pitch_class_set_table: typing.List[typing.Tuple] = []
+
+    _set_classes: typing.Dict[typing.Tuple, "SetClass"] = {}
+
     ### INITIALIZER ###
 
     def __init__(
@@ -1108,6 +1120,108 @@ class SetClass(object):
         print(message)
         print()
 
+    @staticmethod
+    def _get_pitch_class_set_table():
+        """
+        Gets 4096-entry pitch-class set table.
+
+        Makes table on first call. Computes normal orders exactly as
+        ``PitchClassSet.get_normal_order()`` does: rotation of smallest span
+        wins; ties go to rotation packed most tightly from the left; remaining
+        ties go to rotation with smallest first pitch-class.
+        """
+        if SetClass._pitch_class_set_table:
+            return SetClass._pitch_class_set_table
+        tables = constants._pitch_class_transposition_tables
+        masks = range(4096)
+        normal_orders = []
+        for mask in masks:
+            numbers = bytes(_ for _ in range(12) if mask >> _ & 1)
+            candidates = [numbers[i:] + numbers[:i] for i in range(len(numbers))]
+            keys = []
+            for candidate in candidates:
+                spans = candidate.translate(tables[-candidate[0] % 12])
+                keys.append((spans[-1], spans, candidate[0]))
+            if candidates:
+                pair = min(zip(keys, candidates))
+                normal_orders.append(pair[1])
+            else:
+                normal_orders.append(numbers)
+
+        def _rotate(mask, n):
+            return (mask << n | mask >> (12 - n)) & 0xFFF
+
+        def _invert(mask):
+            return sum(1 << (-_ % 12) for _ in range(12) if mask >> _ & 1)
+
+        table = []
+        for mask in masks:
+            normal_order = normal_orders[mask]
+            inversion = _invert(mask)
+            transposition_only_prime_form = b""
+            prime_form = b""
+            if normal_order:
+                transposition_only_prime_form = normal_order.translate(
+                    tables[-normal_order[0] % 12]
+                )
+                inversion_normal_order = normal_orders[inversion]
+                prime_form = inversion_normal_order.translate(
+                    tables[-inversion_normal_order[0] % 12]
+                )
+                prime_form = min(transposition_only_prime_form, prime_form)
+            interval_class_vector = [
+                bin(mask & _rotate(mask, n)).count("1") for n in range(1, 7)
+            ]
+            interval_class_vector[-1] //= 2
+            degree_of_symmetry = 0
+            degree_of_inversional_symmetry = 0
+            for n in range(12):
+                if _rotate(mask, n) == mask:
+                    degree_of_symmetry += 1
+                if _rotate(inversion, n) == mask:
+                    degree_of_inversional_symmetry += 1
+            entry = (
+                normal_order,
+                bytes(sorted(prime_form)),
+                bytes(sorted(transposition_only_prime_form)),
+                tuple(interval_class_vector),
+                degree_of_symmetry,
+                degree_of_inversional_symmetry,
+            )
+            table.append(entry)
+        SetClass._pitch_class_set_table[:] = table
+        return SetClass._pitch_class_set_table
+
+    @staticmethod
+    def _get_pitch_class_set_table_entry(numbers):
+        """
+        Gets table entry of pitch-class set with pitch-class ``numbers``.
+        """
+        mask = 0
+        for number in numbers:
+            mask |= 1 << number
+        return SetClass._get_pitch_class_set_table()[mask]
+
+    @staticmethod
+    def _get_set_class(cardinality, rank, lex_rank, transposition_only):
+        """
+        Gets set-class from process-wide cache of set-classes.
+
+        Set-classes are immutable; cache holds at most one set-class per
+        identifier and ranking system.
+        """
+        key = (cardinality, rank, lex_rank, transposition_only)
+        set_class = SetClass._set_classes.get(key)
+        if set_class is None:
+            set_class = SetClass(
+                cardinality=cardinality,
+                rank=rank,
+                lex_rank=lex_rank,
+                transposition_only=transposition_only,
+            )
+            SetClass._set_classes[key] = set_class
+        return set_class
+
     def _unrank(self, cardinality, rank, transposition_only=None):
         import abjad
 
@@ -1191,6 +1305,65 @@ class SetClass(object):
         """
         return self._cardinality
 
+    @property
+    def degree_of_symmetry(self):
+        """
+        Gets degree of symmetry.
+
+        ..  container:: example
+
+            Gets number of transpositions that map prime form to itself:
+
+            >>> abjad.SetClass(4, 29).degree_of_symmetry
+            1
+
+            >>> abjad.SetClass(4, 9).degree_of_symmetry
+            2
+
+            >>> abjad.SetClass(4, 28).degree_of_symmetry
+            4
+
+        Returns positive integer.
+        """
+        numbers = [_.number for _ in self.prime_form]
+        entry = self._get_pitch_class_set_table_entry(numbers)
+        return entry[4]
+
+    @property
+    def interval_class_vector(self):
+        """
+        Gets interval-class vector.
+
+        ..  container:: example
+
+            Gets interval-class vector of all-interval tetrachord:
+
+            >>> set_class = abjad.SetClass(4, 29)
+            >>> vector = set_class.interval_class_vector
+            >>> for interval_class, count in sorted(vector.items()):
+            ...     print(interval_class, count)
+            ...
+            1 1
+            2 1
+            3 1
+            4 1
+            5 1
+            6 1
+
+        Returns interval-class vector.
+        """
+        import abjad
+
+        numbers = [_.number for _ in self.prime_form]
+        entry = self._get_pitch_class_set_table_entry(numbers)
+        items = {}
+        for number, count in enumerate(entry[3], start=1):
+            if count:
+                items[number] = count
+        return abjad.IntervalClassVector(
+            items=items, item_class=abjad.NumberedInversionEquivalentIntervalClass
+        )
+
     @property
     def is_inversion_equivalent(self):
         """
@@ -1570,13 +1743,25 @@ class SetClass(object):
         """
         import abjad
 
-        pitch_class_set = abjad.PitchClassSet(
-            items=pitch_class_set, item_class=abjad.NumberedPitchClass
-        )
-        prime_form = pitch_class_set.get_prime_form(
-            transposition_only=transposition_only
-        )
-        prime_form = tuple([_.number for _ in sorted(prime_form)])
+        if not (
+            isinstance(pitch_class_set, abjad.PitchClassSet)
+            and pitch_class_set.item_class is abjad.NumberedPitchClass
+        ):
+            pitch_class_set = abjad.PitchClassSet(
+                items=pitch_class_set, item_class=abjad.NumberedPitchClass
+            )
+        numbers = pitch_class_set._get_numbers()
+        if numbers is not None:
+            entry = SetClass._get_pitch_class_set_table_entry(numbers)
+            if transposition_only:
+                prime_form = tuple(entry[2])
+            else:
+                prime_form = tuple(entry[1])
+        else:
+            prime_form = pitch_class_set.get_prime_form(
+                transposition_only=transposition_only
+            )
+            prime_form = tuple([_.number for _ in sorted(prime_form)])
         if transposition_only:
             pair = SetClass._prime_form_to_transposition_only_identifier[prime_form]
         elif lex_rank:
@@ -1584,13 +1769,7 @@ class SetClass(object):
         else:
             pair = SetClass._prime_form_to_forte_identifier[prime_form]
         cardinality, rank = pair
-        set_class = SetClass(
-            cardinality=cardinality,
-            rank=rank,
-            lex_rank=lex_rank,
-            transposition_only=transposition_only,
-        )
-        return set_class
+        return SetClass._get_set_class(cardinality, rank, lex_rank, transposition_only)
 
     @staticmethod
     def list_set_classes(cardinality=None, lex_rank=None, transposition_only=None):
@@ -1744,11 +1923,8 @@ class SetClass(object):
         set_classes = []
         for identifier in sorted(identifiers):
             cardinality, rank = identifier
-            set_class = SetClass(
-                cardinality,
-                rank,
-                lex_rank=lex_rank,
-                transposition_only=transposition_only,
+            set_class = SetClass._get_set_class(
+                cardinality, rank, lex_rank, transposition_only
             )
             set_classes.append(set_class)
         return set_classes
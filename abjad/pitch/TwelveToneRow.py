@@ -1,5 +1,7 @@
 from abjad.top.new import new
 
+from . import constants
+from .NumberedPitch import NumberedPitch
 from .PitchClassSegment import PitchClassSegment
 
 
@@ -641,6 +643,12 @@ class TwelveToneRow(PitchClassSegment):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_numbers(class_, numbers):
+        row = super()._from_numbers(numbers)
+        class_._validate_pitch_classes(row)
+        return row
+
     @staticmethod
     def _validate_pitch_classes(pitch_classes):
         numbers = [pc.number for pc in pitch_classes]
@@ -807,6 +815,54 @@ class TwelveToneRow(PitchClassSegment):
         """
         raise NotImplementedError
 
+    def get_forms(self):
+        """
+        Gets 48 prime, inverted, retrograde and retrograde-inverted forms of
+        row.
+
+        ..  container:: example
+
+            >>> row = abjad.TwelveToneRow([1, 11, 9, 3, 6, 7, 5, 4, 10, 2, 8, 0])
+            >>> forms = row.get_forms()
+            >>> len(forms)
+            48
+
+            >>> forms["P1"]
+            TwelveToneRow([1, 11, 9, 3, 6, 7, 5, 4, 10, 2, 8, 0])
+
+            >>> forms["I1"]
+            TwelveToneRow([1, 3, 5, 11, 8, 7, 9, 10, 4, 0, 6, 2])
+
+            >>> forms["R0"]
+            TwelveToneRow([11, 7, 1, 9, 3, 4, 6, 5, 2, 8, 10, 0])
+
+            >>> forms["RI0"]
+            TwelveToneRow([1, 5, 11, 3, 9, 8, 6, 7, 10, 4, 2, 0])
+
+        Names forms by first pitch-class of prime and inverted forms: ``P0``
+        and ``I0`` start on pitch-class 0; ``R0`` and ``RI0`` are ``P0`` and
+        ``I0`` read backward. Orders forms ``P0`` to ``P11``, ``I0`` to
+        ``I11``, ``R0`` to ``R11`` and then ``RI0`` to ``RI11``.
+
+        Returns dictionary.
+        """
+        numbers = bytes(_.number for _ in self)
+        tables = constants._pitch_class_transposition_tables
+        prime = numbers.translate(tables[-numbers[0] % 12])
+        inversion = prime.translate(constants._pitch_class_inversion_tables[0])
+        primes = [prime.translate(_) for _ in tables]
+        inversions = [inversion.translate(_) for _ in tables]
+        forms = {}
+        for name, numbers_ in (
+            ("P", primes),
+            ("I", inversions),
+            ("R", [_[::-1] for _ in primes]),
+            ("RI", [_[::-1] for _ in inversions]),
+        ):
+            for n, numbers in enumerate(numbers_):
+                forms[f"{name}{n}"] = super()._from_numbers(numbers)
+        return forms
+
     def has_duplicates(self):
         """
         Is false for all rows.
@@ -1020,6 +1076,12 @@ class TwelveToneRow(PitchClassSegment):
         """
         if axis is None:
             axis = self[0]
+        numbers = self._get_numbers()
+        if numbers is not None:
+            number = NumberedPitch(axis).number
+            if type(number) is int:
+                table = constants._pitch_class_inversion_tables[2 * number % 12]
+                return type(self)._from_numbers(numbers.translate(table))
         items = [pc.invert(axis=axis) for pc in self]
         return new(self, items=items)
 
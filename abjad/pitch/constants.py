@@ -292,6 +292,28 @@ _start_punctuation_to_inclusivity_string = {"[": "inclusive", "(": "exclusive"}
 
 _stop_punctuation_to_inclusivity_string = {"]": "inclusive", ")": "exclusive"}
 
+### LOOKUP TABLES ###
+
+# bytes.translate() tables mapping pitch-class numbers 0-11 to pitch-class
+# numbers 0-11; item n of each tuple is the table for operand n
+
+_pitch_class_numbers = bytes(range(12))
+
+_pitch_class_inversion_tables = tuple(
+    bytes.maketrans(_pitch_class_numbers, bytes((n - _) % 12 for _ in range(12)))
+    for n in range(12)
+)
+
+_pitch_class_multiplication_tables = tuple(
+    bytes.maketrans(_pitch_class_numbers, bytes((n * _) % 12 for _ in range(12)))
+    for n in range(12)
+)
+
+_pitch_class_transposition_tables = tuple(
+    bytes.maketrans(_pitch_class_numbers, bytes((n + _) % 12 for _ in range(12)))
+    for n in range(12)
+)
+
 ### REGEX ATOMS ###
 
 _integer_regex_atom = r"-?\d+"
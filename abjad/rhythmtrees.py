@@ -571,7 +571,8 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
         Returns new RhythmTreeContainer.
         """
         if isinstance(argument, str):
-            argument = RhythmTreeParser()(argument)
+            with RhythmTreeParser._get_pooled_parser() as parser:
+                argument = parser(argument)
             assert 1 == len(argument) and isinstance(argument[0], type(self))
             argument = argument[0]
         container = type(self)(
@@ -753,16 +754,19 @@ class RhythmTreeContainer(RhythmTreeMixin, uqbar.containers.UniqueTreeList):
 
     def _prepare_setitem_single(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)[0]
+            with RhythmTreeParser._get_pooled_parser() as parser:
+                expr = parser(expr)[0]
             assert len(expr) == 1
             expr = expr[0]
         return expr
 
     def _prepare_setitem_multiple(self, expr):
         if isinstance(expr, str):
-            expr = RhythmTreeParser()(expr)
+            with RhythmTreeParser._get_pooled_parser() as parser:
+                expr = parser(expr)
         elif isinstance(expr, list) and len(expr) == 1 and isinstance(expr[0], str):
-            expr = RhythmTreeParser()(expr[0])
+            with RhythmTreeParser._get_pooled_parser() as parser:
+                expr = parser(expr[0])
         return expr
 
     def _pretty_rtm_format_pieces(self):
@@ -1061,7 +1065,8 @@ def parse_rtm_syntax(rtm):
 
     Returns tuplet or container.
     """
-    result = RhythmTreeParser()(rtm)
+    with RhythmTreeParser._get_pooled_parser() as parser:
+        result = parser(rtm)
     container = core.Container()
     for node in result:
         tuplet = node((1, 4))
@@ -3,11 +3,10 @@ import typing
 from abjad.system.StorageFormatManager import StorageFormatManager
 from abjad.system.Tag import Tag
 from abjad.system.Tags import Tags
-from abjad.top.activate import activate
-from abjad.top.deactivate import deactivate
 from abjad.utilities.String import String
 
 from .Path import Path
+from .TagIndex import TagIndex
 
 abjad_tags = Tags()
 callable_type = typing.Union[str, typing.Callable, None]
@@ -61,96 +60,16 @@ class Job(object):
         """
         Calls job on job ``path``.
         """
-        messages = []
-        if self.title is not None:
-            messages.append(String(self.title).capitalize_start())
-        total_count = 0
-        if isinstance(self.path, str):
-            text = self.path
-        if self.deactivate_first is True:
-            if self.deactivate is not None:
-                assert isinstance(self.deactivate, tuple)
-                match, name = self.deactivate
-                if match is not None:
-                    if isinstance(self.path, Path):
-                        result = self.path.deactivate(
-                            match,
-                            indent=1,
-                            message_zero=True,
-                            name=name,
-                            prepend_empty_chord=self.prepend_empty_chord,
-                            skip_file_name=self.skip_file_name,
-                        )
-                        assert result is not None
-                        count, skipped, messages_ = result
-                        messages.extend(messages_)
-                        total_count += count
-                    else:
-                        assert isinstance(self.path, str)
-                        result = deactivate(
-                            text,
-                            match,
-                            prepend_empty_chord=self.prepend_empty_chord,
-                            skip_file_name=self.skip_file_name,
-                            skipped=True,
-                        )
-                        assert result is not None
-                        text, count, skipped = result
-        if self.activate is not None:
-            assert isinstance(self.activate, tuple)
-            match, name = self.activate
-            if match is not None:
-                if isinstance(self.path, Path):
-                    result = self.path.activate(
-                        match,
-                        indent=1,
-                        message_zero=True,
-                        name=name,
-                        skip_file_name=self.skip_file_name,
-                    )
-                    assert result is not None
-                    count, skipped, messages_ = result
-                    messages.extend(messages_)
-                    total_count += count
-                else:
-                    assert isinstance(self.path, str)
-                    text, count, skipped = activate(
-                        text, match, skip_file_name=self.skip_file_name, skipped=True,
-                    )
-        if self.deactivate_first is not True:
-            if self.deactivate is not None:
-                assert isinstance(self.deactivate, tuple)
-                match, name = self.deactivate
-                if match is not None:
-                    if isinstance(self.path, Path):
-                        result = self.path.deactivate(
-                            match,
-                            indent=1,
-                            message_zero=True,
-                            name=name,
-                            prepend_empty_chord=self.prepend_empty_chord,
-                            skip_file_name=self.skip_file_name,
-                        )
-                        assert result is not None
-                        count, skipped, messages_ = result
-                        messages.extend(messages_)
-                        total_count += count
-                    else:
-                        assert isinstance(self.path, str)
-                        text, count, skipped = deactivate(
-                            text,
-                            match,
-                            prepend_empty_chord=self.prepend_empty_chord,
-                            skip_file_name=self.skip_file_name,
-                            skipped=True,
-                        )
-        if total_count == 0 and not self.message_zero:
-            messages = []
         if isinstance(self.path, Path):
-            return messages
-        else:
-            assert isinstance(self.path, str)
-            return text
+            return Job.run_jobs([self])[0]
+        assert isinstance(self.path, str)
+        index = TagIndex(self.path)
+        for undo, match, name in self._get_operations():
+            if undo:
+                index.deactivate(match, prepend_empty_chord=self.prepend_empty_chord)
+            else:
+                index.activate(match)
+        return index.text
 
     def __repr__(self) -> str:
         """
@@ -158,6 +77,27 @@ class Job(object):
         """
         return StorageFormatManager(self).get_repr_format()
 
+    ### PRIVATE METHODS ###
+
+    def _get_operations(self):
+        operations = []
+        if self.deactivate_first is True and self.deactivate is not None:
+            assert isinstance(self.deactivate, tuple)
+            match, name = self.deactivate
+            if match is not None:
+                operations.append((True, match, name))
+        if self.activate is not None:
+            assert isinstance(self.activate, tuple)
+            match, name = self.activate
+            if match is not None:
+                operations.append((False, match, name))
+        if self.deactivate_first is not True and self.deactivate is not None:
+            assert isinstance(self.deactivate, tuple)
+            match, name = self.deactivate
+            if match is not None:
+                operations.append((True, match, name))
+        return operations
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -648,6 +588,88 @@ class Job(object):
             title="joining broken spanners ...",
         )
 
+    @staticmethod
+    def run_jobs(
+        jobs: typing.Sequence["Job"], *, processes: bool = False, workers: int = None
+    ) -> typing.List[typing.List[String]]:
+        """
+        Calls ``jobs`` on their paths and rewrites each LilyPond file at most
+        once.
+
+        Reads each file once, applies the activations and deactivations of
+        all jobs in order and writes the file only if text changes. Rewrites
+        files in a pool of ``workers`` threads when ``workers`` is greater
+        than ``1``, or in forked processes when ``processes`` is true.
+
+        Returns list of messages for each job, the same as calling jobs one
+        after another.
+        """
+        operations: typing.List[typing.Tuple] = []
+        file_to_operation_indices: typing.Dict[Path, typing.List[int]] = {}
+        for job in jobs:
+            assert isinstance(job.path, Path), repr(job)
+            operation_indices = []
+            for operation in job._get_operations():
+                operation_index = len(operations)
+                operations.append((job,) + operation)
+                operation_indices.append(operation_index)
+            if not operation_indices:
+                continue
+            if job.path.name == job.skip_file_name:
+                continue
+            paths = job.path._get_lilypond_files(skip_file_name=job.skip_file_name)
+            for path in paths:
+                if path not in file_to_operation_indices:
+                    file_to_operation_indices[path] = []
+                file_to_operation_indices[path].extend(operation_indices)
+        file_operations = []
+        for path, operation_indices in file_to_operation_indices.items():
+            operations_ = []
+            for operation_index in operation_indices:
+                job, undo, match, name = operations[operation_index]
+                prepend_empty_chord = None
+                if undo:
+                    prepend_empty_chord = job.prepend_empty_chord
+                operations_.append((undo, match, prepend_empty_chord))
+            file_operations.append((path, operations_))
+        counts = [[0, 0] for _ in operations]
+        results = Path._activate_files(
+            file_operations, workers=workers, processes=processes
+        )
+        for operation_indices, counts_ in zip(
+            file_to_operation_indices.values(), results
+        ):
+            for operation_index, (count, skipped) in zip(operation_indices, counts_):
+                counts[operation_index][0] += count
+                counts[operation_index][1] += skipped
+        result = []
+        for job in jobs:
+            messages = []
+            if job.title is not None:
+                messages.append(String(job.title).capitalize_start())
+            total_count = 0
+            for operation_index, operation in enumerate(operations):
+                if operation[0] is not job:
+                    continue
+                _, undo, match, name = operation
+                count, skipped = counts[operation_index]
+                if name is None:
+                    name = str(match)
+                messages_ = Path._make_activation_messages(
+                    count,
+                    skipped,
+                    indent=1,
+                    message_zero=True,
+                    name=name,
+                    undo=undo,
+                )
+                messages.extend(messages_)
+                total_count += count
+            if total_count == 0 and not job.message_zero:
+                messages = []
+            result.append(messages)
+        return result
+
     @staticmethod
     def show_clock_time_markup(path, undo=False) -> "Job":
         """
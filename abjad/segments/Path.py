@@ -1,7 +1,11 @@
+import concurrent.futures
+import hashlib
 import importlib
+import multiprocessing
 import os
 import pathlib
 import shutil
+import time
 import traceback
 import typing
 
@@ -14,9 +18,7 @@ from abjad.indicators.TimeSignature import TimeSignature
 from abjad.system.IOManager import IOManager
 from abjad.system.LilyPondFormatManager import LilyPondFormatManager
 from abjad.system.Tag import Tag
-from abjad.top.activate import activate
 from abjad.top.attach import attach
-from abjad.top.deactivate import deactivate
 from abjad.top.iterate import iterate
 from abjad.utilities.CyclicTuple import CyclicTuple
 from abjad.utilities.OrderedDict import OrderedDict
@@ -25,6 +27,7 @@ from abjad.utilities.String import String
 from .Line import Line
 from .Part import Part
 from .PartManifest import PartManifest
+from .TagIndex import TagIndex
 
 
 class Path(pathlib.PosixPath):
@@ -67,6 +70,13 @@ class Path(pathlib.PosixPath):
         "tools",
     )
 
+    _maximum_tag_operation_state_count = 10000
+
+    _pooled_file_operations: typing.List[typing.Tuple] = []
+
+    # coarsest file modification time resolution (FAT) in nanoseconds
+    _tag_operation_state_resolution_ns = 2 * 10 ** 9
+
     _secondary_names = (
         ".gitignore",
         ".log",
@@ -80,6 +90,8 @@ class Path(pathlib.PosixPath):
         "stylesheet.ily",
     )
 
+    _tag_operation_states: typing.Dict[typing.Tuple, typing.Tuple] = {}
+
     ### CONSTRUCTOR ###
 
     def __new__(class_, *arguments, scores=None):
@@ -224,6 +236,92 @@ class Path(pathlib.PosixPath):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _activate_file(path, operations, state=None):
+        stat = path.stat()
+        text = path.read_text()
+        time_ns = int(time.time() * 10 ** 9)
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        if state is not None and state[3] == digest:
+            counts = state[4]
+        else:
+            index = TagIndex(text)
+            counts = Path._apply_tag_operations(index, operations)
+            text_ = index.text
+            if text_ != text:
+                path.write_text(text_)
+                return counts, None
+        return counts, (stat.st_mtime_ns, stat.st_size, time_ns, digest, counts)
+
+    @staticmethod
+    def _activate_files(file_operations, workers=None, processes=False):
+        results: typing.List[typing.Any] = [None for _ in file_operations]
+        keys, pending, tasks = [], [], []
+        resolution = Path._tag_operation_state_resolution_ns
+        for i, (path, operations) in enumerate(file_operations):
+            key: typing.Optional[typing.Tuple] = None
+            state = None
+            if all(isinstance(_[1], Tag) for _ in operations):
+                key = (str(path), tuple(operations))
+                state = Path._tag_operation_states.get(key)
+            keys.append(key)
+            if state is not None:
+                stat = path.stat()
+                if state[:2] != (stat.st_mtime_ns, stat.st_size):
+                    state = None
+                elif resolution <= state[2] - stat.st_mtime_ns:
+                    results[i] = state[4]
+                    continue
+            pending.append(i)
+            tasks.append((path, operations, state))
+        if workers is not None and 1 < workers and 1 < len(pending):
+            workers = min(workers, len(pending))
+            if processes and multiprocessing.get_start_method() == "fork":
+                # forked workers inherit tasks without pickling them:
+                Path._pooled_file_operations = tasks
+                try:
+                    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                        outcomes = list(
+                            executor.map(Path._activate_pooled_file, range(len(tasks)))
+                        )
+                finally:
+                    Path._pooled_file_operations = []
+            else:
+                with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                    outcomes = list(
+                        executor.map(lambda _: Path._activate_file(*_), tasks)
+                    )
+        else:
+            outcomes = [Path._activate_file(*_) for _ in tasks]
+        states = Path._tag_operation_states
+        for i, (counts, state) in zip(pending, outcomes):
+            results[i] = counts
+            key = keys[i]
+            if key is None:
+                continue
+            if state is None:
+                states.pop(key, None)
+                continue
+            if Path._maximum_tag_operation_state_count <= len(states):
+                states.clear()
+            states[key] = state
+        return results
+
+    @staticmethod
+    def _activate_pooled_file(i):
+        return Path._activate_file(*Path._pooled_file_operations[i])
+
+    @staticmethod
+    def _apply_tag_operations(index, operations):
+        counts = []
+        for undo, tag, prepend_empty_chord in operations:
+            if undo:
+                pair = index.deactivate(tag, prepend_empty_chord=prepend_empty_chord)
+            else:
+                pair = index.activate(tag)
+            counts.append(pair)
+        return counts
+
     def _context_name_to_first_appearance_margin_markup(self, context_name):
         module = self._import_score_package()
         margin_markups = getattr(module, "margin_markups", None)
@@ -300,6 +398,28 @@ class Path(pathlib.PosixPath):
             if path.is_file():
                 return path
 
+    def _get_lilypond_files(self, skip_file_name=None) -> typing.List["Path"]:
+        if self.is_file():
+            if self.suffix in (".ily", ".ly"):
+                return [self]
+            return []
+        assert self.is_dir()
+        paths = []
+        for path in sorted(self.glob("**/*")):
+            path = type(self)(path)
+            if path.suffix not in (".ily", ".ly"):
+                continue
+            if not (
+                path.name.startswith("illustration")
+                or path.name.startswith("layout")
+                or path.name.startswith("segment")
+            ):
+                continue
+            if path.name == skip_file_name:
+                continue
+            paths.append(path)
+        return paths
+
     def _get_part_manifest(self):
         assert self.is_score_package_path()
         score_template = self._import_score_template()
@@ -390,6 +510,37 @@ class Path(pathlib.PosixPath):
         paths = [self / _ for _ in names]
         return paths
 
+    @staticmethod
+    def _make_activation_messages(
+        count, skipped, *, indent=0, message_zero=False, name=None, undo=False
+    ) -> typing.List[String]:
+        if undo:
+            adjective = "inactive"
+            gerund = "deactivating"
+        else:
+            adjective = "active"
+            gerund = "activating"
+        messages = []
+        total = count + skipped
+        if total == 0 and message_zero:
+            messages.append(f"found no {name} tags")
+        if 0 < total:
+            tags = String("tag").pluralize(total)
+            messages.append(f"found {total} {name} {tags}")
+            if 0 < count:
+                tags = String("tag").pluralize(count)
+                message = f"{gerund} {count} {name} {tags}"
+                messages.append(message)
+            if 0 < skipped:
+                tags = String("tag").pluralize(skipped)
+                message = f"skipping {skipped} ({adjective}) {name} {tags}"
+                messages.append(message)
+        whitespace = indent * " "
+        messages_ = [
+            String(whitespace + String(_).capitalize_start() + " ...") for _ in messages
+        ]
+        return messages_
+
     def _match_identifier_pattern(self, pattern):
         token = ":ds:"
         assert token in pattern, repr(pattern)
@@ -786,8 +937,10 @@ class Path(pathlib.PosixPath):
         message_zero: bool = False,
         name: str = None,
         prepend_empty_chord: bool = None,
+        processes: bool = False,
         skip_file_name: str = None,
         undo: bool = False,
+        workers: int = None,
     ) -> typing.Optional[typing.Tuple[int, int, typing.List[String]]]:
         """
         Activates ``tag`` in path.
@@ -809,76 +962,46 @@ class Path(pathlib.PosixPath):
 
         Third item in pair is list of canonical string messages that explain
         what happened.
+
+        Rewrites files in a pool of ``workers`` threads when ``workers`` is
+        greater than ``1``. Set ``processes`` to true to fork processes
+        instead; forking is safe only when no other threads are running.
+        Counts and messages do not depend on ``workers``.
+
+        Skips files whose modification time and size show that they are
+        unchanged since the same operation last left them in its target
+        state. Files modified within timestamp resolution of that check are
+        read again and compared by content hash. Operations with callable
+        tags are never skipped.
         """
         if isinstance(tag, str):
             raise Exception(f"must be tag or callable: {tag!r}")
         if self.name == skip_file_name:
             return None
         assert isinstance(indent, int), repr(indent)
-        if self.is_file():
-            if self.suffix not in (".ily", ".ly"):
-                count, skipped = 0, 0
-            else:
-                text = self.read_text()
-                if undo:
-                    text, count, skipped = deactivate(
-                        text,
-                        tag,
-                        prepend_empty_chord=prepend_empty_chord,
-                        skipped=True,
-                    )
-                else:
-                    text, count, skipped = activate(text, tag, skipped=True)
-                self.write_text(text)
-        else:
-            assert self.is_dir()
-            count, skipped = 0, 0
-            for path in sorted(self.glob("**/*")):
-                path = type(self)(path)
-                if path.suffix not in (".ily", ".ly"):
-                    continue
-                if not (
-                    path.name.startswith("illustration")
-                    or path.name.startswith("layout")
-                    or path.name.startswith("segment")
-                ):
-                    continue
-                if path.name == skip_file_name:
-                    continue
-                result = path.activate(
-                    tag, prepend_empty_chord=prepend_empty_chord, undo=undo
-                )
-                assert result is not None
-                count_, skipped_, _ = result
-                count += count_
-                skipped += skipped_
+        if not undo:
+            prepend_empty_chord = None
+        operations = [(undo, tag, prepend_empty_chord)]
+        paths = self._get_lilypond_files(skip_file_name=skip_file_name)
+        file_operations = [(_, operations) for _ in paths]
+        count, skipped = 0, 0
+        results = self._activate_files(
+            file_operations, workers=workers, processes=processes
+        )
+        for counts in results:
+            count_, skipped_ = counts[0]
+            count += count_
+            skipped += skipped_
         if name is None:
             name = str(tag)
-        if undo:
-            adjective = "inactive"
-            gerund = "deactivating"
-        else:
-            adjective = "active"
-            gerund = "activating"
-        messages = []
-        total = count + skipped
-        if total == 0 and message_zero:
-            messages.append(f"found no {name} tags")
-        if 0 < total:
-            tags = String("tag").pluralize(total)
-            messages.append(f"found {total} {name} {tags}")
-            if 0 < count:
-                tags = String("tag").pluralize(count)
-                message = f"{gerund} {count} {name} {tags}"
-                messages.append(message)
-            if 0 < skipped:
-                tags = String("tag").pluralize(skipped)
-                message = f"skipping {skipped} ({adjective}) {name} {tags}"
-                messages.append(message)
-        whitespace = indent * " "
-        messages_ = [
-            String(whitespace + String(_).capitalize_start() + " ...") for _ in messages
-        ]
+        messages_ = self._make_activation_messages(
+            count,
+            skipped,
+            indent=indent,
+            message_zero=message_zero,
+            name=name,
+            undo=undo,
+        )
         return count, skipped, messages_
 
     def add_buildspace_metadatum(self, name, value, document_name: str = None) -> None:
@@ -1132,7 +1255,9 @@ class Path(pathlib.PosixPath):
         message_zero: bool = False,
         name: str = None,
         prepend_empty_chord: bool = None,
+        processes: bool = False,
         skip_file_name: str = None,
+        workers: int = None,
     ) -> typing.Optional[typing.Tuple[int, int, typing.List[String]]]:
         """
         Deactivates ``tag`` in path.
@@ -1145,8 +1270,10 @@ class Path(pathlib.PosixPath):
             indent=indent,
             message_zero=message_zero,
             prepend_empty_chord=prepend_empty_chord,
+            processes=processes,
             skip_file_name=skip_file_name,
             undo=True,
+            workers=workers,
         )
 
     def extern(
@@ -0,0 +1,290 @@
+import typing
+
+from abjad.system.StorageFormatManager import StorageFormatManager
+from abjad.system.Tag import Tag
+
+
+class TagIndex(object):
+    r"""
+    Tag index of LilyPond text.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d' e' f'")
+        >>> markup = abjad.Markup('Allegro').with_color('red')
+        >>> abjad.attach(
+        ...     markup,
+        ...     staff[0],
+        ...     deactivate=True,
+        ...     tag=abjad.Tag('RED_MARKUP'),
+        ...     )
+        >>> abjad.attach(
+        ...     abjad.Dynamic('p'),
+        ...     staff[1],
+        ...     deactivate=True,
+        ...     tag=abjad.Tag('DYNAMIC:+SCORE'),
+        ...     )
+
+        >>> text = format(staff, 'lilypond')
+        >>> text = abjad.LilyPondFormatManager.left_shift_tags(text)
+        >>> print(text)
+        \new Staff {
+            c'4
+        %@% - \markup {         %! RED_MARKUP
+        %@%     \with-color     %! RED_MARKUP
+        %@%         #red        %! RED_MARKUP
+        %@%         Allegro     %! RED_MARKUP
+        %@%     }               %! RED_MARKUP
+            d'4
+        %@% \p                  %! DYNAMIC:+SCORE
+            e'4
+            f'4
+        }
+
+        Scans text once and maps each tag to the lines that carry it:
+
+        >>> index = abjad.TagIndex(text)
+        >>> index.tags
+        [Tag('+SCORE'), Tag('DYNAMIC'), Tag('RED_MARKUP')]
+
+        >>> index.get_line_ranges(abjad.Tag('RED_MARKUP'))
+        [(3, 8)]
+
+        >>> index.get_line_ranges(abjad.Tag('DYNAMIC'))
+        [(9, 10)]
+
+        Applies any number of activations and deactivations before text is
+        joined again:
+
+        >>> index.activate(abjad.Tag('RED_MARKUP'))
+        (1, 0)
+
+        >>> index.activate(lambda tags: abjad.Tag('+SCORE') in tags)
+        (1, 0)
+
+        >>> index.deactivate(abjad.Tag('RED_MARKUP'))
+        (1, 0)
+
+        >>> print(index.text)
+        \new Staff {
+            c'4
+        %@% - \markup {         %! RED_MARKUP
+        %@%     \with-color     %! RED_MARKUP
+        %@%         #red        %! RED_MARKUP
+        %@%         Allegro     %! RED_MARKUP
+        %@%     }               %! RED_MARKUP
+            d'4
+            \p                  %! DYNAMIC:+SCORE %@%
+            e'4
+            f'4
+        }
+
+    Activating and deactivating changes only ``%@%`` and ``%%%`` markers, so
+    the index stays valid as text changes.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Segment-makers"
+
+    __slots__ = ("_line_ranges", "_lines", "_lines_by_tags")
+
+    ### INITIALIZER ###
+
+    def __init__(self, text: str = "") -> None:
+        assert isinstance(text, str), repr(text)
+        lines = text.split("\n")
+        lines = [_ + "\n" for _ in lines[:-1]] + lines[-1:]
+        lines_by_tags: typing.Dict[typing.Tuple[Tag, ...], typing.List[int]] = {}
+        suffixes_to_tags: typing.Dict[str, typing.Tuple[Tag, ...]] = {}
+        words_to_tags: typing.Dict[str, Tag] = {}
+        for i, line in enumerate(lines):
+            position = line.find(" %! ")
+            if position == -1:
+                continue
+            suffix = line[position:]
+            if suffix not in suffixes_to_tags:
+                tags = []
+                for chunk in suffix.split(" %! ")[1:]:
+                    for word in chunk.split()[0].split(":"):
+                        if word not in words_to_tags:
+                            words_to_tags[word] = Tag(word)
+                        tags.append(words_to_tags[word])
+                suffixes_to_tags[suffix] = tuple(tags)
+            tags_ = suffixes_to_tags[suffix]
+            if tags_ not in lines_by_tags:
+                lines_by_tags[tags_] = []
+            lines_by_tags[tags_].append(i)
+        self._lines = lines
+        self._line_ranges: typing.Dict[Tag, typing.List[typing.Tuple[int, int]]] = {}
+        self._lines_by_tags = lines_by_tags
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _get_line_ranges(self, tag):
+        if tag not in self._line_ranges:
+            indices: typing.List[int] = []
+            for tags, indices_ in self._lines_by_tags.items():
+                if tag in tags:
+                    indices.extend(indices_)
+            indices.sort()
+            ranges: typing.List[typing.Tuple[int, int]] = []
+            for index in indices:
+                if ranges and ranges[-1][1] == index:
+                    ranges[-1] = (ranges[-1][0], index + 1)
+                else:
+                    ranges.append((index, index + 1))
+            self._line_ranges[tag] = ranges
+        return self._line_ranges[tag]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def tags(self) -> typing.List[Tag]:
+        """
+        Gets tags in text, sorted by string.
+        """
+        tags: typing.Set[Tag] = set()
+        for tags_ in self._lines_by_tags:
+            tags.update(tags_)
+        return sorted(tags, key=lambda _: str(_))
+
+    @property
+    def text(self) -> str:
+        """
+        Gets text.
+        """
+        return "".join(self._lines)
+
+    ### PUBLIC METHODS ###
+
+    def activate(
+        self, tag: typing.Union[Tag, typing.Callable]
+    ) -> typing.Tuple[int, int]:
+        """
+        Activates ``tag`` in text.
+
+        Returns count of deactivated tags activated together with count of
+        already-active tags skipped.
+        """
+        lines = self._lines
+        count, skipped_count = 0, 0
+        treated_last_line = False
+        found_already_active_on_last_line = False
+        last_line_index = None
+        suffix: typing.Optional[str]
+        for line_index in self.match(tag):
+            if last_line_index is None or line_index != last_line_index + 1:
+                treated_last_line = False
+                found_already_active_on_last_line = False
+            last_line_index = line_index
+            line = lines[line_index]
+            index = len(line) - len(line.lstrip())
+            if line[index : index + 4] in ("%%% ", "%@% "):
+                if "%@% " in line:
+                    line = line.replace("%@%", "   ")
+                    suffix = " %@%"
+                else:
+                    line = line.replace("%%%", "   ")
+                    suffix = None
+                assert line.endswith("\n"), repr(line)
+                if suffix:
+                    line = line.strip("\n") + suffix + "\n"
+                if not treated_last_line:
+                    count += 1
+                treated_last_line = True
+                found_already_active_on_last_line = False
+            else:
+                if not found_already_active_on_last_line:
+                    skipped_count += 1
+                found_already_active_on_last_line = True
+                treated_last_line = False
+            lines[line_index] = line
+        return count, skipped_count
+
+    def deactivate(
+        self, tag: typing.Union[Tag, typing.Callable], prepend_empty_chord: bool = False
+    ) -> typing.Tuple[int, int]:
+        """
+        Deactivates ``tag`` in text.
+
+        Returns count of active tags deactivated together with count of
+        already-deactivated tags skipped.
+        """
+        lines = self._lines
+        count, skipped_count = 0, 0
+        treated_last_line, last_index = False, None
+        found_already_deactivated_on_last_line = False
+        previous_line_was_tweak = False
+        last_line_index = None
+        for line_index in self.match(tag):
+            if last_line_index is None or line_index != last_line_index + 1:
+                treated_last_line, last_index = False, None
+                found_already_deactivated_on_last_line = False
+            last_line_index = line_index
+            line = lines[line_index]
+            index = len(line) - len(line.lstrip())
+            if line[index] != "%":
+                if last_index is None:
+                    last_index = index
+                if " %@%" in line:
+                    prefix = "%@% "
+                    line = line.replace(" %@%", "")
+                else:
+                    prefix = "%%% "
+                if prepend_empty_chord and not previous_line_was_tweak:
+                    prefix += "<> "
+                target = line[last_index - 4 : last_index]
+                assert target == "    ", repr((line, target, index, tag))
+                characters = list(line)
+                characters[last_index - 4 : last_index] = list(prefix)
+                line = "".join(characters)
+                if not treated_last_line:
+                    count += 1
+                treated_last_line = True
+                found_already_deactivated_on_last_line = False
+            else:
+                if not found_already_deactivated_on_last_line:
+                    skipped_count += 1
+                found_already_deactivated_on_last_line = True
+                treated_last_line = False
+            lines[line_index] = line
+            previous_line_was_tweak = "tweak" in line
+        return count, skipped_count
+
+    def get_line_ranges(self, tag: Tag) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Gets ranges of consecutive line indices that carry ``tag``.
+
+        Ranges are start-inclusive and stop-exclusive.
+        """
+        assert isinstance(tag, Tag), repr(tag)
+        return list(self._get_line_ranges(tag))
+
+    def match(self, predicate: typing.Union[Tag, typing.Callable]) -> typing.List[int]:
+        """
+        Gets indices of lines whose tags match ``predicate``.
+
+        Matches like ``Line.match()``. Calls ``predicate`` once for each
+        distinct sequence of tags in text.
+        """
+        if not callable(predicate) and not isinstance(predicate, Tag):
+            message = f"must be callable or tag: {predicate!r}"
+            raise Exception(message)
+        if isinstance(predicate, Tag):
+            ranges = self._get_line_ranges(predicate)
+            return [_ for start, stop in ranges for _ in range(start, stop)]
+        indices: typing.List[int] = []
+        for tags, indices_ in self._lines_by_tags.items():
+            if predicate in tags or predicate(list(tags)):
+                indices.extend(indices_)
+        indices.sort()
+        return indices
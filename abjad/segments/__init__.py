@@ -17,6 +17,7 @@ from .Section import Section
 from .SegmentMaker import SegmentMaker
 from .StringOrchestraScoreTemplate import StringOrchestraScoreTemplate
 from .StringQuartetScoreTemplate import StringQuartetScoreTemplate
+from .TagIndex import TagIndex
 from .TwoStaffPianoScoreTemplate import TwoStaffPianoScoreTemplate
 
 __all__ = [
@@ -35,5 +36,6 @@ __all__ = [
     "SegmentMaker",
     "StringOrchestraScoreTemplate",
     "StringQuartetScoreTemplate",
+    "TagIndex",
     "TwoStaffPianoScoreTemplate",
 ]
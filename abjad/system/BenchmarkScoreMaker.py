@@ -111,3 +111,160 @@ class BenchmarkScoreMaker(object):
             dynamic = abjad.Dynamic("f")
             abjad.attach(dynamic, note)
         return staff
+
+    def make_score_with_nested_tuplets_04(self):
+        """
+        Make 100,000-note staff of tuplets nested seven deep.
+
+        Iteration with explicit-stack traversal, compared to recursive
+        generators:
+
+            abjad.iterate(staff).leaves():                  1.56 s => 0.51 s
+            abjad.iterate(staff).components(grace=False):   3.57 s => 0.53 s
+
+        First offset update in integer ticks, compared to incremental
+        update with offsets:
+
+            abjad.inspect(staff[-1]).timespan():           27.15 s => 4.74 s
+
+        Single-pass wellformedness checks, compared to one traversal per
+        check:
+
+            abjad.Wellformedness()(staff):                 17.91 s => 1.77 s
+
+        """
+        import abjad
+
+        def make_tuplet(depth):
+            if depth == 0:
+                components = [abjad.Note("c'16"), abjad.Note("d'16")]
+            else:
+                components = [make_tuplet(depth - 1), abjad.Note("e'16")]
+            return abjad.Tuplet((2, 3), components)
+
+        tuplets = [make_tuplet(6) for _ in range(12500)]
+        staff = abjad.Staff(tuplets)
+        return staff
+
+    def make_staff_from_note_entry_string_05(self):
+        """
+        Make 10,000-note staff from string of notes and beams.
+
+        abjad.parse() with note entry fast path, compared to full LilyPond
+        grammar:
+
+            abjad.parse("{ c'8 [ d'8 e'8 f'8 ] ... }"):     11.40 s => 3.48 s
+
+        """
+        import abjad
+
+        string = " ".join(2500 * ["c'8 [ d'8 e'8 f'8 ]"])
+        staff = abjad.Staff(string)
+        return staff
+
+    def make_timespan_list_06(self, count=10000):
+        """
+        Make list of 10,000 random timespans.
+
+        Sweep-line timespan list operations, compared to pairwise
+        operations on timespans:
+
+            compute_logical_or() on 10,000 timespans:       6.40 s => 0.37 s
+            compute_logical_xor() on 10,000 timespans:    839.87 s => 1.06 s
+            partition() on 10,000 timespans:                0.97 s => 0.30 s
+            explode() on 1,500 timespans:                 585.63 s => 0.34 s
+            explode() on 10,000 timespans:               > 1,500 s => 3.70 s
+
+            compute_logical_or() on 100,000 timespans:     59.16 s => 3.58 s
+            partition() on 100,000 timespans:              11.16 s => 3.80 s
+            compute_logical_xor() on 100,000 timespans:              11.70 s
+            explode() on 100,000 timespans:                          48.34 s
+
+        """
+        import random
+
+        import abjad
+
+        random_ = random.Random(0)
+        timespans = []
+        for _ in range(count):
+            start_offset = abjad.Offset(random_.randint(0, 16 * count), 16)
+            duration = abjad.Duration(random_.randint(1, 64), 16)
+            timespan = abjad.Timespan(start_offset, start_offset + duration)
+            timespans.append(timespan)
+        return abjad.TimespanList(timespans)
+
+    def make_staff_of_unmetered_measures_07(self, count=300):
+        """
+        Make staff of 300 measures of notes with random durations.
+
+        Meter rewriting with cached meters and split plans, compared to
+        rebuilding meters and offset inventories per measure:
+
+            abjad.mutate(measure[:]).rewrite_meter() on each:  12.80 s => 11.56 s
+
+        Most remaining time is spent in leaf splitting.
+        """
+        import random
+
+        import abjad
+
+        random_ = random.Random(0)
+        measures = []
+        for _ in range(count):
+            pair = random_.choice([(4, 4), (3, 4), (6, 8), (5, 8), (7, 8)])
+            total = abjad.Duration(pair)
+            durations = []
+            while sum(durations) < total:
+                duration = abjad.Duration(random_.choice([1, 1, 2, 3, 3, 5, 7]), 16)
+                durations.append(min(duration, total - sum(durations)))
+            measure = abjad.Container(abjad.NoteMaker()([0], durations))
+            time_signature = abjad.TimeSignature(pair)
+            abjad.attach(time_signature, abjad.select(measure).leaf(0))
+            measures.append(measure)
+        staff = abjad.Staff(measures)
+        return staff
+
+    def make_score_with_instruments_08(self, count=500):
+        """
+        Make four-staff score of 12,000 notes with instruments, clefs, beams,
+        hairpins and text spanners.
+
+        Single-pass wellformedness checks, compared to one traversal per
+        check:
+
+            abjad.Wellformedness()(score):                 13.61 s => 4.52 s
+
+        Most remaining time is spent in effective indicator lookups.
+
+        Incremental checks with abjad.WellformednessCache(), compared to
+        single-pass checks:
+
+            check of unchanged score:                       5.18 s => 0.00 s
+            check after changing one pitch:                 5.18 s => 0.15 s
+            check after attaching one text span:            5.18 s => 1.58 s
+            check after attaching one clef:                 5.18 s => 3.08 s
+
+        Top-down copy with direct wrapper binding and copied offsets,
+        compared to recursive copy with attach() and append():
+
+            abjad.mutate(score).copy():                     5.49 s => 1.17 s
+
+        """
+        import abjad
+
+        score = abjad.Score()
+        instruments = [abjad.Violin(), abjad.Viola(), abjad.Cello(), abjad.Flute()]
+        for i, instrument in enumerate(instruments):
+            string = " ".join(count * ["c'8 [ d'8 e'8 f'8 ] g'4 a'4"])
+            voice = abjad.Voice(string, name=f"Voice_{i}")
+            leaves = abjad.select(voice).leaves()
+            abjad.attach(instrument, leaves[0])
+            abjad.attach(abjad.Clef("treble"), leaves[0])
+            for j in range(0, len(leaves) - 8, 12):
+                abjad.attach(abjad.StartHairpin("<"), leaves[j])
+                abjad.attach(abjad.Dynamic("f"), leaves[j + 4])
+                abjad.attach(abjad.StartTextSpan(), leaves[j + 1])
+                abjad.attach(abjad.StopTextSpan(), leaves[j + 6])
+            score.append(abjad.Staff([voice]))
+        return score
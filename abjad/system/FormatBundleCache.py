@@ -0,0 +1,83 @@
+from .ContextManager import ContextManager
+from .LilyPondFormatManager import LilyPondFormatManager
+
+
+class FormatBundleCache(ContextManager):
+    r"""
+    A context manager for caching LilyPond format bundles.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> abjad.attach(abjad.Articulation("accent"), staff[0])
+        >>> with abjad.FormatBundleCache():
+        ...     print(format(staff))
+        ...     abjad.attach(abjad.Articulation("tenuto"), staff[1])
+        ...     staff[2].written_pitch = "fs'"
+        ...     string = format(staff)
+        ...     print(string)
+        ...
+        \new Staff
+        {
+            c'4
+            - \accent
+            d'4
+            e'4
+            f'4
+        }
+        \new Staff
+        {
+            c'4
+            - \accent
+            d'4
+            - \tenuto
+            fs'4
+            f'4
+        }
+
+        Formatting after changes made inside the context manager gives the
+        same output as formatting without cached bundles:
+
+        >>> string == format(staff)
+        True
+
+    Reuses each component's format bundle while neither the component nor
+    any of its parents has been modified since the bundle was made.
+    Attaching and detaching indicators, changing wrapper tags and changing
+    written pitches invalidate the bundles of the components involved.
+    Overrides, settings, tweaks, effective indicators and structural changes
+    invalidate all cached bundles.
+
+    Cached bundles are kept on components between uses of the context
+    manager and are revalidated when next used.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Context managers"
+
+    __slots__ = ()
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        pass
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        """
+        Enters context manager and turns on format bundle caching.
+
+        Returns context manager.
+        """
+        LilyPondFormatManager._bundle_cache_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits context manager and turns off format bundle caching.
+
+        Returns none.
+        """
+        LilyPondFormatManager._bundle_cache_depth -= 1
@@ -1,4 +1,5 @@
 import cProfile
+import concurrent.futures
 import datetime
 import io
 import os
@@ -13,6 +14,7 @@ import typing
 
 from .AbjadConfiguration import AbjadConfiguration
 from .StorageFormatManager import StorageFormatManager
+from .Timer import Timer
 
 _configuration = AbjadConfiguration()
 
@@ -127,6 +129,38 @@ class IOManager(object):
             lines.append(line)
         return "\n".join(lines)
 
+    @staticmethod
+    def _run_lilypond(ly_path, flags, log_file_path, lilypond_path):
+        if not lilypond_path:
+            lilypond_paths = IOManager.find_executable("lilypond")
+            if lilypond_paths:
+                lilypond_path = lilypond_paths[0]
+            else:
+                lilypond_path = "lilypond"
+        lilypond_base, extension = os.path.splitext(ly_path)
+        flags = flags or ""
+        date = datetime.datetime.now().strftime("%c")
+        command = "{} {} -dno-point-and-click -o {} {}".format(
+            lilypond_path, flags, lilypond_base, ly_path
+        )
+        timer = Timer()
+        with timer:
+            process = subprocess.Popen(
+                command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            )
+            subprocess_output, _ = process.communicate()
+        subprocess_output_string = subprocess_output.decode(errors="ignore")
+        exit_code = process.returncode
+        with open(log_file_path, "w") as file_pointer:
+            file_pointer.write(date + "\n")
+            file_pointer.write(subprocess_output_string)
+        postscript_path = ly_path.replace(".ly", ".ps")
+        try:
+            os.remove(postscript_path)
+        except OSError:
+            pass
+        return exit_code, timer.elapsed_time
+
     @staticmethod
     def _warn_when_output_directory_almost_full(last_number):
         abjad_output_directory = _configuration["abjad_output_directory"]
@@ -630,42 +664,65 @@ class IOManager(object):
         file.
         """
         ly_path = str(ly_path)
-        lilypond_path = _configuration.get("lilypond_path")
-        if not lilypond_path:
-            lilypond_paths = IOManager.find_executable("lilypond")
-            if lilypond_paths:
-                lilypond_path = lilypond_paths[0]
-            else:
-                lilypond_path = "lilypond"
-        lilypond_base, extension = os.path.splitext(ly_path)
-        flags = flags or ""
-        date = datetime.datetime.now().strftime("%c")
+        lilypond_path = lilypond_path or _configuration.get("lilypond_path")
         if lilypond_log_file_path is None:
             log_file_path = _configuration.lilypond_log_file_path
         else:
             log_file_path = lilypond_log_file_path
-        command = "{} {} -dno-point-and-click -o {} {}".format(
-            lilypond_path, flags, lilypond_base, ly_path
-        )
-        process = subprocess.Popen(
-            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        exit_code, _ = IOManager._run_lilypond(
+            ly_path, flags, log_file_path, lilypond_path
         )
-        subprocess_output, _ = process.communicate()
-        subprocess_output_string = subprocess_output.decode(errors="ignore")
-        exit_code = process.returncode
-        with open(log_file_path, "w") as file_pointer:
-            file_pointer.write(date + "\n")
-            file_pointer.write(subprocess_output_string)
-        postscript_path = ly_path.replace(".ly", ".ps")
-        try:
-            os.remove(postscript_path)
-        except OSError:
-            pass
         # TODO: maybe just 'return exit_code'?
         if exit_code:
             return False
         return True
 
+    @staticmethod
+    def run_lilypond_many(
+        ly_paths: typing.Iterable[str],
+        *,
+        flags: str = None,
+        jobs: int = None,
+        lilypond_path: str = None,
+    ) -> typing.List[typing.Tuple[str, str, int, float]]:
+        """
+        Runs LilyPond on each of ``ly_paths`` with at most ``jobs`` LilyPond
+        processes at once.
+
+        Defaults ``jobs`` to the number of CPUs.
+
+        Writes LilyPond output for each ``.ly`` file to a log file of the
+        same name with ``.log`` extension; log files start with output of
+        Unix ``date``, as with ``IOManager.run_lilypond()``.
+
+        Returns list of (ly path, log file path, exit code, elapsed time)
+        tuples in the order of ``ly_paths``.
+        """
+        ly_paths = [str(_) for _ in ly_paths]
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        if not isinstance(jobs, int) or jobs < 1:
+            raise ValueError(f"jobs must be positive integer: {jobs!r}.")
+        lilypond_path = lilypond_path or _configuration.get("lilypond_path")
+        log_file_paths = [os.path.splitext(_)[0] + ".log" for _ in ly_paths]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    IOManager._run_lilypond,
+                    ly_path,
+                    flags,
+                    log_file_path,
+                    lilypond_path,
+                )
+                for ly_path, log_file_path in zip(ly_paths, log_file_paths)
+            ]
+            pairs = [_.result() for _ in futures]
+        results = []
+        for ly_path, log_file_path, pair in zip(ly_paths, log_file_paths, pairs):
+            exit_code, elapsed_time = pair
+            results.append((ly_path, log_file_path, exit_code, elapsed_time))
+        return results
+
     @staticmethod
     def save_last_ly_as(file_path: str) -> None:
         """
@@ -19,6 +19,10 @@ class LilyPondFormatManager(object):
 
     __slots__ = ()
 
+    _bundle_cache_depth = 0
+
+    _bundle_cache_generation = 0
+
     indent = 4 * " "
 
     ### SPECIAL METHODS ###
@@ -86,6 +90,22 @@ class LilyPondFormatManager(object):
         )
         return indicators
 
+    @staticmethod
+    def _get_bundle_cache_key(component):
+        import abjad
+
+        components = abjad.Parentage._get_cache(component)["components"]
+        counts = tuple(_._modification_count for _ in components)
+        return (
+            LilyPondFormatManager._bundle_cache_generation,
+            abjad.Component._parentage_generation,
+            counts,
+        )
+
+    @staticmethod
+    def _invalidate_bundle_caches():
+        LilyPondFormatManager._bundle_cache_generation += 1
+
     @staticmethod
     def _populate_context_setting_format_contributions(component, bundle):
         import abjad
@@ -272,8 +292,17 @@ class LilyPondFormatManager(object):
     def bundle_format_contributions(component) -> LilyPondFormatBundle:
         """
         Gets all format contributions for ``component``.
+
+        Reuses cached bundle inside ``abjad.FormatBundleCache()``; cached
+        bundles must not be changed.
         """
         manager = LilyPondFormatManager
+        if manager._bundle_cache_depth:
+            key = manager._get_bundle_cache_key(component)
+            if component._format_bundle is not None:
+                key_, bundle = component._format_bundle
+                if key_ == key:
+                    return bundle
         bundle = LilyPondFormatBundle()
         manager._populate_indicator_format_contributions(component, bundle)
         manager._populate_spanner_format_contributions(component, bundle)
@@ -281,6 +310,8 @@ class LilyPondFormatManager(object):
         manager._populate_grob_override_format_contributions(component, bundle)
         manager._populate_grob_revert_format_contributions(component, bundle)
         bundle.sort_overrides()
+        if manager._bundle_cache_depth:
+            component._format_bundle = (key, bundle)
         return bundle
 
     @staticmethod
@@ -369,6 +400,46 @@ class LilyPondFormatManager(object):
             argument = Scheme(argument, quoting="'")
         return format(argument, "lilypond")
 
+    @staticmethod
+    def format_to(argument, stream, strict=None) -> None:
+        r"""
+        Writes LilyPond format of ``argument`` to ``stream``.
+
+        ..  container:: example
+
+            >>> import io
+            >>> staff = abjad.Staff("c'4 d'4")
+            >>> stream = io.StringIO()
+            >>> abjad.LilyPondFormatManager.format_to(staff, stream)
+            >>> print(stream.getvalue())
+            \new Staff
+            {
+                c'4
+                d'4
+            }
+
+            >>> stream.getvalue() == format(staff, "lilypond")
+            True
+
+        Writes the same text as ``format(argument, "lilypond")``. Components
+        and LilyPond files write one line at a time instead of building the
+        entire format string in memory.
+
+        Aligns tags at column ``strict`` when ``strict`` is an integer.
+        """
+        if strict is not None:
+            assert isinstance(strict, int), repr(strict)
+        if hasattr(argument, "_iterate_lilypond_format"):
+            strings = argument._iterate_lilypond_format()
+        else:
+            strings = iter([format(argument, "lilypond")])
+        for i, string in enumerate(strings):
+            if isinstance(strict, int):
+                string = LilyPondFormatManager.align_tags(string, strict)
+            if 0 < i:
+                stream.write("\n")
+            stream.write(string)
+
     @staticmethod
     def left_shift_tags(text, realign=None) -> str:
         """
@@ -1,9 +1,11 @@
 import abc
+import contextlib
 import logging
 import os
 import pickle
 import sys
 import traceback
+import typing
 
 import ply  # type: ignore
 from ply import yacc  # type: ignore
@@ -23,6 +25,8 @@ class Parser(object):
 
     __slots__ = ("_debug", "_lexer", "_logger", "_parser")
 
+    _idle_parsers: typing.Dict = {}
+
     _is_abstract = True
 
     ### INITIALIZER ###
@@ -48,6 +52,11 @@ class Parser(object):
             debug=self.debug, debuglog=self.logger, object=self.lexer_rules_object,
         )
 
+        if not self.debug:
+            self._parser = self._read_packaged_tables()
+            if self._parser is not None:
+                return
+
         if self.pickle_path and not os.path.exists(self.pickle_path):
             try:
                 directory, _ = os.path.split(self.pickle_path)
@@ -74,6 +83,7 @@ class Parser(object):
         Parse ``string`` and return result.
         """
 
+        self._reset_lexer()
         if hasattr(self, "_setup"):
             self._setup()
 
@@ -88,6 +98,55 @@ class Parser(object):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    @contextlib.contextmanager
+    def _get_pooled_parser(class_, **keywords):
+        """
+        Gets parser from process-wide pool of idle parsers.
+
+        Pool is keyed by parser class and ``keywords`` (like
+        ``default_language``). Makes new parser when no idle parser is
+        available, as when parsers call themselves recursively. Returns parser
+        to pool on exit.
+        """
+        key = (class_, tuple(sorted(keywords.items())))
+        parsers = Parser._idle_parsers.setdefault(key, [])
+        try:
+            parser = parsers.pop()
+        except IndexError:
+            parser = class_(**keywords)
+        try:
+            yield parser
+        finally:
+            parsers.append(parser)
+
+    def _read_packaged_tables(self):
+        path = self.packaged_pickle_path
+        if not os.path.exists(path):
+            return None
+        module = self.parser_rules_object
+        dictionary = dict((_, getattr(module, _)) for _ in dir(module))
+        reflection = yacc.ParserReflect(dictionary, log=yacc.NullLogger())
+        reflection.get_all()
+        if reflection.error:
+            return None
+        table = yacc.LRTable()
+        try:
+            signature = table.read_pickle(path)
+        except Exception:
+            return None
+        if signature != reflection.signature():
+            return None
+        table.bind_callables(reflection.pdict)
+        return yacc.LRParser(table, reflection.error_func)
+
+    def _reset_lexer(self):
+        self._lexer.lexstatestack = []
+        self._lexer.begin("INITIAL")
+        self._lexer.lineno = 1
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, string):
@@ -98,6 +157,22 @@ class Parser(object):
         for token in self.lexer:
             print(token)
 
+    def write_packaged_tables(self):
+        """
+        Writes parser's parsing tables to packaged pickle path.
+
+        Run after changing grammar rules so that parsers load tables shipped
+        with Abjad instead of generating tables on first use.
+        """
+        if os.path.exists(self.packaged_pickle_path):
+            os.remove(self.packaged_pickle_path)
+        ply.yacc.yacc(
+            debug=False,
+            errorlog=yacc.NullLogger(),
+            module=self.parser_rules_object,
+            picklefile=self.packaged_pickle_path,
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -156,6 +231,15 @@ class Parser(object):
                 return None
         return output_path
 
+    @property
+    def packaged_pickle_path(self):
+        """
+        Gets path of parsing tables shipped with Abjad.
+        """
+        directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        file_name = f"parse_tables_{type(self).__name__}.pkl"
+        return os.path.join(directory, "parser", "tables", file_name)
+
     @property
     def parser(self):
         """
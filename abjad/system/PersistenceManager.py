@@ -4,6 +4,7 @@ import shutil
 import tempfile
 
 from .IOManager import IOManager
+from .RenderCache import RenderCache
 from .StorageFormatManager import StorageFormatManager
 from .Timer import Timer
 
@@ -41,6 +42,23 @@ class PersistenceManager(object):
         """
         return StorageFormatManager(self).get_repr_format()
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _run_lilypond(ly_file_path, flags=None):
+        cache = RenderCache()
+        with open(ly_file_path) as file_pointer:
+            string = file_pointer.read()
+        directory = os.path.dirname(ly_file_path)
+        key = cache.get_key(string, flags=flags, directory=directory)
+        prefix = os.path.splitext(ly_file_path)[0]
+        if key is not None and cache.restore(key, prefix):
+            return True
+        success = IOManager.run_lilypond(ly_file_path, flags=flags)
+        if success and key is not None:
+            cache.store(key, prefix, since=os.path.getmtime(ly_file_path))
+        return success
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -55,13 +73,21 @@ class PersistenceManager(object):
     ### PUBLIC METHODS ###
 
     def as_ly(
-        self, ly_file_path=None, illustrate_function=None, strict=None, **keywords,
+        self,
+        ly_file_path=None,
+        illustrate_function=None,
+        strict=None,
+        streaming=None,
+        **keywords,
     ):
         """
         Persists client as LilyPond file.
 
         Autogenerates file path when ``ly_file_path`` is none.
 
+        Writes LilyPond output to file line by line when ``streaming`` is
+        true; elapsed time then includes writing.
+
         ..  container:: example
 
             >>> staff = abjad.Staff("c'4 e'4 d'4 f'4")
@@ -92,6 +118,14 @@ class PersistenceManager(object):
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith(".ly"), ly_file_path
         timer = abjad.Timer()
+        if streaming:
+            directory = os.path.dirname(ly_file_path)
+            abjad.IOManager._ensure_directory_existence(directory)
+            with timer, open(ly_file_path, "w") as file_pointer:
+                abjad.LilyPondFormatManager.format_to(
+                    lilypond_file, file_pointer, strict=strict
+                )
+            return ly_file_path, timer.elapsed_time
         with timer:
             string = lilypond_file.__format__(format_specification="lilypond")
             if isinstance(strict, int):
@@ -135,7 +169,7 @@ class PersistenceManager(object):
         ly_file_path, abjad_formatting_time = result
         timer = Timer()
         with timer:
-            success = IOManager.run_lilypond(ly_file_path)
+            success = self._run_lilypond(ly_file_path)
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -204,7 +238,7 @@ class PersistenceManager(object):
         pdf_file_path = "{}.pdf".format(without_extension)
         timer = abjad.Timer()
         with timer:
-            success = abjad.IOManager.run_lilypond(ly_file_path)
+            success = self._run_lilypond(ly_file_path)
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -293,7 +327,7 @@ class PersistenceManager(object):
 
         timer = abjad.Timer()
         with timer:
-            success = abjad.IOManager.run_lilypond(temporary_ly_file_path, flags=flags)
+            success = self._run_lilypond(temporary_ly_file_path, flags=flags)
         lilypond_rendering_time = timer.elapsed_time
 
         png_file_paths = []
@@ -0,0 +1,244 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import typing
+
+from .AbjadConfiguration import AbjadConfiguration
+from .StorageFormatManager import StorageFormatManager
+
+_configuration = AbjadConfiguration()
+
+
+class RenderCache(object):
+    """
+    Render cache.
+
+    ..  container:: example
+
+        >>> cache = abjad.RenderCache(directory="/tmp/render-cache")
+        >>> cache
+        RenderCache(directory='/tmp/render-cache', maximum_size=268435456)
+
+    Content-addressed cache of LilyPond output files.
+
+    Keys hash LilyPond input, files included by LilyPond input, LilyPond
+    version and LilyPond flags. Entries live in the ``.render-cache``
+    directory of the Abjad output directory unless ``directory`` is given.
+    Least recently used entries are evicted when the total size of cached
+    files exceeds ``maximum_size`` bytes.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Managers"
+
+    __slots__ = ("_directory", "_maximum_size")
+
+    _date_time_pattern = re.compile(r"^% \d{4}-\d{2}-\d{2} \d{2}:\d{2}$", re.MULTILINE)
+
+    _include_pattern = re.compile(r'\\include\s+"([^"]+)"')
+
+    _lilypond_version_string: typing.Optional[str] = None
+
+    _output_suffix_pattern = re.compile(
+        r"^(-page\d+|-\d+|\.preview)?\.(eps|midi?|pdf|png|svg)$"
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, directory: str = None, maximum_size: int = 256 * 1024 ** 2
+    ) -> None:
+        if directory is None:
+            directory = os.path.join(
+                _configuration.abjad_output_directory, ".render-cache"
+            )
+        self._directory = str(directory)
+        assert isinstance(maximum_size, int), repr(maximum_size)
+        assert 0 <= maximum_size, repr(maximum_size)
+        self._maximum_size = maximum_size
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return StorageFormatManager(self).get_repr_format()
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(_.path) for _ in os.scandir(path))
+            entries.append((os.path.getmtime(path), path, size))
+            total_size += size
+        entries.sort()
+        for _, path, size in entries:
+            if total_size <= self.maximum_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    @staticmethod
+    def _get_include_directories(flags):
+        directories = []
+        words = flags.split()
+        for i, word in enumerate(words):
+            if word.startswith("--include="):
+                directories.append(word[len("--include=") :])
+            elif word.startswith("-I") and 2 < len(word):
+                directories.append(word[2:])
+            elif word in ("-I", "--include") and i + 1 < len(words):
+                directories.append(words[i + 1])
+        return directories
+
+    @staticmethod
+    def _hash_includes(string, directories, hasher, visited):
+        for name in RenderCache._include_pattern.findall(string):
+            hasher.update(name.encode())
+            for directory in directories:
+                path = os.path.abspath(os.path.join(directory, name))
+                if os.path.isfile(path):
+                    break
+            else:
+                return False
+            if path in visited:
+                continue
+            visited.add(path)
+            with open(path, "rb") as file_pointer:
+                bytes_ = file_pointer.read()
+            hasher.update(bytes_)
+            directories_ = [os.path.dirname(path)] + directories
+            string_ = bytes_.decode(errors="ignore")
+            if not RenderCache._hash_includes(string_, directories_, hasher, visited):
+                return False
+        return True
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets cache directory.
+        """
+        return self._directory
+
+    @property
+    def maximum_size(self) -> int:
+        """
+        Gets maximum size of cached files in bytes.
+        """
+        return self._maximum_size
+
+    ### PUBLIC METHODS ###
+
+    def get_key(
+        self, string: str, flags: str = None, directory: str = None
+    ) -> typing.Optional[str]:
+        r"""
+        Gets key of LilyPond input ``string`` rendered with ``flags``.
+
+        ..  container:: example
+
+            >>> cache = abjad.RenderCache(directory="/tmp/render-cache")
+            >>> key_1 = cache.get_key(r"\score { { c'4 } }")
+            >>> key_2 = cache.get_key(r"\score { { c'4 } }", flags="--png")
+            >>> key_1 == key_2
+            False
+
+        Ignores date-time token comment lines. Hashes files included by
+        ``string`` relative to ``directory`` and to include directories given
+        in ``flags``.
+
+        Gets LilyPond version once per process.
+
+        Returns none when an included file can not be found there: LilyPond
+        may find it elsewhere, and output must not be cached without hashing
+        it.
+        """
+        flags = flags or ""
+        hasher = hashlib.sha256()
+        version = RenderCache._lilypond_version_string
+        if version is None:
+            version = AbjadConfiguration.get_lilypond_version_string()
+            RenderCache._lilypond_version_string = version
+        hasher.update(version.encode() + b"\0")
+        hasher.update(flags.encode() + b"\0")
+        string = self._date_time_pattern.sub("%", string)
+        hasher.update(string.encode() + b"\0")
+        directories = [directory or os.curdir]
+        directories.extend(self._get_include_directories(flags))
+        if not self._hash_includes(string, directories, hasher, set()):
+            return None
+        return hasher.hexdigest()
+
+    def restore(self, key: str, prefix: str) -> typing.List[str]:
+        """
+        Copies files cached under ``key`` to paths starting with ``prefix``.
+
+        Returns list of restored paths, including path of cached log; empty
+        when ``key`` is not cached.
+        """
+        path = os.path.join(self.directory, key)
+        try:
+            names = sorted(os.listdir(path))
+        except OSError:
+            return []
+        paths = []
+        for name in names:
+            target_path = f"{prefix}{name}"
+            shutil.copy(os.path.join(path, name), target_path)
+            paths.append(target_path)
+        os.utime(path)
+        return paths
+
+    def store(
+        self, key: str, prefix: str, since: float = None, log: str = None
+    ) -> None:
+        """
+        Caches LilyPond output files starting with ``prefix`` under ``key``.
+
+        Skips files modified before ``since`` when ``since`` is not none.
+        Caches ``log`` together with output files when ``log`` is not none;
+        restoring writes it to path ending in ``.log``.
+        """
+        directory, base = os.path.split(prefix)
+        directory = directory or os.curdir
+        paths = []
+        for name in os.listdir(directory):
+            if not name.startswith(base):
+                continue
+            suffix = name[len(base) :]
+            if not self._output_suffix_pattern.match(suffix):
+                continue
+            path = os.path.join(directory, name)
+            if since is not None and os.path.getmtime(path) < since:
+                continue
+            paths.append((suffix, path))
+        if not paths:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        temporary_directory = tempfile.mkdtemp(dir=self.directory, prefix=".")
+        for suffix, path in paths:
+            shutil.copy(path, os.path.join(temporary_directory, suffix))
+        if log is not None:
+            with open(os.path.join(temporary_directory, ".log"), "w") as pointer:
+                pointer.write(log)
+        path = os.path.join(self.directory, key)
+        try:
+            os.rename(temporary_directory, path)
+        except OSError:
+            log_path = os.path.join(path, ".log")
+            if log is not None and os.path.isdir(path):
+                if not os.path.exists(log_path):
+                    os.replace(os.path.join(temporary_directory, ".log"), log_path)
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+        self._evict()
@@ -1,4 +1,6 @@
-from abjad import mathtools
+import bisect
+import math
+
 from abjad.indicators.MetronomeMark import MetronomeMark
 from abjad.indicators.TimeSignature import TimeSignature
 from abjad.timespans import AnnotatedTimespan, TimespanList
@@ -43,6 +45,21 @@ class UpdateManager(object):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _can_update_offsets_incrementally(root):
+        """
+        Is true when root offsets are stale; stale offsets below current
+        root can only come from grace music attached after the last update.
+        """
+        from abjad.core.AfterGraceContainer import AfterGraceContainer
+        from abjad.core.BeforeGraceContainer import BeforeGraceContainer
+        from abjad.core.OnBeatGraceContainer import OnBeatGraceContainer
+
+        prototype = (AfterGraceContainer, BeforeGraceContainer, OnBeatGraceContainer)
+        if isinstance(root, prototype):
+            return False
+        return not root._offsets_are_current
+
     @staticmethod
     def _get_after_grace_leaf_offsets(leaf):
         container = leaf._parent
@@ -87,39 +104,12 @@ class UpdateManager(object):
         return start_offset, stop_offset
 
     def _get_measure_start_offsets(self, component):
-        wrappers = []
-        prototype = TimeSignature
         root = abjad_inspect(component).parentage().root
-        for component_ in self._iterate_entire_score(root):
-            wrappers_ = abjad_inspect(component_).wrappers(prototype)
-            wrappers.extend(wrappers_)
-        pairs = []
-        for wrapper in wrappers:
-            component = wrapper.component
-            start_offset = abjad_inspect(component).timespan().start_offset
-            time_signature = wrapper.indicator
-            pair = start_offset, time_signature
-            pairs.append(pair)
-        offset_zero = Offset(0)
-        default_time_signature = TimeSignature((4, 4))
-        default_pair = (offset_zero, default_time_signature)
-        if pairs and not pairs[0] == offset_zero:
-            pairs.insert(0, default_pair)
-        elif not pairs:
-            pairs = [default_pair]
-        pairs.sort(key=lambda x: x[0])
-        score_stop_offset = abjad_inspect(root).timespan().stop_offset
-        dummy_last_pair = (score_stop_offset, None)
-        pairs.append(dummy_last_pair)
-        measure_start_offsets = []
-        for current_pair, next_pair in Sequence(pairs).nwise():
-            current_start_offset, current_time_signature = current_pair
-            next_start_offset, next_time_signature = next_pair
-            measure_start_offset = current_start_offset
-            while measure_start_offset < next_start_offset:
-                measure_start_offsets.append(measure_start_offset)
-                measure_start_offset += current_time_signature.duration
-        return measure_start_offsets
+        root._update_now(offsets=True)
+        if root._measure_start_offsets is None:
+            measure_start_offsets = self._make_measure_start_offsets(root)
+            root._measure_start_offsets = measure_start_offsets
+        return root._measure_start_offsets
 
     @staticmethod
     def _get_on_beat_grace_leaf_offsets(leaf):
@@ -165,6 +155,14 @@ class UpdateManager(object):
             offsets_in_seconds_are_current,
         )
 
+    @staticmethod
+    def _grace_offsets_are_current(component):
+        for name in ("_before_grace_container", "_after_grace_container"):
+            container = getattr(component, name, None)
+            if container is not None and not container._offsets_are_current:
+                return False
+        return True
+
     @staticmethod
     def _iterate_entire_score(root):
         """
@@ -175,6 +173,40 @@ class UpdateManager(object):
         components.extend(graces)
         return components
 
+    def _make_measure_start_offsets(self, root):
+        wrappers = []
+        prototype = TimeSignature
+        for component_ in self._iterate_entire_score(root):
+            wrappers_ = abjad_inspect(component_).wrappers(prototype)
+            wrappers.extend(wrappers_)
+        pairs = []
+        for wrapper in wrappers:
+            component = wrapper.component
+            start_offset = abjad_inspect(component).timespan().start_offset
+            time_signature = wrapper.indicator
+            pair = start_offset, time_signature
+            pairs.append(pair)
+        offset_zero = Offset(0)
+        default_time_signature = TimeSignature((4, 4))
+        default_pair = (offset_zero, default_time_signature)
+        if pairs and not pairs[0] == offset_zero:
+            pairs.insert(0, default_pair)
+        elif not pairs:
+            pairs = [default_pair]
+        pairs.sort(key=lambda x: x[0])
+        score_stop_offset = abjad_inspect(root).timespan().stop_offset
+        dummy_last_pair = (score_stop_offset, None)
+        pairs.append(dummy_last_pair)
+        measure_start_offsets = []
+        for current_pair, next_pair in Sequence(pairs).nwise():
+            current_start_offset, current_time_signature = current_pair
+            next_start_offset, next_time_signature = next_pair
+            measure_start_offset = current_start_offset
+            while measure_start_offset < next_start_offset:
+                measure_start_offsets.append(measure_start_offset)
+                measure_start_offset += current_time_signature.duration
+        return measure_start_offsets
+
     def _make_metronome_mark_map(self, root):
         pairs = []
         all_stop_offsets = set()
@@ -215,7 +247,6 @@ class UpdateManager(object):
             clocktime_start_offset += clocktime_duration
         return timespans
 
-    # TODO: reimplement with some type of bisection
     def _to_measure_number(self, component, measure_start_offsets):
         component_start_offset = abjad_inspect(component).timespan().start_offset
         displacement = component_start_offset.displacement
@@ -225,14 +256,9 @@ class UpdateManager(object):
             if displacement < 0 and component_start_offset == 0:
                 measure_number = 0
                 return measure_number
-        measure_start_offsets = measure_start_offsets[:]
-        measure_start_offsets.append(mathtools.Infinity())
-        pairs = Sequence(measure_start_offsets)
-        pairs = pairs.nwise()
-        for measure_index, pair in enumerate(pairs):
-            if pair[0] <= component_start_offset < pair[-1]:
-                measure_number = measure_index + 1
-                return measure_number
+        measure_number = bisect.bisect(measure_start_offsets, component_start_offset)
+        if 0 < measure_number:
+            return measure_number
         message = f"can not find measure number for {repr(component)}:\n"
         message += f"   {repr(measure_start_offsets)}"
         raise ValueError(message)
@@ -274,44 +300,54 @@ class UpdateManager(object):
     def _update_all_offsets_in_seconds(self, root):
         self._update_all_offsets(root)
         timespans = self._make_metronome_mark_map(root)
+        start_offsets = [_.start_offset for _ in timespans or []]
         for component in self._iterate_entire_score(root):
-            self._update_clocktime_offsets(component, timespans)
+            self._update_clocktime_offsets(component, timespans, start_offsets)
             component._offsets_in_seconds_are_current = True
 
     @staticmethod
-    def _update_clocktime_offsets(component, timespans):
+    def _update_clocktime_offsets(component, timespans, start_offsets):
+        """
+        Bisects ``start_offsets`` of (contiguous) metronome mark
+        ``timespans`` to find the timespans in which component starts and
+        stops.
+        """
         if not timespans:
             return
-        for timespan in timespans:
-            if timespan.start_offset <= component._start_offset < timespan.stop_offset:
-                pair = timespan.annotation
-                clocktime_start_offset, clocktime_duration = pair
-                local_offset = component._start_offset - timespan.start_offset
-                multiplier = local_offset / timespan.duration
-                duration = multiplier * clocktime_duration
-                offset = clocktime_start_offset + duration
-                component._start_offset_in_seconds = Offset(offset)
-            if timespan.start_offset <= component._stop_offset < timespan.stop_offset:
-                pair = timespan.annotation
-                clocktime_start_offset, clocktime_duration = pair
-                local_offset = component._stop_offset - timespan.start_offset
-                multiplier = local_offset / timespan.duration
-                duration = multiplier * clocktime_duration
-                offset = clocktime_start_offset + duration
-                component._stop_offset_in_seconds = Offset(offset)
-                return
+        index = bisect.bisect(start_offsets, component._start_offset) - 1
+        if 0 <= index and component._start_offset < timespans[index].stop_offset:
+            timespan = timespans[index]
+            pair = timespan.annotation
+            clocktime_start_offset, clocktime_duration = pair
+            local_offset = component._start_offset - timespan.start_offset
+            multiplier = local_offset / timespan.duration
+            duration = multiplier * clocktime_duration
+            offset = clocktime_start_offset + duration
+            component._start_offset_in_seconds = Offset(offset)
+        index = bisect.bisect(start_offsets, component._stop_offset) - 1
+        if 0 <= index and component._stop_offset < timespans[index].stop_offset:
+            timespan = timespans[index]
+            pair = timespan.annotation
+            clocktime_start_offset, clocktime_duration = pair
+            local_offset = component._stop_offset - timespan.start_offset
+            multiplier = local_offset / timespan.duration
+            duration = multiplier * clocktime_duration
+            offset = clocktime_start_offset + duration
+            component._stop_offset_in_seconds = Offset(offset)
+            return
         if component._stop_offset == timespans[-1].stop_offset:
             pair = timespans[-1].annotation
             clocktime_start_offset, clocktime_duration = pair
             offset = clocktime_start_offset + clocktime_duration
             component._stop_offset_in_seconds = Offset(offset)
             return
-        raise Exception(f"can not find {offset} in {timespans}.")
+        raise Exception(f"can not find {component._stop_offset} in {timespans}.")
 
     @classmethod
     def _update_component_offsets(class_, component):
         from abjad.core.AfterGraceContainer import AfterGraceContainer
         from abjad.core.BeforeGraceContainer import BeforeGraceContainer
+        from abjad.core.Context import Context
         from abjad.core.OnBeatGraceContainer import OnBeatGraceContainer
 
         if isinstance(component, BeforeGraceContainer):
@@ -371,6 +407,24 @@ class UpdateManager(object):
         component._stop_offset = stop_offset
         component._timespan._start_offset = start_offset
         component._timespan._stop_offset = stop_offset
+        if isinstance(component, Context):
+            component._effective_indicator_index = None
+
+    def _update_grace_offsets(self, leaf):
+        before_grace_container = getattr(leaf, "_before_grace_container", None)
+        after_grace_container = getattr(leaf, "_after_grace_container", None)
+        if before_grace_container is not None:
+            self._update_all_offsets(before_grace_container)
+            # after grace music of preceding leaf depends on duration of
+            # this leaf's before grace music:
+            previous = leaf._get_sibling(-1)
+            if previous is not None:
+                for component in previous._get_descendants_stopping_with():
+                    container = getattr(component, "_after_grace_container", None)
+                    if container is not None:
+                        self._update_all_offsets(container)
+        if after_grace_container is not None:
+            self._update_all_offsets(after_grace_container)
 
     def _update_measure_numbers(self, component):
         measure_start_offsets = self._get_measure_start_offsets(component)
@@ -379,6 +433,11 @@ class UpdateManager(object):
             measure_number = self._to_measure_number(component, measure_start_offsets)
             component._measure_number = measure_number
 
+    def _update_measure_number(self, component):
+        measure_start_offsets = self._get_measure_start_offsets(component)
+        measure_number = self._to_measure_number(component, measure_start_offsets)
+        component._measure_number = measure_number
+
     def _update_now(
         self, component, offsets=False, offsets_in_seconds=False, indicators=False,
     ):
@@ -396,8 +455,170 @@ class UpdateManager(object):
             ) = self._get_score_tree_state_flags(parentage)
         root = parentage.root
         if offsets and not offsets_are_current:
-            self._update_all_offsets(root)
+            if self._can_update_offsets_incrementally(root):
+                self._update_offsets_incrementally(root)
+            else:
+                self._update_all_offsets(root)
         if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(root)
         if indicators and not indicators_are_current:
             self._update_all_indicators(root)
+
+    @staticmethod
+    def _update_offsets_in_ticks(component, start_offset):
+        """
+        Updates offsets of ``component`` and of every descendant of
+        ``component`` in integer ticks.
+
+        Takes one tick equal to one over the least common multiple of the
+        denominators of ``start_offset`` and of every prolated leaf duration.
+        Sums durations as integer tick counts and makes one offset for each
+        distinct tick count at the end.
+
+        Returns false without changing offsets when ``component`` or any
+        descendant of ``component`` is current, carries grace music or
+        belongs to on-beat grace music. Returns true otherwise.
+
+        Produces the same offsets as ``_update_offsets_incrementally()``.
+        """
+        from abjad.core.Container import Container
+        from abjad.core.Context import Context
+        from abjad.core.OnBeatGraceContainer import OnBeatGraceContainer
+
+        if start_offset.displacement is not None:
+            return False
+        default = Multiplier(1)
+        if component._parent is not None:
+            prolation = abjad_inspect(component._parent).parentage().prolation
+        else:
+            prolation = default
+        denominator = start_offset.denominator
+        components, durations = [], {}
+        stack = [(component, prolation)]
+        while stack:
+            component_, prolation = stack.pop()
+            if component_._offsets_are_current:
+                return False
+            components.append(component_)
+            if isinstance(component_, Container):
+                if (
+                    isinstance(component_, OnBeatGraceContainer)
+                    or component_._is_on_beat_wrapper()
+                ):
+                    return False
+                prolation *= getattr(component_, "implied_prolation", default)
+                for child in reversed(component_):
+                    stack.append((child, prolation))
+                continue
+            if (
+                getattr(component_, "_before_grace_container", None) is not None
+                or getattr(component_, "_after_grace_container", None) is not None
+            ):
+                return False
+            duration = component_._get_multiplied_duration()
+            numerator = prolation.numerator * duration.numerator
+            denominator_ = prolation.denominator * duration.denominator
+            divisor = math.gcd(numerator, denominator_)
+            numerator //= divisor
+            denominator_ //= divisor
+            durations[id(component_)] = (numerator, denominator_)
+            denominator *= denominator_ // math.gcd(denominator, denominator_)
+        for component_ in reversed(components):
+            if not isinstance(component_, Container):
+                numerator, denominator_ = durations[id(component_)]
+                durations[id(component_)] = numerator * (denominator // denominator_)
+            elif component_.simultaneous:
+                durations[id(component_)] = max(
+                    [0] + [durations[id(_)] for _ in component_]
+                )
+            else:
+                durations[id(component_)] = sum(durations[id(_)] for _ in component_)
+        offsets = {}
+        start_ticks = {
+            id(component): start_offset.numerator
+            * (denominator // start_offset.denominator)
+        }
+        for component_ in components:
+            ticks = start_ticks[id(component_)]
+            stop_ticks = ticks + durations[id(component_)]
+            if isinstance(component_, Container):
+                simultaneous = component_.simultaneous
+                for child in component_:
+                    start_ticks[id(child)] = ticks
+                    if not simultaneous:
+                        ticks += durations[id(child)]
+            ticks = start_ticks[id(component_)]
+            if ticks not in offsets:
+                offsets[ticks] = Offset(ticks, denominator)
+            if stop_ticks not in offsets:
+                offsets[stop_ticks] = Offset(stop_ticks, denominator)
+            start_offset_ = offsets[ticks]
+            stop_offset_ = offsets[stop_ticks]
+            component_._start_offset = start_offset_
+            component_._stop_offset = stop_offset_
+            component_._timespan._start_offset = start_offset_
+            component_._timespan._stop_offset = stop_offset_
+            if isinstance(component_, Context):
+                component_._effective_indicator_index = None
+            component_._offsets_are_current = True
+        return True
+
+    def _update_offsets_incrementally(self, component, start_offset=None):
+        """
+        Updates offsets of ``component`` and of every stale or shifted
+        descendant of ``component``.
+
+        Skips descendants that are current and whose start offset is
+        unchanged: the stop offsets cached on children serve as prefix sums
+        of child durations, so stop offsets of containers are summed from
+        children instead of recomputed from contents.
+
+        Produces the same offsets as ``_update_all_offsets()``.
+        """
+        from abjad.core.Container import Container
+        from abjad.core.Context import Context
+
+        if not isinstance(component, Container):
+            self._update_component_offsets(component)
+            component._offsets_are_current = True
+            self._update_grace_offsets(component)
+            return
+        if component._is_on_beat_wrapper():
+            self._update_all_offsets(component)
+            return
+        if start_offset is None:
+            previous = component._sibling(-1)
+            if previous is not None:
+                start_offset = previous._stop_offset
+            else:
+                start_offset = Offset(0)
+        if not component._offsets_are_current and self._update_offsets_in_ticks(
+            component, start_offset
+        ):
+            return
+        simultaneous = component.simultaneous
+        duration = Duration(0)
+        child_start_offset = start_offset
+        for child in component:
+            if not (
+                child._offsets_are_current
+                and child._start_offset == child_start_offset
+                and self._grace_offsets_are_current(child)
+            ):
+                self._update_offsets_incrementally(
+                    child, start_offset=child_start_offset
+                )
+            child_duration = child._stop_offset - child._start_offset
+            if simultaneous:
+                duration = max(duration, child_duration)
+            else:
+                duration += child_duration
+                child_start_offset = child._stop_offset
+        stop_offset = start_offset + duration
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+        if isinstance(component, Context):
+            component._effective_indicator_index = None
+        component._offsets_are_current = True
@@ -0,0 +1,73 @@
+from .ContextManager import ContextManager
+
+
+class WellformednessCache(ContextManager):
+    r"""
+    A context manager for checking wellformedness incrementally.
+
+    ..  container:: example
+
+        >>> staff = abjad.Staff("c'4 d'4 e'4 f'4")
+        >>> with abjad.WellformednessCache():
+        ...     abjad.inspect(staff).wellformed()
+        ...     staff.append(abjad.Container())
+        ...     abjad.inspect(staff).wellformed()
+        ...     staff[-1].append("g'4")
+        ...     abjad.inspect(staff).wellformed()
+        ...
+        True
+        False
+        True
+
+    Caches wellformedness results on score root when wellformedness of score
+    root is checked. Checking again reuses results for every container
+    that has not changed since last check, and returns immediately when no
+    component in score has changed. Structural changes, changes to
+    durations and multipliers, changes to written pitches, changes to
+    context names and attaching or detaching indicators mark the containers
+    involved as changed.
+
+    Leaves that have changed are checked again; all leaves are checked
+    again by checks that look up effective indicators whenever such an
+    indicator is attached, detached or moves in time. Context-spanning
+    checks of hairpins and text spanners are made again for all contexts
+    that share a name with a changed context.
+
+    Results stay cached on score root between uses of the context manager
+    and are revalidated when next used. Like format bundle caching, this
+    does not track changes made to indicators after they are attached.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Context managers"
+
+    __slots__ = ()
+
+    _depth = 0
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        pass
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        """
+        Enters context manager and turns on incremental wellformedness
+        checking.
+
+        Returns context manager.
+        """
+        WellformednessCache._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits context manager and turns off incremental wellformedness
+        checking.
+
+        Returns none.
+        """
+        WellformednessCache._depth -= 1
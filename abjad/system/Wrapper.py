@@ -364,11 +364,17 @@ class Wrapper(object):
             if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
                 self._component._update_later(offsets_in_seconds=True)
         component._wrappers.append(self)
+        component._mark_modified()
+        if self.context is not None:
+            LilyPondFormatManager._invalidate_bundle_caches()
+        if getattr(self.indicator, "_mutates_measure_numbers", False):
+            component._update_later(measure_numbers=True)
 
     def _bind_effective_context(self, correct_effective_context):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._effective_indicator_index = None
         self._effective_context = correct_effective_context
         self._update_effective_context()
         if getattr(self.indicator, "_mutates_offsets_in_seconds", False):
@@ -460,6 +466,11 @@ class Wrapper(object):
     def _unbind_component(self):
         if self._component is not None and self in self._component._wrappers:
             self._component._wrappers.remove(self)
+            self._component._mark_modified()
+            if self.context is not None:
+                LilyPondFormatManager._invalidate_bundle_caches()
+            if getattr(self.indicator, "_mutates_measure_numbers", False):
+                self._component._update_later(measure_numbers=True)
         self._component = None
 
     def _unbind_effective_context(self):
@@ -468,6 +479,7 @@ class Wrapper(object):
             and self in self._effective_context._dependent_wrappers
         ):
             self._effective_context._dependent_wrappers.remove(self)
+            self._effective_context._effective_indicator_index = None
         self._effective_context = None
 
     def _update_effective_context(self):
@@ -574,6 +586,8 @@ class Wrapper(object):
     def deactivate(self, argument):
         assert argument in (True, False, None)
         self._deactivate: typing.Optional[bool] = argument
+        if self.component is not None:
+            self.component._mark_modified()
 
     @property
     def indicator(self) -> typing.Any:
@@ -676,3 +690,5 @@ class Wrapper(object):
             raise Exception(f"string or tag: {argument!r}.")
         tag = Tag(argument)
         self._tag = tag
+        if self.component is not None:
+            self.component._mark_modified()
@@ -8,6 +8,7 @@ from .Configuration import Configuration
 from .ContextManager import ContextManager
 from .FilesystemState import FilesystemState
 from .ForbidUpdate import ForbidUpdate
+from .FormatBundleCache import FormatBundleCache
 from .FormatSpecification import FormatSpecification
 from .IOManager import IOManager
 from .LilyPondFormatBundle import LilyPondFormatBundle
@@ -17,6 +18,7 @@ from .Parser import Parser
 from .PersistenceManager import PersistenceManager
 from .ProgressIndicator import ProgressIndicator
 from .RedirectedStreams import RedirectedStreams
+from .RenderCache import RenderCache
 from .Signature import Signature
 from .SlotContributions import SlotContributions
 from .StorageFormatManager import StorageFormatManager
@@ -28,6 +30,7 @@ from .TemporaryDirectoryChange import TemporaryDirectoryChange
 from .TestManager import TestManager
 from .Timer import Timer
 from .UpdateManager import UpdateManager
+from .WellformednessCache import WellformednessCache
 from .Wrapper import Wrapper
 
 __all__ = [
@@ -37,6 +40,7 @@ __all__ = [
     "ContextManager",
     "FilesystemState",
     "ForbidUpdate",
+    "FormatBundleCache",
     "FormatSpecification",
     "IOManager",
     "LilyPondFormatBundle",
@@ -46,6 +50,7 @@ __all__ = [
     "PersistenceManager",
     "ProgressIndicator",
     "RedirectedStreams",
+    "RenderCache",
     "Signature",
     "SlotContributions",
     "StorageFormatManager",
@@ -57,5 +62,6 @@ __all__ = [
     "TestManager",
     "Timer",
     "UpdateManager",
+    "WellformednessCache",
     "Wrapper",
 ]
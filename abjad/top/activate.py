@@ -102,41 +102,9 @@ def activate(text, tag, skipped=False):
     import abjad
 
     assert isinstance(tag, abjad.Tag) or callable(tag), repr(tag)
-    lines, count, skipped_count = [], 0, 0
-    treated_last_line = False
-    found_already_active_on_last_line = False
-    text_lines = text.split("\n")
-    text_lines = [_ + "\n" for _ in text_lines[:-1]] + text_lines[-1:]
-    lines = []
-    for line in text_lines:
-        first_nonwhitespace_index = len(line) - len(line.lstrip())
-        index = first_nonwhitespace_index
-        if not abjad.Line(line).match(tag):
-            lines.append(line)
-            treated_last_line = False
-            found_already_active_on_last_line = False
-            continue
-        if line[index : index + 4] in ("%%% ", "%@% "):
-            if "%@% " in line:
-                line = line.replace("%@%", "   ")
-                suffix = " %@%"
-            else:
-                line = line.replace("%%%", "   ")
-                suffix = None
-            assert line.endswith("\n"), repr(line)
-            if suffix:
-                line = line.strip("\n") + suffix + "\n"
-            if not treated_last_line:
-                count += 1
-            treated_last_line = True
-            found_already_active_on_last_line = False
-        else:
-            if not found_already_active_on_last_line:
-                skipped_count += 1
-            found_already_active_on_last_line = True
-            treated_last_line = False
-        lines.append(line)
-    text = "".join(lines)
+    index = abjad.TagIndex(text)
+    count, skipped_count = index.activate(tag)
+    text = index.text
     if skipped is True:
         return text, count, skipped_count
     else:
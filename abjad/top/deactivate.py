@@ -101,48 +101,11 @@ def deactivate(text, tag, prepend_empty_chord=False, skipped=False):
     import abjad
 
     assert isinstance(tag, abjad.Tag) or callable(tag), repr(tag)
-    lines, count, skipped_count = [], 0, 0
-    treated_last_line, last_index = False, None
-    found_already_deactivated_on_last_line = False
-    text_lines = text.split("\n")
-    text_lines = [_ + "\n" for _ in text_lines[:-1]] + text_lines[-1:]
-    lines = []
-    previous_line_was_tweak = False
-    for line in text_lines:
-        first_nonwhitespace_index = len(line) - len(line.lstrip())
-        index = first_nonwhitespace_index
-        if not abjad.Line(line).match(tag):
-            lines.append(line)
-            treated_last_line, last_index = False, None
-            found_already_deactivated_on_last_line = False
-            continue
-        if line[index] != "%":
-            if last_index is None:
-                last_index = index
-            if " %@%" in line:
-                prefix = "%@% "
-                line = line.replace(" %@%", "")
-            else:
-                prefix = "%%% "
-            if prepend_empty_chord and not previous_line_was_tweak:
-                prefix += "<> "
-            target = line[last_index - 4 : last_index]
-            assert target == "    ", repr((line, target, index, tag))
-            characters = list(line)
-            characters[last_index - 4 : last_index] = list(prefix)
-            line = "".join(characters)
-            if not treated_last_line:
-                count += 1
-            treated_last_line = True
-            found_already_deactivated_on_last_line = False
-        else:
-            if not found_already_deactivated_on_last_line:
-                skipped_count += 1
-            found_already_deactivated_on_last_line = True
-            treated_last_line = False
-        lines.append(line)
-        previous_line_was_tweak = "tweak" in line
-    text = "".join(lines)
+    index = abjad.TagIndex(text)
+    count, skipped_count = index.deactivate(
+        tag, prepend_empty_chord=prepend_empty_chord
+    )
+    text = index.text
     if skipped is True:
         return text, count, skipped_count
     else:
@@ -1,8 +1,3 @@
-import typing
-
-_lilypond_parsers_by_language: typing.Dict = {}
-
-
 def parse(string, language="english"):
     r"""
     Parses LilyPond ``string``.
@@ -33,7 +28,7 @@ def parse(string, language="english"):
         return abjad.parser.parse_reduced_ly_syntax(string[4:])
     elif string.startswith("rtm:"):
         return abjad.rhythmtrees.parse_rtm_syntax(string[4:])
-    if language not in _lilypond_parsers_by_language:
-        parser = abjad.parser.LilyPondParser(default_language=language)
-        _lilypond_parsers_by_language[language] = parser
-    return _lilypond_parsers_by_language[language](string)
+    with abjad.parser.LilyPondParser._get_pooled_parser(
+        default_language=language
+    ) as parser:
+        return parser(string)
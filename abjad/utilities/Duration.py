@@ -109,55 +109,32 @@ class Duration(Fraction):
 
     __slots__ = ()
 
+    _interned_values: typing.Dict[typing.Tuple[int, int], "Duration"] = {}
+
+    _maximum_interned_value_count = 4096
+
     ### CONSTRUCTOR ###
 
     def __new__(class_, *arguments):
         """
         Makes new duration.
         """
-        if len(arguments) == 1:
-            argument = arguments[0]
-            if type(argument) is class_:
-                return argument
-            if isinstance(argument, mathtools.NonreducedFraction):
-                return Fraction.__new__(class_, *argument.pair)
-            try:
-                return Fraction.__new__(class_, *argument)
-            except (AttributeError, TypeError):
-                pass
-            try:
-                return Fraction.__new__(class_, argument)
-            except (AttributeError, TypeError):
-                pass
-            if (
-                isinstance(argument, tuple)
-                and len(argument) == 2
-                and mathtools.is_integer_equivalent(argument[0])
-                and mathtools.is_integer_equivalent(argument[1])
-                and not argument[1] == 0
-            ):
-                return Fraction.__new__(class_, int(argument[0]), int(argument[1]))
-            try:
-                return Fraction.__new__(class_, argument.duration)
-            except AttributeError:
-                pass
-            if isinstance(argument, str) and "/" not in argument:
-                result = Duration._initialize_from_lilypond_duration_string(argument)
-                return Fraction.__new__(class_, result)
-            if (
-                isinstance(argument, tuple)
-                and len(argument) == 1
-                and mathtools.is_integer_equivalent(argument[0])
-            ):
-                return Fraction.__new__(class_, int(argument[0]))
-        else:
-            try:
-                return Fraction.__new__(class_, *arguments)
-            except TypeError:
-                pass
-            if mathtools.all_are_integer_equivalent_numbers(arguments):
-                return Fraction.__new__(class_, *[int(x) for x in arguments])
-        raise ValueError(f"can not construct duration: {arguments!r}.")
+        interned_values = class_.__dict__.get("_interned_values")
+        if interned_values is None:
+            return Duration._make(class_, *arguments)
+        key = Duration._get_interned_value_key(arguments)
+        if key is None:
+            return Duration._make(class_, *arguments)
+        try:
+            return interned_values[key]
+        except KeyError:
+            pass
+        self = Duration._make(class_, *arguments)
+        if class_._maximum_interned_value_count <= len(interned_values) + 1:
+            interned_values.clear()
+        self = interned_values.setdefault((self.numerator, self.denominator), self)
+        interned_values[key] = self
+        return self
 
     ### SPECIAL METHODS ###
 
@@ -482,6 +459,30 @@ class Duration(Fraction):
             storage_format_kwargs_names=[],
         )
 
+    @staticmethod
+    def _get_interned_value_key(arguments):
+        if len(arguments) == 2:
+            numerator, denominator = arguments
+        elif len(arguments) == 1:
+            argument = arguments[0]
+            if type(argument) is int:
+                return argument, 1
+            if type(argument) is tuple:
+                if len(argument) != 2:
+                    return None
+                numerator, denominator = argument
+            else:
+                try:
+                    numerator = argument.numerator
+                    denominator = argument.denominator
+                except AttributeError:
+                    return None
+        else:
+            return None
+        if type(numerator) is int and type(denominator) is int and 0 < denominator:
+            return numerator, denominator
+        return None
+
     @staticmethod
     def _group_by_implied_prolation(durations):
         durations = [mathtools.NonreducedFraction(duration) for duration in durations]
@@ -551,6 +552,52 @@ class Duration(Fraction):
         result = 2 ** (int(math.ceil(math.log(n, 2))) + i)
         return result
 
+    @staticmethod
+    def _make(class_, *arguments):
+        if len(arguments) == 1:
+            argument = arguments[0]
+            if type(argument) is class_:
+                return argument
+            if isinstance(argument, mathtools.NonreducedFraction):
+                return Fraction.__new__(class_, *argument.pair)
+            try:
+                return Fraction.__new__(class_, *argument)
+            except (AttributeError, TypeError):
+                pass
+            try:
+                return Fraction.__new__(class_, argument)
+            except (AttributeError, TypeError):
+                pass
+            if (
+                isinstance(argument, tuple)
+                and len(argument) == 2
+                and mathtools.is_integer_equivalent(argument[0])
+                and mathtools.is_integer_equivalent(argument[1])
+                and not argument[1] == 0
+            ):
+                return Fraction.__new__(class_, int(argument[0]), int(argument[1]))
+            try:
+                return Fraction.__new__(class_, argument.duration)
+            except AttributeError:
+                pass
+            if isinstance(argument, str) and "/" not in argument:
+                result = Duration._initialize_from_lilypond_duration_string(argument)
+                return Fraction.__new__(class_, result)
+            if (
+                isinstance(argument, tuple)
+                and len(argument) == 1
+                and mathtools.is_integer_equivalent(argument[0])
+            ):
+                return Fraction.__new__(class_, int(argument[0]))
+        else:
+            try:
+                return Fraction.__new__(class_, *arguments)
+            except TypeError:
+                pass
+            if mathtools.all_are_integer_equivalent_numbers(arguments):
+                return Fraction.__new__(class_, *[int(x) for x in arguments])
+        raise ValueError(f"can not construct duration: {arguments!r}.")
+
     @staticmethod
     def _make_markup_score_block(selection):
         import abjad
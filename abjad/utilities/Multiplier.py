@@ -1,3 +1,5 @@
+import typing
+
 from .Duration import Duration
 
 
@@ -97,6 +99,8 @@ class Multiplier(Duration):
 
     __slots__ = ()
 
+    _interned_values: typing.Dict[typing.Tuple[int, int], "Multiplier"] = {}
+
     ### SPECIAL METHODS ###
 
     def __mul__(self, *arguments):
@@ -1,3 +1,5 @@
+import typing
+
 from abjad.system.FormatSpecification import FormatSpecification
 
 from .Duration import Duration
@@ -124,6 +126,8 @@ class Offset(Duration):
 
     __slots__ = ("_displacement",)
 
+    _interned_values: typing.Dict[typing.Tuple[int, int], "Offset"] = {}
+
     ### CONSTRUCTOR ###
 
     def __new__(class_, *arguments, **keywords):
@@ -140,7 +144,10 @@ class Offset(Duration):
         displacement = displacement or None
         if len(arguments) == 1 and isinstance(arguments[0], Duration):
             arguments = arguments[0].pair
-        self = Duration.__new__(class_, *arguments)
+        if displacement is None:
+            self = Duration.__new__(class_, *arguments)
+        else:
+            self = Duration._make(class_, *arguments)
         self._displacement = displacement
         return self
 
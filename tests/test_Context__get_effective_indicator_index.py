@@ -0,0 +1,74 @@
+import abjad
+
+
+def test_Context__get_effective_indicator_index_01():
+    """
+    Attaching and detaching indicators discards index.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Clef("bass"), staff[1])
+    assert abjad.inspect(staff[2]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert staff._effective_indicator_index is not None
+
+    clef = abjad.Clef("alto")
+    abjad.attach(clef, staff[2])
+    assert staff._effective_indicator_index is None
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == clef
+
+    abjad.detach(clef, staff[2])
+    assert staff._effective_indicator_index is None
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("bass")
+
+
+def test_Context__get_effective_indicator_index_02():
+    """
+    Structural edits discard index.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Clef("bass"), staff[2])
+    assert abjad.inspect(staff[1]).effective(abjad.Clef) is None
+
+    staff.insert(0, abjad.Note("c'2"))
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert abjad.inspect(staff[2]).effective(abjad.Clef) is None
+
+    staff[0].written_duration = abjad.Duration(1, 16)
+    assert abjad.inspect(staff[3]).effective(abjad.Clef) == abjad.Clef("bass")
+    assert abjad.inspect(staff[2]).effective(abjad.Clef) is None
+
+
+def test_Context__get_effective_indicator_index_03():
+    """
+    Index respects n, prototype tuples and attributes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4")
+    abjad.attach(abjad.Clef("treble"), staff[0])
+    abjad.attach(abjad.Clef("bass"), staff[1])
+    abjad.attach(abjad.TimeSignature((5, 4)), staff[2])
+    abjad.attach(abjad.Clef("alto"), staff[3])
+
+    assert abjad.inspect(staff[2]).effective(abjad.Clef, n=-1) == abjad.Clef("treble")
+    assert abjad.inspect(staff[2]).effective(abjad.Clef, n=1) == abjad.Clef("alto")
+    assert abjad.inspect(staff[2]).effective(abjad.Clef, n=2) is None
+    prototype = (abjad.Clef, abjad.TimeSignature)
+    indicator = abjad.inspect(staff[2]).effective(prototype, n=-1)
+    assert indicator == abjad.Clef("bass")
+    indicator = abjad.inspect(staff[4]).effective(
+        abjad.Clef, attributes={"name": "bass"}
+    )
+    assert indicator == abjad.Clef("bass")
+
+
+def test_Context__get_effective_indicator_index_04():
+    """
+    Leaves in detached grace containers have no effective indicators.
+    """
+
+    for class_ in (abjad.AfterGraceContainer, abjad.BeforeGraceContainer):
+        container = class_("e'16 f'16")
+        assert abjad.inspect(container[0]).effective(abjad.Clef) is None
+        new_container = abjad.mutate(container).copy()
+        assert abjad.inspect(new_container[0]).effective(abjad.Instrument) is None
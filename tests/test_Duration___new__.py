@@ -0,0 +1,43 @@
+import abjad
+
+
+def test_Duration___new___01():
+    """
+    Interns equal durations, multipliers and offsets.
+    """
+
+    duration = abjad.Duration(1, 4)
+    assert abjad.Duration((2, 8)) is duration
+    assert abjad.Duration(abjad.mathtools.NonreducedFraction(3, 12)) is duration
+    assert abjad.Duration(abjad.Multiplier(1, 4)) is duration
+    assert abjad.Duration(1, 8) + abjad.Duration(1, 8) is duration
+    assert abjad.Multiplier(1, 4) is abjad.Multiplier((1, 4))
+    assert abjad.Multiplier(1, 4) is not duration
+    assert abjad.Offset(1, 4) is abjad.Offset(duration)
+    leaves = abjad.LeafMaker()([0, 2], [(1, 4), (1, 4)])
+    assert leaves[0].written_duration is leaves[1].written_duration
+
+
+def test_Duration___new___02():
+    """
+    Does not intern offsets with displacement.
+    """
+
+    offset = abjad.Offset(1, 4)
+    offset_1 = abjad.Offset((1, 4), displacement=(-1, 16))
+    offset_2 = abjad.Offset((1, 4), displacement=(-1, 16))
+    assert offset_1 is not offset_2
+    assert offset_1 is not offset
+    assert offset.displacement is None
+    assert abjad.Offset(1, 4) is offset
+
+
+def test_Duration___new___03():
+    """
+    Bounds interned values.
+    """
+
+    count = abjad.Duration._maximum_interned_value_count
+    for denominator in range(1, count + 2):
+        abjad.Duration(1, denominator)
+    assert len(abjad.Duration._interned_values) <= count
@@ -0,0 +1,87 @@
+import os
+import stat
+
+import abjad
+
+stub = """#!/bin/sh
+for last; do true; done
+base="${last%.ly}"
+echo "stub lilypond $last"
+echo start >> "$(dirname "$0")/events"
+sleep 0.5
+echo stop >> "$(dirname "$0")/events"
+if grep -q error "$last"; then
+    echo "error: stub failure"
+    exit 1
+fi
+touch "$base.pdf"
+"""
+
+
+def _make_stub(directory):
+    path = os.path.join(directory, "lilypond")
+    with open(path, "w") as file_pointer:
+        file_pointer.write(stub)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def test_IOManager_run_lilypond_many_01():
+    """
+    Renders files concurrently and reports per-file log, exit code and
+    elapsed time.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_stub(directory)
+        ly_paths = []
+        for i in range(4):
+            ly_path = os.path.join(directory, f"part-{i}.ly")
+            with open(ly_path, "w") as file_pointer:
+                file_pointer.write("{ c'4 }\n")
+            ly_paths.append(ly_path)
+        results = abjad.IOManager.run_lilypond_many(
+            ly_paths, jobs=4, lilypond_path=lilypond_path
+        )
+        with open(os.path.join(directory, "events")) as file_pointer:
+            events = file_pointer.read().split()
+        running, maximum_running = 0, 0
+        for event in events:
+            running += 1 if event == "start" else -1
+            maximum_running = max(running, maximum_running)
+        assert events.count("start") == events.count("stop") == 4
+        assert 1 < maximum_running
+        assert [_[0] for _ in results] == ly_paths
+        for ly_path, log_file_path, exit_code, elapsed_time in results:
+            assert exit_code == 0
+            assert 0.5 <= elapsed_time
+            assert log_file_path == ly_path[:-3] + ".log"
+            with open(log_file_path) as file_pointer:
+                lines = file_pointer.read().splitlines()
+            assert lines[1] == f"stub lilypond {ly_path}"
+            assert os.path.exists(ly_path[:-3] + ".pdf")
+
+
+def test_IOManager_run_lilypond_many_02():
+    """
+    Reports nonzero exit code of failing files.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        lilypond_path = _make_stub(directory)
+        ly_paths = []
+        for name in ("good", "bad"):
+            ly_path = os.path.join(directory, f"{name}.ly")
+            with open(ly_path, "w") as file_pointer:
+                if name == "bad":
+                    file_pointer.write("error\n")
+                else:
+                    file_pointer.write("{ c'4 }\n")
+            ly_paths.append(ly_path)
+        results = abjad.IOManager.run_lilypond_many(
+            ly_paths, jobs=1, lilypond_path=lilypond_path
+        )
+        assert [_[2] for _ in results] == [0, 1]
+        with open(results[1][1]) as file_pointer:
+            assert "error: stub failure" in file_pointer.read()
+        assert not os.path.exists(os.path.join(directory, "bad.pdf"))
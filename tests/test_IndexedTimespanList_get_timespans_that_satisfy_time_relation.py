@@ -0,0 +1,108 @@
+import copy
+import random
+
+import abjad
+
+
+def _make_timespan(random_):
+    start_offset = abjad.Offset(random_.randint(-20, 60), random_.choice([1, 2, 3]))
+    duration = abjad.Duration(random_.randint(0, 20), random_.choice([1, 2, 4]))
+    return abjad.Timespan(start_offset, start_offset + duration)
+
+
+def test_IndexedTimespanList_get_timespans_that_satisfy_time_relation_01():
+    """
+    Indexed queries equal timespan-by-timespan queries.
+    """
+
+    random_ = random.Random(1)
+    names = abjad.IndexedTimespanList._indexed_time_relations
+    names += ("overlaps_start_of_timespan",)
+    timespans = [_make_timespan(random_) for _ in range(30)]
+    timespans.append(timespans[0])
+    timespan_list = abjad.TimespanList(timespans)
+    indexed_timespan_list = abjad.IndexedTimespanList(timespans)
+    for _ in range(40):
+        timespan = _make_timespan(random_)
+        name = random_.choice(names)
+        time_relation = getattr(abjad.timespan(), name)(timespan)
+        result_1 = timespan_list.get_timespans_that_satisfy_time_relation(time_relation)
+        result_2 = indexed_timespan_list.get_timespans_that_satisfy_time_relation(
+            time_relation
+        )
+        assert isinstance(result_2, abjad.IndexedTimespanList)
+        assert len(result_1) == len(result_2)
+        assert all(x is y for x, y in zip(result_1, result_2))
+
+
+def test_IndexedTimespanList_get_timespans_that_satisfy_time_relation_02():
+    """
+    Keeps index current when timespans are inserted and removed.
+    """
+
+    random_ = random.Random(2)
+    timespans = [_make_timespan(random_) for _ in range(20)]
+    timespan_list = abjad.TimespanList(timespans)
+    indexed_timespan_list = abjad.IndexedTimespanList(timespans)
+    for i in range(30):
+        if i % 3 == 0:
+            timespan = _make_timespan(random_)
+            timespan_list.append(timespan)
+            indexed_timespan_list.append(timespan)
+        elif i % 3 == 1:
+            timespan = random_.choice(timespan_list)
+            timespan_list.remove(timespan)
+            indexed_timespan_list.remove(timespan)
+        elif i % 5 == 0:
+            timespan_list.sort()
+            indexed_timespan_list.sort()
+        timespan = _make_timespan(random_)
+        time_relation = abjad.timespan().intersects_timespan(timespan)
+        result_1 = timespan_list.get_timespans_that_satisfy_time_relation(time_relation)
+        result_2 = indexed_timespan_list.get_timespans_that_satisfy_time_relation(
+            time_relation
+        )
+        assert list(result_1) == list(result_2)
+        result_1 = abjad.TimespanList(timespan_list) - timespan
+        result_2 = abjad.IndexedTimespanList(indexed_timespan_list) - timespan
+        assert list(result_1) == list(result_2)
+
+
+def test_IndexedTimespanList_get_timespans_that_satisfy_time_relation_03():
+    """
+    Copies rebuild index.
+    """
+
+    timespans = abjad.IndexedTimespanList([(0, 4), (2, 6), (8, 10)])
+    time_relation = abjad.timespan().intersects_timespan(abjad.Timespan(3, 9))
+    assert len(timespans.get_timespans_that_satisfy_time_relation(time_relation)) == 3
+    copied_timespans = copy.deepcopy(timespans)
+    assert copied_timespans._indices is None
+    result = copied_timespans.get_timespans_that_satisfy_time_relation(time_relation)
+    assert all(any(x is y for y in copied_timespans) for x in result)
+    assert len(result) == 3
+
+
+def test_IndexedTimespanList_get_timespans_that_satisfy_time_relation_04():
+    """
+    Merges indices of appended timespans and skips removed timespans.
+    """
+
+    random_ = random.Random(4)
+    timespans = abjad.IndexedTimespanList()
+    timespans.get_timespans_that_satisfy_time_relation(
+        abjad.timespan().intersects_timespan(abjad.Timespan(0, 1))
+    )
+    for i in range(60):
+        timespans.append(_make_timespan(random_))
+        if i % 3 == 0:
+            timespans.remove(random_.choice(timespans))
+        timespan = _make_timespan(random_)
+        time_relation = abjad.timespan().intersects_timespan(timespan)
+        result_1 = abjad.TimespanList(timespans)
+        result_1 = result_1.get_timespans_that_satisfy_time_relation(time_relation)
+        result_2 = timespans.get_timespans_that_satisfy_time_relation(time_relation)
+        assert list(result_1) == list(result_2)
+    assert timespans._indices is not None
+    sizes = [len(_.entries) for _ in timespans._indices]
+    assert sizes == sorted(sizes, reverse=True)
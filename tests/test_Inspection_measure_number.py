@@ -0,0 +1,58 @@
+import abjad
+
+
+def test_Inspection_measure_number_01():
+    """
+    Attaching and detaching time signatures updates measure numbers.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    leaves = abjad.select(staff).leaves()
+    numbers = [abjad.inspect(_).measure_number() for _ in leaves]
+    assert numbers == [1, 1, 1, 1, 2, 2, 2, 2]
+
+    time_signature = abjad.TimeSignature((2, 4))
+    abjad.attach(time_signature, leaves[0])
+    numbers = [abjad.inspect(_).measure_number() for _ in leaves]
+    assert numbers == [1, 1, 2, 2, 3, 3, 4, 4]
+
+    abjad.detach(time_signature, leaves[0])
+    numbers = [abjad.inspect(_).measure_number() for _ in leaves]
+    assert numbers == [1, 1, 1, 1, 2, 2, 2, 2]
+
+
+def test_Inspection_measure_number_02():
+    """
+    Structural edits update measure numbers.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    assert abjad.inspect(staff[-1]).measure_number() == 3
+
+    staff.insert(0, abjad.Note("c'2"))
+    assert abjad.inspect(staff[-1]).measure_number() == 4
+
+    staff[0].written_duration = (1, 4)
+    assert abjad.inspect(staff[-2]).measure_number() == 4
+
+    groups = abjad.select(staff).leaves().group_by_measure()
+    assert [len(_) for _ in groups] == [1, 3, 3, 2]
+
+
+def test_Inspection_measure_number_03():
+    """
+    Measure starts are cached on score root between lookups.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    assert staff._measure_start_offsets is None
+    assert abjad.inspect(staff[0]).measure_number() == 1
+    measure_start_offsets = staff._measure_start_offsets
+    assert measure_start_offsets == [abjad.Offset(0), abjad.Offset(1)]
+    assert abjad.inspect(staff[-1]).measure_number() == 2
+    assert staff._measure_start_offsets is measure_start_offsets
+
+    staff.append("d''4")
+    assert staff._measure_start_offsets is None
+    assert abjad.inspect(staff[-1]).measure_number() == 3
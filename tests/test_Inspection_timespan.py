@@ -349,3 +349,23 @@ def test_Inspection_timespan_26():
     assert start_offset == abjad.Offset(0)
     start_offset = abjad.inspect(staff[1]).timespan(in_seconds=True).start_offset
     assert start_offset == abjad.Offset(5, 4)
+
+
+def test_Inspection_timespan_27():
+    """
+    Offsets in seconds work with dense metronome mark changes.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    for i, leaf in enumerate(staff):
+        mark = abjad.MetronomeMark((1, 4), 60 + 15 * i)
+        abjad.attach(mark, leaf, context="Staff")
+
+    start_offset = abjad.Offset(0)
+    for i, leaf in enumerate(staff):
+        timespan = abjad.inspect(leaf).timespan(in_seconds=True)
+        stop_offset = start_offset + abjad.Duration(60, 60 + 15 * i)
+        assert timespan == abjad.Timespan(start_offset, stop_offset)
+        start_offset = stop_offset
+    timespan = abjad.inspect(staff).timespan(in_seconds=True)
+    assert timespan == abjad.Timespan(0, start_offset)
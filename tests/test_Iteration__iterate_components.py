@@ -0,0 +1,35 @@
+import sys
+
+import abjad
+
+
+def test_Iteration__iterate_components_01():
+    """
+    Iterates containers nested deeper than recursion limit.
+    """
+
+    note = abjad.Note("c'4")
+    container = abjad.Container([note])
+    for _ in range(sys.getrecursionlimit()):
+        container = abjad.Container([container])
+
+    assert list(abjad.iterate(container).leaves()) == [note]
+    assert list(abjad.iterate(container).leaves(reverse=True)) == [note]
+
+
+def test_Iteration__iterate_components_02():
+    """
+    Exclude does not apply to before-grace music in forward iteration.
+    """
+
+    voice = abjad.Voice("c'4 d'4")
+    container = abjad.BeforeGraceContainer("cs'16")
+    abjad.attach(container, voice[1])
+    abjad.attach("RED", container[0])
+    abjad.attach("RED", voice[0])
+
+    leaves = abjad.iterate(voice).leaves(exclude="RED")
+    assert list(leaves) == [container[0], voice[1]]
+
+    leaves = abjad.iterate(voice).leaves(exclude="RED", reverse=True)
+    assert list(leaves) == [voice[1]]
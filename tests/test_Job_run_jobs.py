@@ -0,0 +1,52 @@
+import abjad
+
+
+def test_Job_run_jobs_01(tmp_path):
+    """
+    Running jobs together equals calling jobs one after another.
+    """
+
+    lines = [
+        r"    %@% \p %! DYNAMIC:SM1",
+        r"    \clef %! CLEF:SM1",
+        r"    c'4",
+        r"    \f %! DYNAMIC:SM2",
+    ]
+    text = "\n".join(lines) + "\n"
+    directories = []
+    for name in ("sequential", "together"):
+        directory = tmp_path / name
+        directory.mkdir()
+        for file_name in ("segment-a.ly", "layout.ly", "music.ly", "segment-b.ily"):
+            (directory / file_name).write_text(text)
+        directories.append(abjad.Path(directory))
+
+    def make_jobs(path):
+        return [
+            abjad.Job(
+                activate=(abjad.Tag("SM1"), "measure one"),
+                deactivate=(abjad.Tag("SM2"), "measure two"),
+                path=path,
+                title="toggling measures ...",
+            ),
+            abjad.Job(
+                deactivate=(lambda tags: abjad.Tag("CLEF") in tags, "clef"),
+                path=path,
+                skip_file_name="layout.ly",
+                title="hiding clefs ...",
+            ),
+            abjad.Job(activate=(abjad.Tag("MISSING"), "missing"), path=path),
+        ]
+
+    messages_1 = [job() for job in make_jobs(directories[0])]
+    messages_2 = abjad.Job.run_jobs(make_jobs(directories[1]))
+    assert messages_1 == messages_2
+    assert messages_1[0][0] == "Toggling measures ..."
+    assert messages_1[2] == []
+    for file_name in ("segment-a.ly", "layout.ly", "music.ly", "segment-b.ily"):
+        text_1 = (directories[0] / file_name).read_text()
+        text_2 = (directories[1] / file_name).read_text()
+        assert text_1 == text_2
+    assert (directories[1] / "music.ly").read_text() == text
+    assert r"%%% \clef" not in (directories[1] / "layout.ly").read_text()
+    assert r"%%% \clef" in (directories[1] / "segment-b.ily").read_text()
@@ -0,0 +1,79 @@
+import abjad
+
+
+def test_LilyPondFormatManager_bundle_format_contributions_01():
+    """
+    Reuses cached bundles of unmodified components.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Articulation("accent"), staff[0])
+    manager = abjad.LilyPondFormatManager
+    with abjad.FormatBundleCache():
+        bundles = [manager.bundle_format_contributions(_) for _ in staff]
+        bundles_ = [manager.bundle_format_contributions(_) for _ in staff]
+        assert all(_ is __ for _, __ in zip(bundles, bundles_))
+
+        abjad.attach(abjad.Articulation("tenuto"), staff[1])
+        bundles_ = [manager.bundle_format_contributions(_) for _ in staff]
+        assert bundles_[0] is bundles[0]
+        assert bundles_[1] is not bundles[1]
+        assert bundles_[2] is bundles[2]
+
+    bundle = manager.bundle_format_contributions(staff[0])
+    assert bundle is not bundles[0]
+
+
+def test_LilyPondFormatManager_bundle_format_contributions_02():
+    """
+    Attach, detach, tags, overrides, settings and structural changes
+    invalidate cached bundles.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    with abjad.FormatBundleCache():
+        format(staff)
+
+        wrapper = abjad.attach(
+            abjad.Articulation("accent"), staff[0], tag=abjad.Tag("A"), wrapper=True
+        )
+        assert "%! A" in format(staff)
+        wrapper.tag = abjad.Tag("B")
+        assert "%! B" in format(staff)
+        wrapper.deactivate = True
+        assert r"%@% - \accent" in format(staff)
+        abjad.detach(abjad.Articulation, staff[0])
+        assert "accent" not in format(staff)
+
+        abjad.override(staff[1]).note_head.color = "red"
+        assert r"\once \override NoteHead.color = #red" in format(staff)
+        abjad.setting(staff[2]).font_size = -3
+        assert r"\set fontSize = #-3" in format(staff)
+        del abjad.override(staff[1]).note_head.color
+        assert "NoteHead.color" not in format(staff)
+
+        abjad.attach(abjad.Clef("bass"), staff[3])
+        assert r"\clef" in format(staff)
+        container = abjad.Container()
+        abjad.mutate(staff[:]).wrap(container)
+        abjad.attach(abjad.Clef("alto"), container[0])
+        score = abjad.Score([staff])
+        assert format(score) == abjad.String.normalize(
+            r"""
+            \new Score
+            <<
+                \new Staff
+                {
+                    {
+                        \clef "alto"
+                        c'4
+                        d'4
+                        \set fontSize = #-3
+                        e'4
+                        \clef "bass"
+                        f'4
+                    }
+                }
+            >>
+            """
+        )
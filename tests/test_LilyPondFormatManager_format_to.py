@@ -0,0 +1,54 @@
+import io
+import os
+
+import abjad
+
+
+def test_LilyPondFormatManager_format_to_01():
+    """
+    Streams score format line by line.
+    """
+
+    staff = abjad.Staff(r"c'8 \times 2/3 { d'8 e'8 f'8 } g'4 { a'4 b'4 }")
+    abjad.attach(abjad.TimeSignature((3, 4)), staff[0])
+    abjad.beam(staff[:2])
+    abjad.attach(abjad.BeforeGraceContainer("cs'16"), staff[-1][0])
+    score = abjad.Score([staff])
+    stream = io.StringIO()
+    abjad.LilyPondFormatManager.format_to(score, stream)
+    assert stream.getvalue() == format(score, "lilypond")
+
+
+def test_LilyPondFormatManager_format_to_02():
+    """
+    Streams LilyPond file format with tags aligned.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Clef("alto"), staff[0], tag=abjad.Tag("ONE"))
+    lilypond_file = abjad.LilyPondFile.new(staff)
+    lilypond_file._date_time_token = None
+    string = format(lilypond_file, "lilypond")
+    stream = io.StringIO()
+    abjad.LilyPondFormatManager.format_to(lilypond_file, stream)
+    assert stream.getvalue() == string
+
+    string = abjad.LilyPondFormatManager.align_tags(string, 40)
+    stream = io.StringIO()
+    abjad.LilyPondFormatManager.format_to(lilypond_file, stream, strict=40)
+    assert stream.getvalue() == string
+
+
+def test_LilyPondFormatManager_format_to_03():
+    """
+    Persists LilyPond file with streaming.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    lilypond_file = abjad.LilyPondFile.new(staff)
+    lilypond_file._date_time_token = None
+    with abjad.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "test.ly")
+        abjad.persist(lilypond_file).as_ly(path, streaming=True)
+        with open(path) as file_pointer:
+            assert file_pointer.read() == format(lilypond_file)
@@ -0,0 +1,67 @@
+import abjad
+
+
+def _get_storage_formats(container):
+    result = [format(container, "storage")]
+    for leaf in container:
+        result.append(format(leaf, "storage"))
+        for wrapper in abjad.inspect(leaf).wrappers():
+            result.append(format(wrapper, "storage"))
+    return result
+
+
+def test_LilyPondParser__note_entry_01():
+    """
+    Note entry fast path builds same components as full parser.
+    """
+
+    parser = abjad.parser.LilyPondParser()
+    string = "{ c'8 [ ( d'8 ] ) r4 s4 <c' e' g'>4. ~ <c' e' g'>8 cs,,16 df'' r }"
+    result = parser._parse_note_entry(string)
+    assert result is not None
+    parser._reset_parser_variables()
+    target = parser._parser._lilypond_patch_parse(string, lexer=parser._lexer)
+    assert format(result) == format(target)
+    assert _get_storage_formats(result) == _get_storage_formats(target)
+
+
+def test_LilyPondParser__note_entry_02():
+    """
+    Note entry fast path leaves everything else to full parser.
+    """
+
+    parser = abjad.parser.LilyPondParser()
+    strings = [
+        "c'4 d'4",
+        "{ c'4 { d'4 } }",
+        "{ c'4 } { d'4 }",
+        "{ c'4 -. }",
+        "{ c'3 }",
+        "{ c'4 R1 }",
+        "{ <c' e'>4 q }",
+        "{ c'4 \\clef bass d'4 }",
+        "{ c'4 % comment\n }",
+        "{ ~ c'4 }",
+        "{ <c'4 e'> }",
+        "<< c'4 >>",
+    ]
+    for string in strings:
+        assert parser._parse_note_entry(string) is None, repr(string)
+
+
+def test_LilyPondParser__note_entry_03():
+    """
+    Note entry respects parser language.
+    """
+
+    parser = abjad.parser.LilyPondParser(default_language="nederlands")
+    container = parser("{ cis'8 des' <es' ges'>4 }")
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            cs'8
+            df'8
+            <ef' gf'>4
+        }
+        """
+    )
@@ -68,3 +68,23 @@ def test_Meter___init___09():
         abjad.Meter(time_signature).rtm_format
         == "(11/4 ((3/4 (1/4 1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4)) (2/4 (1/4 1/4))))"
     )
+
+
+def test_Meter___init___10():
+    """
+    Meters with cached offset inventories build root nodes on demand.
+    """
+
+    meter_1 = abjad.Meter((7, 8), increase_monotonic=True)
+    inventory = meter_1.depthwise_offset_inventory
+    meter_2 = abjad.Meter((7, 8), increase_monotonic=True)
+    assert meter_2._root_node is None
+    assert meter_2.depthwise_offset_inventory is inventory
+    assert meter_2.rtm_format == meter_1.rtm_format
+    assert meter_2 == meter_1
+    meter_3 = abjad.Meter((7, 8))
+    assert (
+        meter_3.rtm_format
+        == "(7/8 ((3/8 (1/8 1/8 1/8)) (2/8 (1/8 1/8)) (2/8 (1/8 1/8))))"
+    )
+    assert meter_3.depthwise_offset_inventory != inventory
@@ -0,0 +1,31 @@
+import abjad
+
+
+def _make_staff(string):
+    staff = abjad.Staff([abjad.Container(string), abjad.Container(string)])
+    meter = abjad.Meter(abjad.inspect(staff[0]).duration())
+    return staff, meter
+
+
+def test_Meter__rewrite_meter_01():
+    """
+    Rewriting logical ties with cached split plans equals rewriting
+    without cached split plans.
+    """
+
+    strings = [
+        "c'2 ~ c'8 d'4. e'16 f'8. ~ f'4 g'4.",
+        "c'16 d'2 ~ d'8 e'8. f'4 ~ f'4 g'16 a'8 b'16",
+        r"c'4 \times 2/3 { d'4 e'2 ~ } e'4.. f'16",
+    ]
+    for string in strings:
+        abjad.Meter._rewrite_plans.clear()
+        staff_1, meter = _make_staff(string)
+        for container in staff_1:
+            abjad.mutate(container[:]).rewrite_meter(meter)
+        assert abjad.Meter._rewrite_plans
+        staff_2, meter = _make_staff(string)
+        for container in staff_2:
+            abjad.Meter._rewrite_plans.clear()
+            abjad.mutate(container[:]).rewrite_meter(meter)
+        assert format(staff_1) == format(staff_2)
@@ -523,3 +523,96 @@ def test_Mutation_copy_08():
         """
     )
     assert abjad.inspect(staff).wellformed()
+
+
+def test_Mutation_copy_09():
+    """
+    Copies named contexts, effective contexts and offsets of score tree.
+    """
+
+    voice = abjad.Voice("c'8 d'8 e'8 f'8", name="Voice_1")
+    staff = abjad.Staff([voice], name="Staff_1")
+    clef = abjad.Clef("bass")
+    abjad.attach(clef, voice[0])
+    articulation = abjad.Articulation("accent")
+    abjad.attach(articulation, voice[1])
+    assert abjad.inspect(staff).timespan().stop_offset == abjad.Offset(1, 2)
+
+    new_staff = abjad.mutate(staff).copy()
+    new_voice = new_staff["Voice_1"]
+
+    assert format(new_staff) == format(staff)
+    assert new_voice is not voice
+    assert new_staff._offsets_are_current
+    assert abjad.inspect(new_voice[-1]).timespan() == abjad.Timespan((3, 8), (1, 2))
+    wrapper = abjad.inspect(new_voice[0]).wrapper(abjad.Clef)
+    assert wrapper._effective_context is new_staff
+    assert abjad.inspect(new_voice[-1]).effective(abjad.Clef) == clef
+    assert abjad.inspect(new_voice[0]).indicator(abjad.Clef) is clef
+    assert abjad.inspect(new_voice[1]).indicator(abjad.Articulation) == articulation
+    assert abjad.inspect(new_voice[1]).indicator(abjad.Articulation) is not articulation
+    assert abjad.inspect(new_staff).wellformed()
+
+
+def test_Mutation_copy_10():
+    """
+    Offsets of copied container start at zero and update after changes.
+    """
+
+    staff = abjad.Staff(r"c'4 { d'8 e'8 \times 2/3 { f'8 g'8 a'8 } }")
+    assert abjad.inspect(staff[1][-1]).timespan() == abjad.Timespan((1, 2), (3, 4))
+
+    container = abjad.mutate(staff[1]).copy()
+
+    assert container._offsets_are_current
+    assert abjad.inspect(container[-1][0]).timespan() == abjad.Timespan((1, 4), (1, 3))
+
+    container.insert(0, abjad.Note("b4"))
+
+    assert abjad.inspect(container[-1][0]).timespan() == abjad.Timespan((1, 2), (7, 12))
+    assert abjad.inspect(staff[1][-1][0]).timespan() == abjad.Timespan((1, 2), (7, 12))
+
+
+def test_Mutation_copy_11():
+    """
+    Does not copy offsets of container scaled by enclosing tuplet.
+    """
+
+    staff = abjad.Staff(r"\times 2/3 { c'4 { d'4 e'4 } }")
+    assert abjad.inspect(staff[0][1]).timespan() == abjad.Timespan((1, 6), (1, 2))
+
+    container = abjad.mutate(staff[0][1]).copy()
+
+    assert not container._offsets_are_current
+    assert abjad.inspect(container).timespan() == abjad.Timespan(0, (1, 2))
+    assert abjad.inspect(container[1]).timespan() == abjad.Timespan((1, 4), (1, 2))
+
+    tuplet = abjad.mutate(staff[0]).copy()
+
+    assert tuplet._offsets_are_current
+    assert abjad.inspect(tuplet[1][1]).timespan() == abjad.Timespan((1, 3), (1, 2))
+
+
+def test_Mutation_copy_12():
+    """
+    Copies indicators that are not known to be immutable.
+    """
+
+    staff = abjad.Staff("c'4 d'4")
+    command = abjad.MarkupCommand("bold", "foo")
+    abjad.attach(command, staff[0])
+    mark = abjad.MetronomeMark((1, 4), 60, custom_markup=abjad.Markup("fast"))
+    abjad.attach(mark, staff[0])
+    time_signature = abjad.TimeSignature((2, 4))
+    abjad.attach(time_signature, staff[0])
+
+    new_staff = abjad.mutate(staff).copy()
+
+    new_command = abjad.inspect(new_staff[0]).indicator(abjad.MarkupCommand)
+    assert new_command == command
+    assert new_command is not command
+    new_mark = abjad.inspect(new_staff[0]).indicator(abjad.MetronomeMark)
+    assert new_mark == mark
+    assert new_mark is not mark
+    new_time_signature = abjad.inspect(new_staff[0]).indicator(abjad.TimeSignature)
+    assert new_time_signature is time_signature
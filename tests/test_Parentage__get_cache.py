@@ -0,0 +1,72 @@
+import abjad
+
+
+def test_Parentage__get_cache_01():
+    """
+    Moving components invalidates cached parentage.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4", name="Music_Voice")
+    staff = abjad.Staff([voice])
+    note = voice[0]
+    parentage = abjad.inspect(note).parentage()
+    assert parentage.components == (note, voice, staff)
+    assert abjad.inspect(note).parentage().components is parentage.components
+
+    container = abjad.Container()
+    staff.append(container)
+    container.append(note)
+    assert abjad.inspect(note).parentage().components == (note, container, staff)
+
+    del container[0]
+    assert abjad.inspect(note).parentage().components == (note,)
+
+
+def test_Parentage__get_cache_02():
+    """
+    Changing tuplet multiplier invalidates cached prolation.
+    """
+
+    tuplet = abjad.Tuplet((2, 3), "c'8 d'8 e'8")
+    staff = abjad.Staff([tuplet])
+    note = tuplet[0]
+    assert abjad.inspect(note).parentage().prolation == abjad.Multiplier(2, 3)
+
+    tuplet.multiplier = (4, 5)
+    assert abjad.inspect(note).parentage().prolation == abjad.Multiplier(4, 5)
+    assert abjad.inspect(staff).parentage().prolation == abjad.Multiplier(1)
+
+
+def test_Parentage__get_cache_03():
+    """
+    Renaming contexts invalidates cached logical voice.
+    """
+
+    voice = abjad.Voice("c'4 d'4", name="Voice_1")
+    logical_voice = abjad.inspect(voice[0]).parentage().logical_voice()
+    assert logical_voice["voice"] == "Voice-'Voice_1'"
+
+    logical_voice["voice"] = "foo"
+    logical_voice = abjad.inspect(voice[0]).parentage().logical_voice()
+    assert logical_voice["voice"] == "Voice-'Voice_1'"
+
+    voice.name = "Voice_2"
+    logical_voice = abjad.inspect(voice[0]).parentage().logical_voice()
+    assert logical_voice["voice"] == "Voice-'Voice_2'"
+
+
+def test_Parentage__get_cache_04():
+    """
+    Attaching and detaching grace containers invalidates cached parentage.
+    """
+
+    voice = abjad.Voice("c'4 d'4")
+    container = abjad.BeforeGraceContainer("cs'16")
+    grace_note = container[0]
+    assert abjad.inspect(grace_note).parentage().root is container
+
+    abjad.attach(container, voice[1])
+    assert abjad.inspect(grace_note).parentage().root is voice
+
+    abjad.detach(container, voice[1])
+    assert abjad.inspect(grace_note).parentage().root is container
@@ -0,0 +1,63 @@
+import abjad
+import abjad.rhythmtrees
+
+
+def test_Parser__get_pooled_parser_01():
+    """
+    Reuses idle parsers; makes new parser when pooled parser is busy.
+    """
+
+    class_ = abjad.parser.ReducedLyParser
+    with class_._get_pooled_parser() as parser_1:
+        with class_._get_pooled_parser() as parser_2:
+            assert parser_1 is not parser_2
+    with class_._get_pooled_parser() as parser_3:
+        assert parser_3 in (parser_1, parser_2)
+
+
+def test_Parser__get_pooled_parser_02():
+    """
+    Pools parsers by keyword.
+    """
+
+    class_ = abjad.parser.LilyPondParser
+    with class_._get_pooled_parser(default_language="english") as parser_1:
+        assert parser_1.default_language == "english"
+    with class_._get_pooled_parser(default_language="nederlands") as parser_2:
+        assert parser_2.default_language == "nederlands"
+    assert parser_1 is not parser_2
+
+
+def test_Parser__get_pooled_parser_03():
+    """
+    Failed parse leaves no lexer state behind.
+    """
+
+    try:
+        abjad.parse("{ c'4 \\markup { ")
+    except Exception:
+        pass
+    container = abjad.parse("{ c'4 d'4 }")
+    assert format(container) == abjad.String.normalize(
+        r"""
+        {
+            c'4
+            d'4
+        }
+        """
+    )
+
+
+def test_Parser__get_pooled_parser_04():
+    """
+    Parsing tables shipped with Abjad are current.
+    """
+
+    parsers = [
+        abjad.parser.LilyPondParser(),
+        abjad.parser.ReducedLyParser(),
+        abjad.parser.SchemeParser(),
+        abjad.rhythmtrees.RhythmTreeParser(),
+    ]
+    for parser in parsers:
+        assert parser._read_packaged_tables() is not None, repr(parser)
@@ -0,0 +1,97 @@
+import os
+
+import abjad
+
+
+def _make_directory(directory, count=6):
+    directory.mkdir()
+    for i in range(count):
+        lines = [
+            r"    %@% \p %! DYNAMIC:SM{}".format(i),
+            r"    c'4",
+            r"    \f %! DYNAMIC",
+        ]
+        (directory / f"segment-{i}.ly").write_text("\n".join(lines) + "\n")
+    return abjad.Path(directory)
+
+
+def test_Path_activate_01(tmp_path):
+    """
+    Rewriting files in thread or process pool equals rewriting files
+    serially.
+    """
+
+    path_1 = _make_directory(tmp_path / "serial")
+    path_2 = _make_directory(tmp_path / "pooled")
+    tag = abjad.Tag("DYNAMIC")
+    result_1 = path_1.activate(tag, message_zero=True)
+    result_2 = path_2.activate(tag, message_zero=True, workers=3)
+    assert result_1 == result_2 == (6, 6, result_1[2])
+    result_1 = path_1.deactivate(tag, prepend_empty_chord=True)
+    result_2 = path_2.deactivate(
+        tag, prepend_empty_chord=True, processes=True, workers=3
+    )
+    assert result_1 == result_2
+    for path in path_1.glob("*.ly"):
+        assert path.read_text() == (path_2 / path.name).read_text()
+    assert r"%@% <> \p" in (path_2 / "segment-0.ly").read_text()
+
+
+def test_Path_activate_02(tmp_path):
+    """
+    Skips files that are unchanged since operation left them in target
+    state.
+    """
+
+    path = _make_directory(tmp_path / "segments")
+    tag = abjad.Tag("DYNAMIC")
+    assert path.activate(tag)[:2] == (6, 6)
+    assert path.activate(tag)[:2] == (0, 12)
+    file_path = path / "segment-0.ly"
+    key = (str(file_path), ((False, tag, None),))
+    assert key in abjad.Path._tag_operation_states
+    assert path.activate(tag)[:2] == (0, 12)
+    text = file_path.read_text().replace("    \\f %! DYNAMIC", "%@% \\f %! DYNAMIC")
+    file_path.write_text(text)
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert path.activate(tag)[:2] == (1, 11)
+
+
+def test_Path_activate_03(tmp_path, monkeypatch):
+    """
+    Rereads files recorded within timestamp resolution of their last change
+    and never records callable tags.
+    """
+
+    path = _make_directory(tmp_path / "segments")
+    tag = abjad.Tag("DYNAMIC")
+    assert path.activate(tag)[:2] == (6, 6)
+    assert path.activate(tag)[:2] == (0, 12)
+    file_path = path / "segment-0.ly"
+    stat = file_path.stat()
+    text = file_path.read_text().replace("    \\f %! DYNAMIC", "%@% \\f %! DYNAMIC")
+    file_path.write_text(text)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert file_path.stat().st_size == stat.st_size
+    assert path.activate(tag)[:2] == (1, 11)
+
+    paths = []
+    activate_file = abjad.Path._activate_file
+
+    def _activate_file(path, operations, state=None):
+        paths.append(path)
+        return activate_file(path, operations, state)
+
+    monkeypatch.setattr(abjad.Path, "_activate_file", staticmethod(_activate_file))
+    for file_path in path.glob("*.ly"):
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 10))
+    assert path.activate(tag)[:2] == (0, 12)
+    assert len(paths) == 6
+    assert path.activate(tag)[:2] == (0, 12)
+    assert len(paths) == 6
+
+    abjad.Path._tag_operation_states.clear()
+    assert path.activate(lambda tags: tag in tags)[:2] == (0, 12)
+    assert not abjad.Path._tag_operation_states
@@ -0,0 +1,26 @@
+import abjad
+
+
+def test_RenderCache_get_key_01(tmp_path, monkeypatch):
+    """
+    Gets LilyPond version once per process.
+    """
+
+    versions = []
+
+    def get_lilypond_version_string():
+        versions.append("2.19.84")
+        return versions[-1]
+
+    monkeypatch.setattr(abjad.RenderCache, "_lilypond_version_string", None)
+    monkeypatch.setattr(
+        abjad.AbjadConfiguration,
+        "get_lilypond_version_string",
+        staticmethod(get_lilypond_version_string),
+    )
+    cache = abjad.RenderCache(directory=str(tmp_path))
+    key_1 = cache.get_key(r"\score { { c'4 } }")
+    key_2 = cache.get_key(r"\score { { c'4 } }", flags="--png")
+    assert key_1 != key_2
+    assert key_1 == cache.get_key(r"\score { { c'4 } }")
+    assert versions == ["2.19.84"]
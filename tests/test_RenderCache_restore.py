@@ -0,0 +1,120 @@
+import os
+
+import abjad
+
+
+def _write(path, string):
+    with open(path, "w") as file_pointer:
+        file_pointer.write(string)
+
+
+def test_RenderCache_restore_01():
+    """
+    Restores output files stored under key.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.RenderCache(directory=os.path.join(directory, "cache"))
+        prefix = os.path.join(directory, "score")
+        _write(prefix + ".ly", "{ c'4 }")
+        key = cache.get_key("{ c'4 }", directory=directory)
+        assert cache.restore(key, prefix) == []
+        _write(prefix + ".pdf", "PDF")
+        _write(prefix + ".midi", "MIDI")
+        _write(prefix + "-page1.png", "PNG")
+        _write(prefix + ".log", "LOG")
+        _write(prefix + "-parts.ly", "{ d'4 }")
+        cache.store(key, prefix)
+
+        target_prefix = os.path.join(directory, "copy")
+        paths = cache.restore(key, target_prefix)
+        assert paths == [
+            target_prefix + "-page1.png",
+            target_prefix + ".midi",
+            target_prefix + ".pdf",
+        ]
+        with open(target_prefix + ".pdf") as file_pointer:
+            assert file_pointer.read() == "PDF"
+
+
+def test_RenderCache_restore_02():
+    """
+    Keys change with flags and with included files but not with date-time
+    tokens.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.RenderCache(directory=os.path.join(directory, "cache"))
+        string = r"""\include "stylesheet.ily" { c'4 }"""
+        _write(os.path.join(directory, "stylesheet.ily"), "% one")
+        key_1 = cache.get_key(string, directory=directory)
+        assert key_1 == cache.get_key(string, directory=directory)
+        string_ = "% 2020-01-01 12:00\n" + string
+        assert key_1 != cache.get_key(string_, directory=directory)
+        string__ = "% 2020-01-02 13:30\n" + string
+        key_2 = cache.get_key(string_, directory=directory)
+        assert key_2 == cache.get_key(string__, directory=directory)
+        assert key_1 != cache.get_key(string, flags="--png", directory=directory)
+        _write(os.path.join(directory, "stylesheet.ily"), "% two")
+        assert key_1 != cache.get_key(string, directory=directory)
+
+
+def test_RenderCache_restore_03():
+    """
+    Evicts least recently used entries.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.RenderCache(
+            directory=os.path.join(directory, "cache"), maximum_size=25
+        )
+        prefix = os.path.join(directory, "score")
+        for i in range(2):
+            _write(prefix + ".pdf", 10 * str(i))
+            cache.store(f"key-{i}", prefix)
+            os.utime(os.path.join(cache.directory, f"key-{i}"), (0, 0))
+        assert cache.restore("key-0", prefix)
+        _write(prefix + ".pdf", 10 * "2")
+        cache.store("key-2", prefix)
+        assert cache.restore("key-0", prefix)
+        assert not cache.restore("key-1", prefix)
+        assert cache.restore("key-2", prefix)
+
+
+def test_RenderCache_restore_04():
+    """
+    Gets no key when included file can not be found.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.RenderCache(directory=os.path.join(directory, "cache"))
+        string = r"""\include "stylesheet.ily" { c'4 }"""
+        assert cache.get_key(string, directory=directory) is None
+        include_directory = os.path.join(directory, "stylesheets")
+        os.mkdir(include_directory)
+        _write(os.path.join(include_directory, "stylesheet.ily"), r'\include "x.ily"')
+        flags = f"--include={include_directory}"
+        assert cache.get_key(string, flags=flags, directory=directory) is None
+        _write(os.path.join(include_directory, "x.ily"), "% x")
+        assert cache.get_key(string, flags=flags, directory=directory) is not None
+
+
+def test_RenderCache_restore_05():
+    """
+    Stores log together with output files and restores it.
+    """
+
+    with abjad.TemporaryDirectory() as directory:
+        cache = abjad.RenderCache(directory=os.path.join(directory, "cache"))
+        prefix = os.path.join(directory, "score")
+        _write(prefix + ".pdf", "PDF")
+        cache.store("key-0", prefix)
+        cache.store("key-1", prefix, log="LOG 1")
+        cache.store("key-0", prefix, log="LOG 0")
+
+        for key, log in (("key-0", "LOG 0"), ("key-1", "LOG 1")):
+            target_prefix = os.path.join(directory, key)
+            paths = cache.restore(key, target_prefix)
+            assert paths == [target_prefix + ".log", target_prefix + ".pdf"]
+            with open(target_prefix + ".log") as file_pointer:
+                assert file_pointer.read() == log
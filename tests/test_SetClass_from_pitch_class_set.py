@@ -0,0 +1,64 @@
+import abjad
+
+
+def test_SetClass_from_pitch_class_set_01():
+    """
+    Table lookup agrees with prime forms of pitch-class set objects.
+    """
+
+    pitch_class_sets = [
+        [],
+        [2, 8, 9],
+        [0, 4, 7],
+        [0, 4, 6, 7],
+        [1, 2, 7, 8],
+        [0, 1, 2, 5, 8, 9],
+        [0, 1, 2, 3, 6, 7],
+        [11, 10, 5, 4, 1, 0],
+    ]
+    for numbers in pitch_class_sets:
+        pitch_class_set = abjad.PitchClassSet(numbers)
+        normal_order = pitch_class_set.get_normal_order()
+        prime_form = pitch_class_set.get_prime_form()
+        if not numbers:
+            continue
+        inversion = pitch_class_set.invert().get_normal_order()
+        transposition = [_.number for _ in normal_order._transpose_to_zero()]
+        inversion = [_.number for _ in inversion._transpose_to_zero()]
+        assert prime_form == abjad.PitchClassSet(min(transposition, inversion))
+        transposition_only = pitch_class_set.get_prime_form(transposition_only=True)
+        assert transposition_only == abjad.PitchClassSet(transposition)
+        set_class = abjad.SetClass.from_pitch_class_set(
+            pitch_class_set, transposition_only=True
+        )
+        assert set_class.prime_form == transposition_only
+
+
+def test_SetClass_from_pitch_class_set_02():
+    """
+    Returns equal set-classes for transpositions and inversions.
+    """
+
+    pitch_class_set = abjad.PitchClassSet([0, 1, 3, 7])
+    set_class = abjad.SetClass.from_pitch_class_set(pitch_class_set)
+    for n in range(12):
+        for pitch_class_set_ in (
+            pitch_class_set.transpose(n),
+            pitch_class_set.invert().transpose(n),
+        ):
+            set_class_ = abjad.SetClass.from_pitch_class_set(pitch_class_set_)
+            assert set_class_ == set_class
+    assert set_class.interval_class_vector == abjad.IntervalClassVector(
+        pitch_class_set, item_class=abjad.NumberedInversionEquivalentIntervalClass
+    )
+
+
+def test_SetClass_from_pitch_class_set_03():
+    """
+    Falls back to pitch-class set objects for quarter-tone pitch-classes.
+    """
+
+    pitch_class_set = abjad.PitchClassSet([0, 0.5])
+    assert pitch_class_set._get_numbers() is None
+    assert pitch_class_set.get_normal_order() == abjad.PitchClassSegment([0, 0.5])
+    assert pitch_class_set.get_prime_form() == abjad.PitchClassSet([0, 0.5])
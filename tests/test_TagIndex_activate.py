@@ -0,0 +1,45 @@
+import abjad
+
+
+def test_TagIndex_activate_01():
+    """
+    Counts runs of consecutive tagged lines and restarts counts after
+    untagged lines.
+    """
+
+    text = "\n".join(
+        [
+            r"    %@% \p %! DYNAMIC",
+            r"    %@% \f %! DYNAMIC",
+            r"    c'4",
+            r"        \p %! DYNAMIC",
+            r"    %%% \f %! DYNAMIC:+SCORE",
+            r"",
+        ]
+    )
+    index = abjad.TagIndex(text)
+    assert index.get_line_ranges(abjad.Tag("DYNAMIC")) == [(0, 2), (3, 5)]
+    assert index.get_line_ranges(abjad.Tag("+SCORE")) == [(4, 5)]
+    assert index.activate(abjad.Tag("DYNAMIC")) == (2, 1)
+    assert index.text == abjad.activate(text, abjad.Tag("DYNAMIC"))[0]
+    assert index.deactivate(abjad.Tag("+SCORE")) == (1, 0)
+    assert index.match(abjad.Tag("DYNAMIC")) == [0, 1, 3, 4]
+
+
+def test_TagIndex_activate_02():
+    """
+    Calls predicate once for each distinct sequence of tags.
+    """
+
+    lines = 50 * [r"    %@% \p %! DYNAMIC", r"    %@% \f %! DYNAMIC:SM1"]
+    text = "\n".join(lines) + "\n"
+    calls = []
+
+    def predicate(tags):
+        calls.append(tags)
+        return abjad.Tag("SM1") in tags
+
+    index = abjad.TagIndex(text)
+    assert index.activate(predicate) == (50, 0)
+    assert len(calls) == 2
+    assert index.text == abjad.activate(text, abjad.Tag("SM1"))[0]
@@ -0,0 +1,119 @@
+import random
+
+import abjad
+
+
+def _make_timespans(random_):
+    denominators = (1, 2, 3, 4, 8)
+    timespans = []
+    for _ in range(random_.randint(1, 12)):
+        start_offset = abjad.Offset(
+            random_.randint(0, 40), random_.choice(denominators)
+        )
+        duration = abjad.Duration(random_.randint(1, 20), random_.choice(denominators))
+        if random_.randint(0, 1):
+            timespan = abjad.AnnotatedTimespan(
+                start_offset, start_offset + duration, annotation=[_]
+            )
+        else:
+            timespan = abjad.Timespan(start_offset, start_offset + duration)
+        timespans.append(timespan)
+    return abjad.TimespanList(timespans)
+
+
+def test_TimespanArray_to_timespan_list_01():
+    """
+    Bulk operations equal timespan list operations.
+    """
+
+    random_ = random.Random(1)
+    for _ in range(40):
+        timespans = _make_timespans(random_)
+        multiplier = abjad.Multiplier(random_.randint(1, 6), random_.randint(1, 6))
+        anchor = random_.choice([abjad.Left, abjad.Right])
+        offset = abjad.Offset(random_.randint(0, 40), random_.choice([1, 2, 3]))
+        for name, arguments in (
+            ("translate", (offset,)),
+            ("scale", (multiplier, anchor)),
+            ("stretch", (multiplier,)),
+            ("stretch", (multiplier, offset)),
+            ("round_offsets", (multiplier, anchor)),
+            ("round_offsets", (multiplier, anchor, False)),
+        ):
+            timespans_1 = abjad.TimespanList(timespans)
+            timespans_2 = abjad.TimespanArray(timespans)
+            getattr(timespans_1, name)(*arguments)
+            getattr(timespans_2, name)(*arguments)
+            assert timespans_2.to_timespan_list() == timespans_1
+        timespans_1 = abjad.TimespanList(timespans)
+        timespans_2 = abjad.TimespanArray(timespans)
+        axis = timespans_1.stop_offset
+        assert timespans_2.reflect(axis).to_timespan_list() == timespans_1.reflect(axis)
+        offsets = [random_.randint(0, 60) for _ in range(random_.randint(0, 4))]
+        timespan_lists = timespans.split_at_offsets(offsets)
+        timespan_arrays = abjad.TimespanArray(timespans).split_at_offsets(offsets)
+        assert [_.to_timespan_list() for _ in timespan_arrays] == timespan_lists
+
+
+def test_TimespanArray_to_timespan_list_02():
+    """
+    Stores separate denominators when common denominator is too large.
+    """
+
+    timespans = abjad.TimespanList(
+        [
+            abjad.Timespan((1, 7919), (2, 7927)),
+            abjad.Timespan((3, 7933), (4, 7937)),
+            abjad.AnnotatedTimespan((5, 7949), (6, 7951), annotation="flute"),
+        ]
+    )
+    timespan_array = abjad.TimespanArray(timespans)
+    assert timespan_array.denominator is None
+    assert timespan_array.to_timespan_list() == timespans
+    timespans.translate((1, 3))
+    timespan_array.translate((1, 3))
+    assert timespan_array.to_timespan_list() == timespans
+    timespans.round_offsets((1, 4))
+    timespan_array.round_offsets((1, 4))
+    assert timespan_array.denominator is not None
+    assert timespan_array.to_timespan_list() == timespans
+
+
+def test_TimespanArray_to_timespan_list_03():
+    """
+    Keeps annotations and timespan classes.
+    """
+
+    annotation = ["violin"]
+    timespans = abjad.TimespanList(
+        [
+            abjad.Timespan(0, 3),
+            abjad.AnnotatedTimespan(3, 6, annotation=annotation),
+            abjad.AnnotatedTimespan(6, 10),
+        ]
+    )
+    timespan_array = abjad.TimespanArray(timespans)
+    timespan_list = timespan_array.to_timespan_list()
+    assert timespan_list == timespans
+    assert [type(_) for _ in timespan_list] == [type(_) for _ in timespans]
+    assert timespan_list[1].annotation is annotation
+    timespan_array.reflect()
+    assert [type(_) for _ in timespan_array] == [
+        abjad.AnnotatedTimespan,
+        abjad.AnnotatedTimespan,
+        abjad.Timespan,
+    ]
+
+
+def test_TimespanArray_to_timespan_list_04():
+    """
+    Reflection keeps offsets less than zero; timespan list reflection does not.
+    """
+
+    timespans = abjad.TimespanList([abjad.Timespan(0, 3), abjad.Timespan(3, 6)])
+    timespan_array = abjad.TimespanArray(timespans).reflect(axis=1)
+    assert timespan_array.to_timespan_list() == abjad.TimespanList(
+        [abjad.Timespan(-4, -1), abjad.Timespan(-1, 2)]
+    )
+    timespans.reflect(axis=1)
+    assert timespan_array.to_timespan_list() != timespans
@@ -0,0 +1,44 @@
+import random
+
+import abjad
+
+
+def test_TimespanList_compute_logical_xor_01():
+    """
+    Keeps material covered by exactly one timespan.
+    """
+
+    random_ = random.Random(1)
+    for _ in range(20):
+        pairs = []
+        for _ in range(random_.randint(1, 12)):
+            start_offset = random_.randint(0, 20)
+            pairs.append((start_offset, start_offset + random_.randint(1, 8)))
+        timespans = [abjad.Timespan(*_) for _ in pairs]
+        fragments = []
+        for i, pair in enumerate(pairs):
+            for offset in range(*pair):
+                if 1 < sum(_[0] <= offset < _[1] for _ in pairs):
+                    continue
+                if fragments and fragments[-1][1:] == [i, offset]:
+                    fragments[-1][2] = offset + 1
+                else:
+                    fragments.append([offset, i, offset + 1])
+        fragments.sort()
+        result = abjad.TimespanList(timespans).compute_logical_xor()
+        assert [_.offsets for _ in result] == [(_[0], _[2]) for _ in fragments]
+        for timespan, fragment in zip(result, fragments):
+            if timespan.offsets == timespans[fragment[1]].offsets:
+                assert timespan is timespans[fragment[1]]
+
+
+def test_TimespanList_compute_logical_xor_02():
+    """
+    Subtracts timespans pairwise when some timespan is not well-formed.
+    """
+
+    timespans = abjad.TimespanList(
+        [abjad.Timespan(0, 10), abjad.Timespan(5, 5), abjad.Timespan(8, 12)]
+    )
+    timespans.compute_logical_xor()
+    assert [_.offsets for _ in timespans] == [(0, 5), (5, 8), (10, 12)]
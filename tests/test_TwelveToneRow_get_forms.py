@@ -0,0 +1,51 @@
+import pytest
+
+import abjad
+
+
+def test_TwelveToneRow_get_forms_01():
+    """
+    Gets forms named by first pitch-class.
+    """
+
+    row = abjad.TwelveToneRow([1, 11, 9, 3, 6, 7, 5, 4, 10, 2, 8, 0])
+    forms = row.get_forms()
+    assert len(forms) == 48
+    assert list(forms)[:2] == ["P0", "P1"]
+    assert list(forms)[-1] == "RI11"
+    for n in range(12):
+        assert forms[f"P{n}"][0].number == n
+        assert forms[f"I{n}"][0].number == n
+        assert forms[f"R{n}"] == forms[f"P{n}"].retrograde()
+        assert forms[f"RI{n}"] == forms[f"I{n}"].retrograde()
+        assert forms[f"I{n}"] == forms[f"P{n}"].invert()
+    assert forms["P1"] == row
+    assert all(isinstance(_, abjad.TwelveToneRow) for _ in forms.values())
+
+
+def test_TwelveToneRow_get_forms_02():
+    """
+    Array-backed operations equal operations on pitch-class objects.
+    """
+
+    row = abjad.TwelveToneRow([1, 11, 9, 3, 6, 7, 5, 4, 10, 2, 8, 0])
+    assert row._get_numbers() == bytes(row.items[_].number for _ in range(12))
+    for n in range(-13, 14):
+        items = [_.transpose(n=n) for _ in row]
+        assert row.transpose(n) == abjad.TwelveToneRow(items)
+        items = [_.invert(axis=n) for _ in row]
+        assert row.invert(axis=n) == abjad.TwelveToneRow(items)
+        rotation = abjad.sequence(row.items).rotate(n=n)
+        assert row.rotate(n) == abjad.TwelveToneRow(rotation)
+    items = [_.multiply(5) for _ in row]
+    assert row.multiply(5) == abjad.TwelveToneRow(items)
+
+
+def test_TwelveToneRow_get_forms_03():
+    """
+    Multiplying by non-unit raises value error.
+    """
+
+    row = abjad.TwelveToneRow()
+    with pytest.raises(ValueError):
+        row.multiply(2)
@@ -0,0 +1,48 @@
+import abjad
+
+
+def _get_offsets(root):
+    components = abjad.UpdateManager._iterate_entire_score(root)
+    return [(_, _._start_offset, _._stop_offset) for _ in components]
+
+
+def test_UpdateManager__update_offsets_in_ticks_01():
+    """
+    Tick offsets equal full recompute in nested tuplets, simultaneous
+    containers and leaves with multipliers.
+    """
+
+    score = abjad.Score()
+    for i in range(3):
+        voice = abjad.Voice(
+            r"c'8 \times 2/3 { d'8 \times 4/5 { e'16 f' g' a' b' } } c''4 * 3/7"
+        )
+        score.append(abjad.Staff([voice]))
+    score.append(abjad.Staff(r"\times 3/5 { c'4 d' } <<{ e'8 } { f'4 }>> g'1"))
+    assert abjad.UpdateManager._update_offsets_in_ticks(score, abjad.Offset(0))
+    tick_offsets = _get_offsets(score)
+    abjad.UpdateManager()._update_all_offsets(score)
+    full_offsets = _get_offsets(score)
+    assert tick_offsets == full_offsets
+    for component, start_offset, stop_offset in tick_offsets:
+        assert component._offsets_are_current
+        assert start_offset.displacement is None
+
+
+def test_UpdateManager__update_offsets_in_ticks_02():
+    """
+    Leaves offsets unchanged when subtree is partly current or has grace
+    music.
+    """
+
+    staff = abjad.Staff("c'4 d'4 e'4")
+    abjad.inspect(staff).timespan()
+    staff.append("f'4")
+    assert not abjad.UpdateManager._update_offsets_in_ticks(staff, abjad.Offset(0))
+    assert staff[-1]._start_offset is None
+
+    staff = abjad.Staff("c'4 d'4 e'4")
+    abjad.attach(abjad.AfterGraceContainer("f'16"), staff[1])
+    assert not abjad.UpdateManager._update_offsets_in_ticks(staff, abjad.Offset(0))
+    assert staff[0]._start_offset is None
+    assert abjad.inspect(staff[-1]).timespan() == abjad.Timespan((1, 2), (3, 4))
@@ -0,0 +1,178 @@
+import abjad
+
+
+def _get_offsets(root):
+    components = abjad.UpdateManager._iterate_entire_score(root)
+    return [(_, _._start_offset, _._stop_offset) for _ in components]
+
+
+def _assert_offsets_equal_full_recompute(root):
+    root._update_now(offsets=True)
+    incremental_offsets = _get_offsets(root)
+    abjad.UpdateManager()._update_all_offsets(root)
+    full_offsets = _get_offsets(root)
+    assert incremental_offsets == full_offsets
+    for component, start_offset, stop_offset in full_offsets:
+        assert component._offsets_are_current
+
+
+def _make_score():
+    score = abjad.Score()
+    for i in range(3):
+        voice = abjad.Voice(r"c'8 d'8 \times 2/3 { e'8 f'8 g'8 } a'4 b'4")
+        staff = abjad.Staff([voice])
+        score.append(staff)
+    return score
+
+
+def test_UpdateManager__update_offsets_incrementally_01():
+    """
+    Append, insert, set item, delete and pop interleaved with timespans.
+    """
+
+    score = _make_score()
+    abjad.inspect(score).timespan()
+    voice = score[1][0]
+
+    voice.append("c''4")
+    abjad.inspect(voice[-1]).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+    voice.insert(0, abjad.Note("d''16"))
+    abjad.inspect(voice[0]).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+    voice[2] = abjad.Tuplet((4, 5), "c'16 c' c' c' c'")
+    abjad.inspect(voice[2][-1]).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+    del voice[1]
+    abjad.inspect(score[0][0][-1]).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+    voice.pop(-2)
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+
+def test_UpdateManager__update_offsets_incrementally_02():
+    """
+    Leaf duration and tuplet multiplier changes.
+    """
+
+    score = _make_score()
+    abjad.inspect(score).timespan()
+    voice = score[2][0]
+
+    voice[0].written_duration = abjad.Duration(1, 2)
+    assert abjad.inspect(voice[1]).timespan().start_offset == abjad.Offset(1, 2)
+    _assert_offsets_equal_full_recompute(score)
+
+    voice[1].multiplier = (3, 2)
+    abjad.inspect(voice[-1]).timespan()
+    _assert_offsets_equal_full_recompute(score)
+
+    voice[2].multiplier = (4, 5)
+    assert abjad.inspect(voice[2][1]).timespan().start_offset == abjad.Offset(63, 80)
+    _assert_offsets_equal_full_recompute(score)
+
+
+def test_UpdateManager__update_offsets_incrementally_03():
+    """
+    Moving components between containers with different prolation.
+    """
+
+    voice = abjad.Voice(r"c'4 \times 2/3 { d'4 e'4 f'4 } { g'4 a'4 }")
+    abjad.inspect(voice).timespan()
+    container = voice[2]
+    voice[1].insert(0, container)
+    abjad.inspect(voice[1][0][0]).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    tuplet = voice[1]
+    abjad.mutate(tuplet[:2]).wrap(abjad.Container())
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    del voice[1]
+    assert abjad.inspect(tuplet).timespan() == abjad.Timespan(0, (5, 6))
+    _assert_offsets_equal_full_recompute(tuplet)
+    _assert_offsets_equal_full_recompute(voice)
+
+
+def test_UpdateManager__update_offsets_incrementally_04():
+    """
+    Simultaneous containers and grace music.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4", name="Music_Voice")
+    abjad.inspect(voice).timespan()
+
+    container = abjad.BeforeGraceContainer("cs'16 ds'16")
+    abjad.attach(container, voice[2])
+    abjad.inspect(voice[2]).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    container = abjad.AfterGraceContainer("fs'16")
+    abjad.attach(container, voice[1])
+    abjad.inspect(voice[1]).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    voice[2]._before_grace_container.append("e'16")
+    abjad.inspect(voice[1]).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    voice.insert(0, abjad.Note("b4"))
+    abjad.on_beat_grace_container("g'16 a'", voice[3:4])
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    voice[0].written_duration = (1, 8)
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    container = abjad.Container([abjad.Voice("c'4 d'4"), abjad.Voice("e'2.")])
+    container.simultaneous = True
+    abjad.inspect(container).timespan()
+    voice.append(container)
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    container.simultaneous = False
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+
+def test_UpdateManager__update_offsets_incrementally_05():
+    """
+    After grace music of preceding leaf when next before grace music goes.
+    """
+
+    voice = abjad.Voice("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.AfterGraceContainer("cs'16"), voice[0])
+    abjad.attach(abjad.BeforeGraceContainer("ds'16 e'16"), voice[1])
+    abjad.inspect(voice).timespan()
+    del voice[1]
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    abjad.attach(abjad.BeforeGraceContainer("ds'16 e'16"), voice[1])
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    voice[1] = abjad.Note("d'4")
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    abjad.attach(abjad.BeforeGraceContainer("ds'16"), voice[1])
+    abjad.inspect(voice).timespan()
+    abjad.detach(abjad.BeforeGraceContainer, voice[1])
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
+
+    voice.insert(1, abjad.Container("d'4"))
+    abjad.attach(abjad.BeforeGraceContainer("ds'16"), voice[1][0])
+    abjad.inspect(voice).timespan()
+    voice[1:2] = "d'4"
+    abjad.inspect(voice).timespan()
+    _assert_offsets_equal_full_recompute(voice)
@@ -0,0 +1,70 @@
+import abjad
+
+
+def _make_score():
+    score = abjad.Score()
+    for name in ("Voice_1", "Voice_2"):
+        voice = abjad.Voice("c'8 [ d'8 ] e'4 f'4 g'4", name=name)
+        abjad.attach(abjad.Violin(), voice[0])
+        abjad.attach(abjad.StartHairpin("<"), voice[0])
+        abjad.attach(abjad.Dynamic("f"), voice[2])
+        score.append(abjad.Staff([voice]))
+    return score
+
+
+def _check(score):
+    triples = abjad.Wellformedness()(score)
+    return [([id(_) for _ in violators], total) for violators, total, _ in triples]
+
+
+def _check_incrementally(score):
+    with abjad.WellformednessCache():
+        return _check(score)
+
+
+def test_WellformednessCache___enter___01():
+    """
+    Reuses results of unchanged score and rechecks edited notes.
+    """
+
+    score = _make_score()
+    with abjad.WellformednessCache():
+        triples = abjad.Wellformedness()(score)
+        assert score._wellformedness_is_current
+        assert abjad.Wellformedness()(score) == triples
+        note = score["Voice_2"][3]
+        note.written_pitch = "c"
+        assert not score._wellformedness_is_current
+        violators, total, check_name = abjad.Wellformedness()(score)[5]
+        assert check_name == "check_out_of_range_pitches"
+        assert violators == [note]
+        assert total == 10
+        note.written_pitch = "c'"
+        assert abjad.inspect(score).wellformed()
+
+
+def test_WellformednessCache___enter___02():
+    """
+    Matches full check after structural edits, renames and detaches.
+    """
+
+    score = _make_score()
+    voice_1, voice_2 = score["Voice_1"], score["Voice_2"]
+    assert _check_incrementally(score) == _check(score)
+
+    voice_1.append(abjad.Container())
+    assert _check_incrementally(score) == _check(score)
+
+    voice_2.name = "Voice_1"
+    assert _check_incrementally(score) == _check(score)
+
+    abjad.detach(abjad.Dynamic, voice_1[2])
+    assert _check_incrementally(score) == _check(score)
+
+    voice_1[-1].extend("a'4 b'4")
+    voice_2[0].written_duration = (1, 2)
+    assert _check_incrementally(score) == _check(score)
+
+    voice_1.name = None
+    voice_2.append(voice_1.pop())
+    assert _check_incrementally(score) == _check(score)
@@ -0,0 +1,67 @@
+import abjad
+
+
+def _make_staff():
+    voice = abjad.Voice("c'4 [ d'4 ] e'4 <c'''' d''''>4 c''''4 f'4", name="Voice")
+    abjad.attach(abjad.Cello(), voice[0])
+    abjad.attach(abjad.Clef("alto"), voice[0])
+    abjad.attach(abjad.StartHairpin("<"), voice[1])
+    abjad.attach(abjad.StartTextSpan(), voice[2])
+    abjad.attach(abjad.const.ALLOW_OUT_OF_RANGE, voice[4])
+    abjad.attach(abjad.StopTextSpan(), voice[-2])
+    abjad.attach(abjad.StopTextSpan(), voice[-1])
+    return abjad.Staff([voice, abjad.Container()], simultaneous=True)
+
+
+def test_Wellformedness___call___01():
+    """
+    Visiting score once gives same triples as calling checks one by one.
+    """
+
+    staff = _make_staff()
+    manager = abjad.Wellformedness()
+    triples = manager(staff)
+    check_names = [_[2] for _ in triples]
+    assert check_names == sorted(_ for _ in dir(manager) if _.startswith("check_"))
+    for violators, total, check_name in triples:
+        violators_, total_ = getattr(manager, check_name)(staff)
+        assert violators == violators_
+        assert total == total_
+    triples = [(len(_[0]), _[1], _[2]) for _ in triples]
+    assert triples == [
+        (2, 6, "check_beamed_long_notes"),
+        (0, 9, "check_duplicate_ids"),
+        (1, 3, "check_empty_containers"),
+        (0, 9, "check_missing_parents"),
+        (6, 6, "check_notes_on_wrong_clef"),
+        (1, 6, "check_out_of_range_pitches"),
+        (0, 1, "check_overlapping_text_spanners"),
+        (1, 1, "check_unmatched_stop_text_spans"),
+        (1, 1, "check_unterminated_hairpins"),
+        (0, 1, "check_unterminated_text_spanners"),
+    ]
+
+
+def test_Wellformedness___call___02():
+    """
+    Calls only selected checks, in check name order.
+    """
+
+    staff = _make_staff()
+    manager = abjad.Wellformedness()
+    check_names = ["check_unterminated_hairpins", "check_empty_containers"]
+    triples = manager(staff, check_names=check_names)
+    assert [_[2] for _ in triples] == sorted(check_names)
+    assert triples == [_ for _ in manager(staff) if _[2] in check_names]
+    assert not abjad.inspect(staff).wellformed(
+        check_empty_containers=False, check_unterminated_hairpins=False
+    )
+    assert abjad.inspect(staff[0][:1]).wellformed(
+        check_beamed_long_notes=False, check_notes_on_wrong_clef=False
+    )
+    try:
+        manager(staff, check_names=["check_foo"])
+    except Exception as e:
+        assert "check_foo" in str(e)
+    else:
+        assert False